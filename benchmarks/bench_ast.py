@@ -0,0 +1,98 @@
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', 'jackcompiler'
+))
+
+from compengine import compile_file
+from corpus import generate_jack
+from syntaxtree import Node
+from tokenizer import Token, TokenList
+
+# Number of classes in the generated corpus.
+SIZE = 50
+
+
+# The previous parse tree representation, with children stored as a list of
+# (tag, value) tuples and an instance dict per node.
+class LegacyParseTree:
+    def __init__(self):
+        self.children = []
+
+    def add_token(self, token):
+        self.children.append((token.type, token.value))
+
+    def add_subtree(self, tag, tree):
+        self.children.append((tag, tree))
+
+
+# The previous token representation, with a string type and an instance dict.
+class LegacyToken:
+    def __init__(self, type, value):
+        self.type = type
+        self.value = value
+
+
+def copy_token(token):
+    copy = Token.__new__(Token)
+    copy.kind = token.kind
+    copy.value = token.value
+    return copy
+
+
+def to_legacy(node):
+    tree = LegacyParseTree()
+    for child in node.children:
+        if type(child) is Node:
+            tree.add_subtree(child.kind.value, to_legacy(child))
+        else:
+            tree.add_token(child)
+    return tree
+
+
+def count_nodes(node):
+    return 1 + sum(
+        count_nodes(child) if type(child) is Node else 1
+        for child in node.children
+    )
+
+
+# Returns the result of build() and the memory it still holds afterwards.
+def retained(build):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, after - before
+
+
+def main():
+    corpus = generate_jack(SIZE)
+    tokens = TokenList(corpus)
+
+    tree, tree_bytes = retained(lambda: compile_file(tokens))
+    legacy_tree, legacy_tree_bytes = retained(lambda: to_legacy(tree))
+    nodes = count_nodes(tree)
+    print(f'{nodes} tree nodes and tokens')
+    print(f'ParseTree  {legacy_tree_bytes / 1e6:7.2f} MB '
+          f'({legacy_tree_bytes / nodes:.1f} bytes/node)')
+    print(f'Node       {tree_bytes / 1e6:7.2f} MB '
+          f'({tree_bytes / nodes:.1f} bytes/node)')
+
+    count = len(tokens.tokens)
+    legacy_tokens, legacy_token_bytes = retained(lambda: [
+        LegacyToken(token.type, token.value) for token in tokens.tokens
+    ])
+    new_tokens, token_bytes = retained(lambda: [
+        copy_token(token) for token in tokens.tokens
+    ])
+    print(f'{count} tokens')
+    print(f'LegacyToken {legacy_token_bytes / count:6.1f} bytes/token')
+    print(f'Token       {token_bytes / count:6.1f} bytes/token')
+
+
+if __name__ == '__main__':
+    main()
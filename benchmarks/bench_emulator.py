@@ -0,0 +1,70 @@
+import os
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+for directory in ('hackassembler', 'hackemulator', 'vmtranslator'):
+    sys.path.insert(0, os.path.join(ROOT, directory))
+
+import generateasm
+import vmtranslator
+from cpu import HackCPU
+from hackassembler import Assembler
+from jit import JitCPU
+
+# Sums 1..n in a loop, with the result left in static 0 (RAM[16]).
+PROGRAM = '''\
+function Sys.init 0
+push constant {n}
+call Main.triangle 1
+pop static 0
+label HALT
+goto HALT
+function Main.triangle 1
+label LOOP
+push argument 0
+if-goto BODY
+push local 0
+return
+label BODY
+push local 0
+push argument 0
+add
+pop local 0
+push argument 0
+push constant 1
+sub
+pop argument 0
+goto LOOP
+'''
+
+N = 20000
+
+
+def build_rom(n):
+    asm = generateasm.bootstrap() + vmtranslator.translate(
+        PROGRAM.format(n=n), 'Main'
+    )
+    return Assembler().assemble(asm.split('\n'))
+
+
+def bench(cpu_class, rom):
+    cpu = cpu_class(rom)
+    start = time.perf_counter()
+    reason = cpu.run()
+    elapsed = time.perf_counter() - start
+    speed = cpu.cycles / elapsed / 1e6
+    print(f'{cpu_class.__name__:<8} {reason}, RAM[16]={cpu.ram[16]}, '
+          f'{cpu.cycles} cycles in {elapsed:.3f}s ({speed:.2f}M/s)')
+    return elapsed
+
+
+def main():
+    rom = build_rom(N)
+    interpreted = bench(HackCPU, rom)
+    compiled = bench(JitCPU, rom)
+    print(f'speedup {interpreted / compiled:.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', 'hackassembler'
+))
+
+import hackassembler
+from hackassembler import (
+    COMP_INSTRUCTIONS, DEST_INSTRUCTIONS, JUMP_INSTRUCTIONS,
+    encode_c_statement, translate_c_statement,
+)
+from corpus import generate_asm
+
+# Number of classes in the generated corpus, about 37000 instructions each.
+SIZE = 6
+
+
+# The string concatenation encoders the lookup tables replaced, kept here as
+# the baseline to compare against.
+def legacy_translate_a_statement(line):
+    address = bin(int(line[1: ]))[2: ]
+    return '0' * (16 - len(address)) + address
+
+def legacy_translate_c_statement(line):
+    dest, jump = None, None
+    if '=' in line:
+        dest, line = line.split('=')
+    if ';' in line:
+        comp, jump = line.split(';')
+    else:
+        comp = line
+    instruction = '111'
+    instruction += COMP_INSTRUCTIONS[comp]
+    instruction += DEST_INSTRUCTIONS[dest]
+    instruction += JUMP_INSTRUCTIONS[jump]
+    return instruction
+
+
+# Returns the instructions of the assembly corpus with labels removed and
+# every symbol resolved, since the legacy encoder only takes numeric
+# A-instructions.
+def resolve_corpus(size):
+    program = []
+    for asm_code in generate_asm(size):
+        assembler = hackassembler.Assembler()
+        program += [
+            f'@{int(assembler.translate_a_statement(line), 2)}'
+            if line[0] == '@' else line
+            for line in assembler.preprocess_code(asm_code.splitlines())
+        ]
+    return program
+
+
+def bench(name, function, program):
+    seconds = min(timeit.repeat(lambda: function(program), number=1, repeat=5))
+    print(f'{name:<24} {seconds * 1e9 / len(program):8.1f} ns/instruction')
+    return seconds
+
+
+def main():
+    program = resolve_corpus(SIZE)
+    a_text = hackassembler.Assembler().translate_a_statement
+
+    legacy = bench('legacy text', lambda code: [
+        legacy_translate_a_statement(line) if line[0] == '@'
+        else legacy_translate_c_statement(line)
+        for line in code
+    ], program)
+    text = bench('table text', lambda code: [
+        a_text(line) if line[0] == '@' else translate_c_statement(line)
+        for line in code
+    ], program)
+    binary = bench('table binary', lambda code: [
+        int(line[1: ]) if line[0] == '@' else encode_c_statement(line)
+        for line in code
+    ], program)
+
+    print(f'text speedup   {legacy / text:5.2f}x')
+    print(f'binary speedup {legacy / binary:5.2f}x')
+
+
+if __name__ == '__main__':
+    main()
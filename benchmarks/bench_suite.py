@@ -0,0 +1,199 @@
+import argparse
+import io
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+for directory in ('hackassembler', 'jackcompiler', 'vmtranslator'):
+    sys.path.insert(0, os.path.join(ROOT, directory))
+
+import vmtranslator
+from codegen import CodeGenerator
+from compengine import compile_file
+from corpus import CORPUS_NAME, generate_asm, generate_jack
+from hackassembler import Assembler
+from tokenizer import RegexTokenList, TokenList
+
+# Times every stage of the toolchain on a generated corpus and prints the
+# results as JSON, so that runs can be stored and compared. Each stage is run
+# repeat times and the fastest run is reported, then run once more under
+# tracemalloc for its peak memory, which leaves the timed runs undisturbed.
+# Inputs are prepared by a setup function outside of the measurements.
+
+
+# A stage of the toolchain. setup returns the input of a run, and run
+# processes it. units is the number of items in the input, counted in unit,
+# and size is its length in bytes.
+class Stage:
+    def __init__(self, name, setup, run, units, unit, size):
+        self.name = name
+        self.setup = setup
+        self.run = run
+        self.units = units
+        self.unit = unit
+        self.size = size
+
+    def measure(self, repeat):
+        times = []
+        for _ in range(repeat):
+            data = self.setup()
+            start = time.perf_counter()
+            self.run(data)
+            times.append(time.perf_counter() - start)
+
+        data = self.setup()
+        tracemalloc.start()
+        self.run(data)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        seconds = min(times)
+        return {
+            'seconds': seconds,
+            'mean_seconds': sum(times) / len(times),
+            'units': self.units,
+            'unit': self.unit,
+            'units_per_second': self.units / seconds,
+            'bytes': self.size,
+            'bytes_per_second': self.size / seconds,
+            'peak_memory_bytes': peak,
+        }
+
+
+# Every run of compile_file reads the same tokens from the start.
+def rewind(tokens):
+    tokens.pos = 0
+    return tokens
+
+# Translation starts with an empty fragment cache, as in a fresh process.
+def clear_fragments(code):
+    vmtranslator.render_fragment.cache_clear()
+    return code
+
+# Every program is assembled by its own Assembler.
+def preprocess(programs):
+    prepared = []
+    for lines in programs:
+        assembler = Assembler()
+        prepared.append((assembler, assembler.preprocess_code(lines)))
+    return prepared
+
+def translate_code(prepared):
+    for assembler, code in prepared:
+        assembler.translate_code(code)
+
+def assemble(programs):
+    for lines in programs:
+        Assembler().assemble(lines)
+
+
+def build_stages(size, depth, seed):
+    jack_code = generate_jack(size, depth, seed)
+    tokens = RegexTokenList(jack_code)
+    tree = compile_file(tokens)
+    xml = tree.as_xml(2, True)
+    vm_code = CodeGenerator().generate(tree)
+    asm_programs = [
+        [line.strip() for line in asm_code.split('\n')]
+        for asm_code in generate_asm(size, depth, seed)
+    ]
+
+    jack_bytes = len(jack_code.encode())
+    vm_bytes = len(vm_code.encode())
+    asm_bytes = sum(len(line) + 1 for lines in asm_programs for line in lines)
+    token_count = len(tokens.tokens)
+    command_count = sum(1 for command in vmtranslator.parse(vm_code, ''))
+    instruction_count = sum(len(code) for _, code in preprocess(asm_programs))
+
+    corpus = {
+        'size': size,
+        'depth': depth,
+        'seed': seed,
+        'jack_bytes': jack_bytes,
+        'tokens': token_count,
+        'xml_bytes': len(xml.encode()),
+        'vm_bytes': vm_bytes,
+        'vm_commands': command_count,
+        'asm_bytes': asm_bytes,
+        'instructions': instruction_count,
+    }
+    stages = [
+        Stage('TokenList', lambda: jack_code, TokenList,
+              token_count, 'tokens', jack_bytes),
+        Stage('RegexTokenList', lambda: jack_code, RegexTokenList,
+              token_count, 'tokens', jack_bytes),
+        Stage('compile_file', lambda: rewind(tokens), compile_file,
+              token_count, 'tokens', jack_bytes),
+        Stage('as_xml', lambda: tree, lambda tree: tree.as_xml(2, True),
+              token_count, 'tokens', jack_bytes),
+        Stage('write_xml', lambda: tree,
+              lambda tree: tree.write_xml(io.StringIO(), 2, True),
+              token_count, 'tokens', jack_bytes),
+        Stage('CodeGenerator', lambda: tree,
+              lambda tree: CodeGenerator().generate(tree),
+              token_count, 'tokens', jack_bytes),
+        Stage('translate', lambda: clear_fragments(vm_code),
+              lambda code: vmtranslator.translate(code, CORPUS_NAME),
+              command_count, 'commands', vm_bytes),
+        Stage('translate_code', lambda: preprocess(asm_programs),
+              translate_code, instruction_count, 'instructions', asm_bytes),
+        Stage('assemble', lambda: asm_programs, assemble,
+              instruction_count, 'instructions', asm_bytes),
+    ]
+    return corpus, stages
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Toolchain benchmark suite')
+    parser.add_argument(
+        '--size', type=int, default=20, help='number of classes',
+    )
+    parser.add_argument(
+        '--depth', type=int, default=3,
+        help='nesting depth of statements and expressions',
+    )
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument(
+        '--repeat', type=int, default=3,
+        help='number of timed runs of each stage',
+    )
+    parser.add_argument(
+        '--stage', action='append', metavar='NAME',
+        help='only run the named stage (may be given more than once)',
+    )
+    parser.add_argument(
+        '-o', '--output', metavar='FILE',
+        help='write the results to a file instead of stdout',
+    )
+    args = parser.parse_args()
+
+    corpus, stages = build_stages(args.size, args.depth, args.seed)
+    results = {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'repeat': args.repeat,
+        'corpus': corpus,
+        'stages': {},
+    }
+    for stage in stages:
+        if args.stage and stage.name not in args.stage:
+            continue
+        print(f'Running {stage.name}', file=sys.stderr)
+        results['stages'][stage.name] = stage.measure(args.repeat)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+            f.write('\n')
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == '__main__':
+    main()
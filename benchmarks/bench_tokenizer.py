@@ -0,0 +1,40 @@
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', 'jackcompiler'
+))
+
+from corpus import generate_jack
+from tokenizer import RegexTokenList, TokenList
+
+# Number of classes in the generated corpus.
+SIZE = 50
+
+
+def bench(name, token_list_class, corpus):
+    start = time.perf_counter()
+    tokens = token_list_class(corpus)
+    elapsed = time.perf_counter() - start
+    speed = len(tokens.tokens) / elapsed / 1e3
+    print(f'{name:<6} {elapsed:.3f}s ({speed:.0f}k tokens/s)')
+    return elapsed, tokens
+
+
+def main():
+    corpus = generate_jack(SIZE)
+    print(f'{len(corpus) / 1e6:.1f} MB of Jack code')
+
+    loop, loop_tokens = bench('loop', TokenList, corpus)
+    regex, regex_tokens = bench('regex', RegexTokenList, corpus)
+    assert regex_tokens.map == loop_tokens.map
+    assert all(
+        (a.kind, a.value) == (b.kind, b.value)
+        for a, b in zip(regex_tokens.tokens, loop_tokens.tokens)
+    )
+    print(f'speedup {loop / regex:.2f}x')
+
+
+if __name__ == '__main__':
+    main()
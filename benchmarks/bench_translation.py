@@ -0,0 +1,42 @@
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', 'vmtranslator'
+))
+
+import vmtranslator
+from corpus import generate_vm
+
+# Number of classes in the generated corpus, about 3500 VM commands each.
+SIZE = 90
+
+
+def bench(name, corpus, commands):
+    start = time.perf_counter()
+    vmtranslator.translate_to(corpus, 'Main', io.StringIO())
+    elapsed = time.perf_counter() - start
+    speed = commands / elapsed / 1e3
+    print(f'{name:<10} {elapsed:.3f}s ({speed:.0f}k commands/s)')
+    return elapsed
+
+
+def main():
+    corpus = generate_vm(SIZE)
+    commands = sum(1 for command in vmtranslator.parse(corpus, 'Main'))
+
+    cached_render = vmtranslator.render_fragment
+    vmtranslator.render_fragment = cached_render.__wrapped__
+    uncached = bench('uncached', corpus, commands)
+    vmtranslator.render_fragment = cached_render
+    cached = bench('cached', corpus, commands)
+
+    info = cached_render.cache_info()
+    print(f'{info.hits} hits, {info.misses} misses, {info.currsize} fragments')
+    print(f'speedup {uncached / cached:.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,201 @@
+import argparse
+import os
+import random
+import re
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+for directory in ('jackcompiler', 'vmtranslator'):
+    sys.path.insert(0, os.path.join(ROOT, directory))
+
+import vmtranslator
+from codegen import CodeGenerator
+from compengine import compile_file
+from tokenizer import RegexTokenList
+
+# Generates reproducible Jack, VM and Hack assembly corpora of any size. The
+# VM code is compiled from the Jack code and the assembly translated from the
+# VM code, so all three have the shape of real programs. The same size, depth
+# and seed always give the same code. The Jack and VM corpora are single files
+# of any length, but a Hack program has to fit in the 32K words of ROM, so the
+# assembly corpus is split into as many programs as it takes.
+
+# Number of subroutines in every generated class.
+SUBROUTINES = 10
+
+# Number of statements in every generated block.
+BLOCK_STATEMENTS = 3
+
+BINARY_OPERATORS = ['+', '-', '&', '|', '<', '>', '=', '*', '/']
+
+# Name the corpus files are written under.
+CORPUS_NAME = 'Corpus'
+
+# Number of words in the Hack ROM.
+ROM_SIZE = 32768
+
+FUNCTION_PATTERN = re.compile(r'^(?=function )', re.MULTILINE)
+
+
+class JackGenerator:
+    def __init__(self, size, depth, seed):
+        self.size = size
+        self.depth = depth
+        self.rng = random.Random(seed)
+
+    # Yields the source code of every class in turn.
+    def generate(self):
+        for i in range(self.size):
+            self.lines = []
+            self.generate_class(i)
+            yield '\n'.join(self.lines) + '\n'
+
+    def generate_class(self, i):
+        self.lines.append(f'class C{i} {{')
+        self.lines.append('    field int x, y;')
+        self.lines.append('    static Array table;')
+        for j in range(SUBROUTINES):
+            kind = 'method' if j % 2 else 'function'
+            self.lines.append(f'    {kind} int f{j}(int a, int b) {{')
+            self.lines.append('        var int i, sum;')
+            self.generate_statements(self.depth, 2)
+            self.lines.append(f'        return {self.expression(self.depth)};')
+            self.lines.append('    }')
+        self.lines.append('}')
+
+    # Statements nest if and while blocks down to the given depth.
+    def generate_statements(self, depth, indent):
+        padding = '    ' * indent
+        for _ in range(BLOCK_STATEMENTS):
+            r = self.rng.random()
+            if depth > 0 and r < 0.2:
+                self.lines.append(
+                    f'{padding}if ({self.expression(depth - 1)}) {{'
+                )
+                self.generate_statements(depth - 1, indent + 1)
+                self.lines.append(f'{padding}}} else {{')
+                self.generate_statements(depth - 1, indent + 1)
+                self.lines.append(f'{padding}}}')
+            elif depth > 0 and r < 0.4:
+                self.lines.append(
+                    f'{padding}while ({self.expression(depth - 1)}) {{'
+                )
+                self.generate_statements(depth - 1, indent + 1)
+                self.lines.append(f'{padding}}}')
+            elif r < 0.6:
+                self.lines.append(
+                    f'{padding}let table[i] = {self.expression(depth)};'
+                )
+            elif r < 0.85:
+                variable = self.rng.choice(['i', 'sum', 'a', 'b'])
+                self.lines.append(
+                    f'{padding}let {variable} = {self.expression(depth)};'
+                )
+            elif r < 0.95:
+                self.lines.append(
+                    f'{padding}do Output.printInt({self.expression(depth)});'
+                )
+            else:
+                self.lines.append(
+                    f'{padding}do Output.printString("sum {depth}");'
+                )
+
+    # Expressions nest parentheses, unary operators and calls down to the
+    # given depth.
+    def expression(self, depth):
+        rng = self.rng
+        if depth == 0:
+            r = rng.random()
+            if r < 0.4:
+                return rng.choice(['i', 'sum', 'a', 'b'])
+            elif r < 0.7:
+                return str(rng.randrange(1000))
+            elif r < 0.9:
+                return f'table[{rng.choice(["i", "a"])}]'
+            else:
+                return rng.choice(['true', 'false', 'null'])
+        r = rng.random()
+        left = self.expression(depth - 1)
+        right = self.expression(depth - 1)
+        if r < 0.5:
+            return f'({left} {rng.choice(BINARY_OPERATORS)} {right})'
+        elif r < 0.7:
+            return f'{rng.choice("-~")}({left} + {right})'
+        else:
+            callee = f'C{rng.randrange(self.size)}.f{rng.randrange(0, 10, 2)}'
+            return f'{callee}({left}, {right})'
+
+
+def compile_jack(jack_code):
+    return CodeGenerator().generate(compile_file(RegexTokenList(jack_code)))
+
+def generate_jack(size, depth = 3, seed = 0):
+    return ''.join(JackGenerator(size, depth, seed).generate())
+
+def generate_vm(size, depth = 3, seed = 0):
+    return compile_jack(generate_jack(size, depth, seed))
+
+# Returns a list of Hack assembly programs translated from the VM corpus.
+# Functions are translated one at a time, under a filename of their own so
+# their labels stay unique, and packed into each program for as long as it
+# fits in ROM.
+def generate_asm(size, depth = 3, seed = 0):
+    programs = []
+    program = []
+    words = 0
+    functions = FUNCTION_PATTERN.split(generate_vm(size, depth, seed))
+    for i, function in enumerate(filter(None, functions)):
+        asm_code = vmtranslator.translate(function, f'{CORPUS_NAME}{i}')
+        count = vmtranslator.count_rom_words(asm_code)
+        if count > ROM_SIZE:
+            raise ValueError(f'Function {i} does not fit in ROM at this depth')
+        if words + count > ROM_SIZE:
+            programs.append(''.join(program))
+            program = []
+            words = 0
+        program.append(asm_code)
+        words += count
+    if program:
+        programs.append(''.join(program))
+    return programs
+
+# Writes the corpora to Corpus.jack, Corpus.vm and Corpus0.asm, Corpus1.asm
+# and so on in directory, and returns their paths.
+def write_corpus(directory, size, depth = 3, seed = 0):
+    jack_code = generate_jack(size, depth, seed)
+    files = [
+        (CORPUS_NAME + '.jack', jack_code),
+        (CORPUS_NAME + '.vm', compile_jack(jack_code)),
+    ]
+    files += [
+        (f'{CORPUS_NAME}{i}.asm', asm_code)
+        for i, asm_code in enumerate(generate_asm(size, depth, seed))
+    ]
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+    for filename, code in files:
+        path = os.path.join(directory, filename)
+        with open(path, 'w') as f:
+            f.write(code)
+        paths.append(path)
+    return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark corpus generator')
+    parser.add_argument('directory')
+    parser.add_argument(
+        '--size', type=int, default=100, help='number of classes',
+    )
+    parser.add_argument(
+        '--depth', type=int, default=3,
+        help='nesting depth of statements and expressions',
+    )
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    for path in write_corpus(args.directory, args.size, args.depth, args.seed):
+        print(f'Wrote {path}')
+
+
+if __name__ == '__main__':
+    main()
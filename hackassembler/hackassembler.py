@@ -1,4 +1,17 @@
+import argparse
+import json
+import mmap
+import os
 import sys
+from array import array
+
+# The profiler is shared by all the tools, from a sibling directory.
+sys.path.insert(0, os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', 'profiling'
+))
+
+import profiler
+from profiler import NULL_PROFILE
 
 ###############################################################################
 
@@ -61,11 +74,29 @@ JUMP_INSTRUCTIONS = {
     'JMP': '111',
 }
 
+# Builds a lookup from the whitespace-free text of every valid C-instruction
+# to its 16-bit encoding, so encoding a line is a single dictionary lookup.
+def build_c_instruction_codes():
+    codes = {}
+    for dest, dest_bits in DEST_INSTRUCTIONS.items():
+        for comp, comp_bits in COMP_INSTRUCTIONS.items():
+            for jump, jump_bits in JUMP_INSTRUCTIONS.items():
+                line = (f'{dest}=' if dest else '') + comp
+                line += (f';{jump}' if jump else '')
+                codes[line] = int('111' + comp_bits + dest_bits + jump_bits, 2)
+    return codes
+
+C_INSTRUCTION_CODES = build_c_instruction_codes()
+
+C_INSTRUCTION_TEXT = {
+    line: f'{code:016b}' for line, code in C_INSTRUCTION_CODES.items()
+}
+
 ###############################################################################
 
-allocation_address = 16
+VARIABLE_BASE_ADDRESS = 16
 
-symbols = {
+PREDEFINED_SYMBOLS = {
     **{f'R{i}': i for i in range(16)},
     'SCREEN': 16384,
     'KBD'   : 24576,
@@ -76,6 +107,14 @@ symbols = {
     'THAT'  : 4,
 }
 
+STREAM_CHUNK_SIZE = 4096
+
+TEXT_EXTENSION = '.hack'
+BINARY_EXTENSION = '.hackbin'
+OBJECT_EXTENSION = '.hackobj'
+
+OBJECT_FORMAT_VERSION = 1
+
 ###############################################################################
 
 def remove_whitespace(code):
@@ -87,86 +126,415 @@ def remove_whitespace(code):
         else:
             yield line.replace(' ', '')
 
-def process_labels(code):
-    i = 0
-    for line in code:
-        if line[0] == '(' and line[-1] == ')':
-            label = line[1:-1]
-            if label in symbols:
-                raise ValueError(f'Duplicate label "{label}"')
+def translate_c_statement(line):
+    try:
+        return C_INSTRUCTION_TEXT[line]
+    except KeyError:
+        raise ValueError()
+
+def encode_c_statement(line):
+    try:
+        return C_INSTRUCTION_CODES[line]
+    except KeyError:
+        raise ValueError()
+
+###############################################################################
+
+# Assembles a single program. Every instance owns its own symbol table and
+# variable allocation counter, so any number of programs can be assembled in
+# one process, including concurrently from separate threads, as long as each
+# one uses its own instance.
+class Assembler:
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.symbols = dict(PREDEFINED_SYMBOLS)
+        self.allocation_address = VARIABLE_BASE_ADDRESS
+
+    def process_labels(self, code):
+        i = 0
+        for line in code:
+            if line[0] == '(' and line[-1] == ')':
+                label = line[1:-1]
+                if label in self.symbols:
+                    raise ValueError(f'Duplicate label "{label}"')
+                else:
+                    self.symbols[label] = i
             else:
-                symbols[label] = i
-        else:
-            i += 1
-            yield line
+                i += 1
+                yield line
+
+    def preprocess_code(self, code):
+        code = remove_whitespace(code)
+        code = self.process_labels(code)
+        return list(code)
+
+    def allocate_variable(self, symbol):
+        self.symbols[symbol] = self.allocation_address
+        self.allocation_address += 1
+        return self.symbols[symbol]
+
+    def translate_a_statement(self, line):
+        try:
+            address = int(line[1: ])
+        except ValueError:
+            symbol = line[1: ]
+            if symbol in self.symbols:
+                address = self.symbols[symbol]
+            else:
+                address = self.allocate_variable(symbol)
+        return f'{address:016b}'
+
+    def translate_code(self, code):
+        machine_code = ''
+        for num, line in enumerate(code):
+            if line[0] == '@':
+                machine_code += self.translate_a_statement(line)
+            else:
+                try:
+                    machine_code += translate_c_statement(line)
+                except ValueError:
+                    raise ValueError(f'Syntax error (line {num}): {line}')
+            machine_code += '\n'
+        return machine_code
 
-def preprocess_code(code):
-    code = remove_whitespace(code)
-    code = process_labels(code)
-    return list(code)
+    # First pass: labels are recorded by process_labels as the lines stream
+    # past, and every instruction that does not reference a symbol is encoded
+    # straight into a compact word array. Symbolic A-instructions get a
+    # placeholder word and a fixup to be resolved once all labels are known.
+    # A fixup is the index of the word in one array and the id of its symbol
+    # in another, with each symbol's name kept once in order of first
+    # reference, so memory beyond the words grows with the symbol table and
+    # not with the number of references. Returns the words, the two fixup
+    # arrays and the symbol names.
+    def encode_instructions(self, code):
+        words = array('H')
+        fixup_words = array('L')
+        fixup_ids = array('L')
+        symbol_ids = {}
+        for line in self.process_labels(remove_whitespace(code)):
+            num = len(words)
+            if line[0] == '@':
+                try:
+                    address = int(line[1: ])
+                except ValueError:
+                    symbol = line[1: ]
+                    if (symbol_id := symbol_ids.get(symbol)) is None:
+                        symbol_id = symbol_ids[symbol] = len(symbol_ids)
+                    fixup_words.append(num)
+                    fixup_ids.append(symbol_id)
+                    address = 0
+                if not 0 <= address < 32768:
+                    raise ValueError(f'Syntax error (line {num}): {line}')
+                words.append(address)
+            else:
+                try:
+                    words.append(encode_c_statement(line))
+                except ValueError:
+                    raise ValueError(f'Syntax error (line {num}): {line}')
+        return words, fixup_words, fixup_ids, list(symbol_ids)
+
+    def encode_code(self, code):
+        words, fixup_words, fixup_ids, names = self.encode_instructions(code)
+
+        # Second pass: resolve the symbolic references in program order, so
+        # that variables are allocated in the same order as translate_code.
+        # Each symbol is looked up once, on its first reference.
+        addresses = [None] * len(names)
+        for num, symbol_id in zip(fixup_words, fixup_ids):
+            if (address := addresses[symbol_id]) is None:
+                symbol = names[symbol_id]
+                if symbol in self.symbols:
+                    address = self.symbols[symbol]
+                else:
+                    address = self.allocate_variable(symbol)
+                if address >= 32768:
+                    raise ValueError(
+                        f'Address of "{symbol}" out of range: {address}'
+                    )
+                addresses[symbol_id] = address
+            words[num] = address
+        return words
+
+    # Assembles an iterable of source lines into an array of 16-bit words,
+    # starting from a fresh symbol table so the instance can be reused.
+    def assemble(self, lines):
+        self.reset()
+        return self.encode_code(line.strip() for line in lines)
+
+    # Assembles an iterable of source lines into a relocatable ObjectModule.
+    # Labels are kept relative to the start of the module, and only the
+    # predefined symbols are resolved. Every other symbolic reference is left
+    # for the linker, which knows where the module is placed and which labels
+    # the other modules define.
+    def assemble_object(self, lines):
+        self.reset()
+        words, fixup_words, fixup_ids, names = self.encode_instructions(
+            line.strip() for line in lines
+        )
+        labels = {
+            symbol: address for symbol, address in self.symbols.items()
+            if symbol not in PREDEFINED_SYMBOLS
+        }
+        relocations = {}
+        for num, symbol_id in zip(fixup_words, fixup_ids):
+            symbol = names[symbol_id]
+            if symbol in PREDEFINED_SYMBOLS:
+                words[num] = PREDEFINED_SYMBOLS[symbol]
+            else:
+                relocations.setdefault(symbol, []).append(num)
+        return ObjectModule(words, labels, relocations)
 
 ###############################################################################
 
-def allocate_variable(symbol):
-    global allocation_address
-    symbols[symbol] = allocation_address
-    allocation_address += 1
-    return symbols[symbol]
+# Separately assembled part of a program. Its code is assembled as if the
+# module started at address 0, with a placeholder in every A-instruction that
+# refers to a label or variable. Labels maps the labels the module defines to
+# their offsets, which are all exported, since Hack labels are global.
+# Relocations maps every other symbol referenced by the module to the offsets
+# of the instructions referencing it, in order of first reference. These are
+# the module's own labels, the labels of other modules, and its variables,
+# such as the static segment of a VM-translated file, which the linker tells
+# apart once it has all the modules.
+class ObjectModule:
+    def __init__(self, words, labels, relocations):
+        self.words = words
+        self.labels = labels
+        self.relocations = relocations
 
-def translate_a_statement(line):
-    try:
-        address = int(line[1: ])
-    except ValueError:
-        symbol = line[1: ]
-        if symbol in symbols:
+    # Object files are JSON, with the code stored as the hex digits of the
+    # little-endian words, as in a binary ROM image.
+    def write(self, f):
+        words = self.words
+        if sys.byteorder == 'big':
+            words = array('H', words)
+            words.byteswap()
+        json.dump({
+            'version': OBJECT_FORMAT_VERSION,
+            'code': words.tobytes().hex(),
+            'labels': self.labels,
+            'relocations': self.relocations,
+        }, f)
+
+    @classmethod
+    def read(cls, f):
+        try:
+            fields = json.load(f)
+            if fields['version'] != OBJECT_FORMAT_VERSION:
+                raise ValueError(
+                    f'unsupported version {fields["version"]}'
+                )
+            words = array('H', bytes.fromhex(fields['code']))
+            labels = fields['labels']
+            relocations = fields['relocations']
+        except (KeyError, TypeError, ValueError) as error:
+            raise ValueError(f'Invalid object file: {error}')
+        if sys.byteorder == 'big':
+            words.byteswap()
+        return cls(words, labels, relocations)
+
+# Links object modules into one program, placing them one after another in
+# the given order. A symbol that some module defines as a label resolves to
+# that label's address in the program. Any other symbol is a variable, and is
+# allocated from VARIABLE_BASE_ADDRESS in order of first reference. Linking
+# the modules of a program's files this way gives the same words as
+# assembling the concatenation of the files.
+def link(modules):
+    symbols = {}
+    base = 0
+    for module in modules:
+        for label, offset in module.labels.items():
+            if label in symbols:
+                raise ValueError(f'Duplicate label "{label}"')
+            symbols[label] = base + offset
+        base += len(module.words)
+
+    words = array('H')
+    allocation_address = VARIABLE_BASE_ADDRESS
+    for module in modules:
+        base = len(words)
+        words.extend(module.words)
+        for symbol, offsets in module.relocations.items():
+            if symbol not in symbols:
+                symbols[symbol] = allocation_address
+                allocation_address += 1
             address = symbols[symbol]
-        else:
-            address = allocate_variable(symbol)
-    address = bin(address)[2: ]
-    return '0' * (16 - len(address)) + address
+            if address >= 32768:
+                raise ValueError(
+                    f'Address of "{symbol}" out of range: {address}'
+                )
+            for offset in offsets:
+                words[base + offset] = address
+    return words
 
-def translate_c_statement(line):
-    dest, jump = None, None
-    if '=' in line:
-        dest, line = line.split('=')
-    if ';' in line:
-        comp, jump = line.split(';')
+# Loads an object file, or assembles a source file into an object module.
+def load_object(filename):
+    if os.path.splitext(filename)[1] == OBJECT_EXTENSION:
+        with open(filename, 'r') as f:
+            return ObjectModule.read(f)
+    with open(filename, 'r') as f:
+        return Assembler().assemble_object(f)
+
+###############################################################################
+
+def write_text(words, f, chunk_size = STREAM_CHUNK_SIZE):
+    for start in range(0, len(words), chunk_size):
+        chunk = words[start : start + chunk_size]
+        f.write(''.join(f'{word:016b}\n' for word in chunk))
+
+# Binary ROM images are packed little-endian uint16 words, two bytes per
+# instruction, with no header.
+def write_binary(words, f):
+    if sys.byteorder == 'big':
+        words = array('H', words)
+        words.byteswap()
+    f.write(words.tobytes())
+
+def write_program(words, output_filename, binary = False):
+    if binary:
+        with open(output_filename, 'wb') as f:
+            write_binary(words, f)
     else:
-        comp = line
-    instruction = '111'
-    try:
-        instruction += COMP_INSTRUCTIONS[comp]
-        instruction += DEST_INSTRUCTIONS[dest]
-        instruction += JUMP_INSTRUCTIONS[jump]
-    except KeyError:
-        raise ValueError()
-    return instruction
+        with open(output_filename, 'w') as f:
+            write_text(words, f)
 
-def translate_code(code):
-    machine_code = ''
-    for num, line in enumerate(code):
-        if line[0] == '@':
-            machine_code += translate_a_statement(line)
-        else:
-            try:
-                machine_code += translate_c_statement(line)
-            except ValueError:
-                raise ValueError(f'Syntax error (line {num}): {line}')
-        machine_code += '\n'
-    return machine_code
+def assemble_stream(input_filename, output_filename, binary = False,
+                    profile = NULL_PROFILE):
+    with profile.stage('assemble'), open(input_filename, 'r') as f:
+        words = Assembler().assemble(f)
+    if profile:
+        profile.count('instructions', len(words))
+    with profile.stage('write'):
+        write_program(words, output_filename, binary)
+
+###############################################################################
+
+def load_text(filename):
+    words = array('H')
+    with open(filename, 'r') as f:
+        for num, line in enumerate(f, 1):
+            if line := line.strip():
+                try:
+                    words.append(int(line, 2))
+                except (ValueError, OverflowError):
+                    raise ValueError(f'Invalid word in line {num}: {line}')
+    return words
+
+# Memory-maps a binary ROM image and returns it as a read-only memoryview of
+# unsigned 16-bit words. On little-endian hosts this is zero-copy, the file is
+# paged in by the OS as it is read. Big-endian hosts get a byteswapped copy.
+def load_binary(filename):
+    with open(filename, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return memoryview(array('H')).toreadonly()
+        rom = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if len(rom) % 2:
+        raise ValueError(f'Truncated ROM image {filename}')
+    if sys.byteorder == 'big':
+        words = array('H', rom)
+        words.byteswap()
+        return memoryview(words).toreadonly()
+    return memoryview(rom).cast('H')
+
+# Loads a ROM from either format, picked by the file extension.
+def load_rom(filename):
+    if os.path.splitext(filename)[1] == BINARY_EXTENSION:
+        return load_binary(filename)
+    return load_text(filename)
 
 ###############################################################################
 
 def main():
-    input_filename = sys.argv[1]
-    with open(input_filename, 'r') as f:
-        raw_code = map(lambda x: x.strip(), f.read().split('\n'))
-    prepped_code = preprocess_code(raw_code)
-    machine_code = translate_code(prepped_code)
-    output_filename = '.'.join(input_filename.split('.')[ :-1]) + '.hack'
-    with open(output_filename, 'w') as f:
-        f.write(machine_code)
+    parser = argparse.ArgumentParser(description='Hack assembler')
+    parser.add_argument('input_filenames', metavar='input_filename', nargs='+')
+    parser.add_argument(
+        '-c', '--object', action='store_true',
+        help=f'assemble each file into a relocatable {OBJECT_EXTENSION} '
+             'module instead of a program',
+    )
+    parser.add_argument(
+        '-o', '--output', metavar='FILE',
+        help='output filename (default: the first input with a new extension)',
+    )
+    parser.add_argument(
+        '--stream', action='store_true',
+        help='read the source line by line and write the output in chunks',
+    )
+    parser.add_argument(
+        '--format', choices=('text', 'binary'), default='text',
+        help=f'write ASCII .hack text or a packed {BINARY_EXTENSION} image',
+    )
+    profiler.add_arguments(parser)
+    args = parser.parse_args()
+
+    input_filenames = args.input_filenames
+    if args.object and args.output and len(input_filenames) > 1:
+        parser.error('--output cannot be used with --object and several files')
+    run_profiler = profiler.Profiler.from_args('hackassembler', args)
+
+    # Assemble every file into its own object file, to be linked later.
+    if args.object:
+        for input_filename in input_filenames:
+            output_filename = args.output or (
+                os.path.splitext(input_filename)[0] + OBJECT_EXTENSION
+            )
+            with run_profiler.file(input_filename) as profile:
+                with profile.stage('assemble'), open(input_filename) as f:
+                    module = Assembler().assemble_object(f)
+                if profile:
+                    profile.count('instructions', len(module.words))
+                with profile.stage('write'), open(output_filename, 'w') as f:
+                    module.write(f)
+            run_profiler.add(profile)
+            print(f'Wrote object module into {output_filename}')
+        run_profiler.report()
+        return
+
+    input_filename = input_filenames[0]
+    binary = args.format == 'binary'
+    output_filename = args.output or (
+        '.'.join(input_filename.split('.')[ :-1])
+        + (BINARY_EXTENSION if binary else TEXT_EXTENSION)
+    )
+
+    # Several files, or any object files, are linked into one program.
+    if len(input_filenames) > 1 or any(
+        os.path.splitext(filename)[1] == OBJECT_EXTENSION
+        for filename in input_filenames
+    ):
+        modules = []
+        for filename in input_filenames:
+            with run_profiler.file(filename) as profile:
+                with profile.stage('load'):
+                    modules.append(load_object(filename))
+                if profile:
+                    profile.count('instructions', len(modules[-1].words))
+            run_profiler.add(profile)
+        with run_profiler.stage('link'):
+            words = link(modules)
+        with run_profiler.stage('write'):
+            write_program(words, output_filename, binary)
+    elif args.stream or binary:
+        with run_profiler.file(input_filename) as profile:
+            assemble_stream(input_filename, output_filename, binary, profile)
+        run_profiler.add(profile)
+    else:
+        with run_profiler.file(input_filename) as profile:
+            with profile.stage('read'), open(input_filename, 'r') as f:
+                raw_code = map(lambda x: x.strip(), f.read().split('\n'))
+            assembler = Assembler()
+            with profile.stage('preprocess'):
+                prepped_code = assembler.preprocess_code(raw_code)
+            with profile.stage('translate'):
+                machine_code = assembler.translate_code(prepped_code)
+            if profile:
+                profile.count('instructions', len(prepped_code))
+            with profile.stage('write'), open(output_filename, 'w') as f:
+                f.write(machine_code)
+        run_profiler.add(profile)
     print(f'Wrote assembled program into {output_filename}')
+    run_profiler.report()
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,171 @@
+import os
+import sys
+from array import array
+
+# The emulator shares its instruction encoding and ROM loaders with the
+# assembler, which lives in a sibling directory.
+sys.path.insert(0, os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', 'hackassembler'
+))
+
+from hackassembler import COMP_INSTRUCTIONS, load_rom
+
+###############################################################################
+
+ROM_SIZE = 32768
+RAM_SIZE = 32768
+ADDRESS_MASK = 0x7FFF
+
+SCREEN = 16384
+KBD = 24576
+
+# Reasons for run() to return control to the caller.
+HALTED = 'halted'
+BREAKPOINT = 'breakpoint'
+CYCLE_LIMIT = 'cycle limit'
+END_OF_PROGRAM = 'end of program'
+
+###############################################################################
+
+def wrap(expression):
+    return f'((({expression}) + 32768) & 65535) - 32768'
+
+# Builds a Python expression over the registers A, D and M for the given
+# 7-bit a+c field of a C-instruction. The documented mnemonics are used as is,
+# so the common cases stay simple, and everything else goes through the
+# general ALU semantics of zx/nx/zy/ny/f/no.
+def comp_expression(comp):
+    for mnemonic, bits in COMP_INSTRUCTIONS.items():
+        if int(bits, 2) == comp:
+            expression = mnemonic.replace('!', '~')
+            if any(op in mnemonic for op in '+-') and mnemonic != '-1':
+                expression = wrap(expression)
+            return expression
+
+    x = 'D'
+    y = 'M' if comp & 0b1000000 else 'A'
+    if comp & 0b0100000:
+        x = '0'
+    if comp & 0b0010000:
+        x = f'~{x}'
+    if comp & 0b0001000:
+        y = '0'
+    if comp & 0b0000100:
+        y = f'~{y}'
+    out = wrap(f'({x}) + ({y})') if comp & 0b0000010 else f'({x}) & ({y})'
+    if comp & 0b0000001:
+        out = f'~({out})'
+    return out
+
+def m_expression(expression):
+    return expression.replace('M', f'ram[A & {ADDRESS_MASK}]')
+
+COMP_FUNCTIONS = {
+    comp: eval(f'lambda A, D, ram: {m_expression(comp_expression(comp))}')
+    for comp in range(128)
+}
+
+# Pre-decodes a ROM word into a tuple of (comp, dest, jump). A-instructions
+# have None in place of the computation function and the value in place of
+# the dest bits.
+def decode(word):
+    word &= 0xFFFF
+    if not word & 0x8000:
+        return (None, word, 0)
+    return (COMP_FUNCTIONS[(word >> 6) & 0x7F], (word >> 3) & 7, word & 7)
+
+###############################################################################
+
+# Emulates the Hack CPU with its instruction and data memories. Registers are
+# kept as signed 16-bit Python ints, and the memories as array('h') buffers.
+class HackCPU:
+    def __init__(self, rom = ()):
+        self.ram = array('h', bytes(2 * RAM_SIZE))
+        self.load(rom)
+
+    # Loads a program from a sequence of unsigned 16-bit words, or from a
+    # .hack / .hackbin file if given a filename.
+    def load(self, rom):
+        if isinstance(rom, str):
+            rom = load_rom(rom)
+        words = array('h')
+        words.frombytes(array('H', rom).tobytes())
+        if len(words) > ROM_SIZE:
+            raise ValueError(f'Program too large ({len(words)} words)')
+        self.rom = words
+        self.decoded = [decode(word) for word in words]
+        self.reset()
+
+    def patch_rom(self, address, word):
+        self.rom[address] = ((word + 32768) & 0xFFFF) - 32768
+        self.decoded[address] = decode(word)
+
+    def reset(self):
+        self.a = 0
+        self.d = 0
+        self.pc = 0
+        self.cycles = 0
+
+    def step(self):
+        return self.run(1)
+
+    # Runs until the program halts (jumps to itself in an infinite loop),
+    # reaches a breakpoint address, exhausts max_cycles, or runs off the end
+    # of the loaded program. Returns the reason for stopping. The instruction
+    # at a breakpoint is not executed, and resuming does not stop on it again.
+    def run(self, max_cycles = None, breakpoints = ()):
+        decoded = self.decoded
+        ram = self.ram
+        a, d, pc = self.a, self.d, self.pc
+        end = len(decoded)
+        breakpoints = frozenset(breakpoints)
+        budget = -1 if max_cycles is None else max_cycles
+        cycles = 0
+        reason = CYCLE_LIMIT
+
+        while cycles != budget:
+            if pc >= end:
+                reason = END_OF_PROGRAM
+                break
+            if breakpoints and cycles and pc in breakpoints:
+                reason = BREAKPOINT
+                break
+            comp, dest, jump = decoded[pc]
+            cycles += 1
+
+            # A-instruction.
+            if comp is None:
+                a = dest
+                pc += 1
+                continue
+
+            # C-instruction. Memory writes and jumps use the value A had at
+            # the start of the cycle, as in the hardware.
+            out = comp(a, d, ram)
+            if dest:
+                if dest & 1:
+                    ram[a & ADDRESS_MASK] = out
+                if dest & 2:
+                    d = out
+            if jump and (
+                (out < 0 and jump & 4) or (out == 0 and jump & 2)
+                or (out > 0 and jump & 1)
+            ):
+                target = a & ADDRESS_MASK
+                if dest & 4:
+                    a = out
+                if jump == 7 and not dest and (target == pc or (
+                    target == pc - 1 and decoded[target] == (None, target, 0)
+                )):
+                    pc = target
+                    reason = HALTED
+                    break
+                pc = target
+            else:
+                if dest & 4:
+                    a = out
+                pc += 1
+
+        self.a, self.d, self.pc = a, d, pc
+        self.cycles += cycles
+        return reason
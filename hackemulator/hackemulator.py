@@ -0,0 +1,57 @@
+import argparse
+import time
+
+from cpu import HackCPU
+from jit import JitCPU
+
+
+# Parses a RAM range of the form "start" or "start:end" (end exclusive).
+def parse_range(text):
+    start, _, end = text.partition(':')
+    return range(int(start), int(end) if end else int(start) + 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Hack CPU emulator')
+    parser.add_argument('program', help='.hack or .hackbin file to run')
+    parser.add_argument(
+        '--cycles', type=int, default=None,
+        help='maximum number of instructions to execute',
+    )
+    parser.add_argument(
+        '--break', dest='breakpoints', type=int, action='append', default=[],
+        metavar='ADDRESS', help='stop before executing this ROM address',
+    )
+    parser.add_argument(
+        '--jit', action='store_true',
+        help='compile basic blocks into Python functions before running them',
+    )
+    parser.add_argument(
+        '--set', action='append', default=[], metavar='ADDRESS=VALUE',
+        help='initialise a RAM word before running',
+    )
+    parser.add_argument(
+        '--dump', action='append', default=[], metavar='START[:END]',
+        help='print a RAM range after running',
+    )
+    args = parser.parse_args()
+
+    cpu = (JitCPU if args.jit else HackCPU)(args.program)
+    for assignment in args.set:
+        address, value = assignment.split('=')
+        cpu.ram[int(address)] = int(value)
+
+    start = time.perf_counter()
+    reason = cpu.run(args.cycles, args.breakpoints)
+    elapsed = time.perf_counter() - start
+
+    speed = cpu.cycles / elapsed / 1e6 if elapsed else 0
+    print(f'Stopped ({reason}) at PC={cpu.pc} after {cpu.cycles} cycles')
+    print(f'Ran for {elapsed:.3f}s ({speed:.2f}M instructions/s)')
+    print(f'A={cpu.a} D={cpu.d}')
+    for text in args.dump:
+        for address in parse_range(text):
+            print(f'RAM[{address}] = {cpu.ram[address]}')
+
+if __name__ == '__main__':
+    main()
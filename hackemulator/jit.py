@@ -0,0 +1,172 @@
+from cpu import (
+    ADDRESS_MASK, BREAKPOINT, CYCLE_LIMIT, END_OF_PROGRAM, HALTED,
+    HackCPU, comp_expression,
+)
+
+# Conditions for each value of the jump bits, over the ALU output.
+JUMP_CONDITIONS = {
+    1: 'out > 0',
+    2: 'out == 0',
+    3: 'out >= 0',
+    4: 'out < 0',
+    5: 'out != 0',
+    6: 'out <= 0',
+    7: 'True',
+}
+
+###############################################################################
+
+# Generates the Python source of a function executing the instructions from
+# start up to (not including) end. Within the block, the value of A is
+# tracked while it is a known constant, so memory accesses and jump targets
+# following an A-instruction compile down to constant indices.
+def block_source(rom, start, end):
+    lines = ['def block(A, D, ram):']
+    known_a = None
+    for pc in range(start, end):
+        word = rom[pc] & 0xFFFF
+        lines.append(f'    # {pc}')
+
+        if not word & 0x8000:
+            lines.append(f'    A = {word}')
+            known_a = word
+            continue
+
+        address = (
+            f'A & {ADDRESS_MASK}' if known_a is None
+            else str(known_a & ADDRESS_MASK)
+        )
+        comp, dest, jump = (word >> 6) & 0x7F, (word >> 3) & 7, word & 7
+        expression = comp_expression(comp)
+        lines.append(f'    out = {expression.replace("M", f"ram[{address}]")}')
+        if dest & 1:
+            lines.append(f'    ram[{address}] = out')
+        if dest & 2:
+            lines.append('    D = out')
+        if jump:
+            lines.append(f'    target = {address}')
+        if dest & 4:
+            lines.append('    A = out')
+            known_a = None
+        if jump:
+            lines.append(f'    if {JUMP_CONDITIONS[jump]}:')
+            lines.append('        return A, D, target')
+
+    lines.append(f'    return A, D, {end}')
+    return '\n'.join(lines) + '\n'
+
+###############################################################################
+
+# Hack CPU that executes straight-line runs of ROM as compiled Python
+# functions. ROM is split into basic blocks at every address that may be
+# jumped to (the instruction after a jump and every A-instruction constant
+# inside the program), after every jump, and at breakpoints. Blocks are
+# compiled on first entry and cached by start address. Jumps to computed
+# addresses that are not leaders simply start a new block there.
+#
+# Cached blocks are tuples of the compiled function, taking and returning the
+# register state, the number of instructions it covers, and for blocks ending
+# in an unconditional jump, the address of that jump so that halt loops can
+# be detected.
+class JitCPU(HackCPU):
+    def load(self, rom):
+        super().load(rom)
+        self.invalidate()
+
+    # Drops every compiled block. Must be called after modifying rom or
+    # decoded directly; patch_rom does it automatically.
+    def invalidate(self):
+        self.blocks = {}
+        self.leaders = None
+        self.block_breakpoints = frozenset()
+
+    def patch_rom(self, address, word):
+        super().patch_rom(address, word)
+        self.invalidate()
+
+    def find_leaders(self):
+        decoded = self.decoded
+        end = len(decoded)
+        leaders = {0, *self.block_breakpoints}
+        for pc, (comp, dest, jump) in enumerate(decoded):
+            if comp is None:
+                if dest < end:
+                    leaders.add(dest)
+            elif jump:
+                leaders.add(pc + 1)
+        return leaders
+
+    def compile_block(self, start):
+        if self.leaders is None:
+            self.leaders = self.find_leaders()
+        decoded = self.decoded
+        leaders = self.leaders
+
+        # Extend the block up to and including the first jump, or until the
+        # next leader or the end of the program.
+        end = start
+        while end < len(decoded):
+            end += 1
+            if decoded[end - 1][2] or end in leaders:
+                break
+
+        namespace = {}
+        code = compile(block_source(self.rom, start, end), f'<block {start}>',
+                       'exec')
+        exec(code, namespace)
+
+        comp, dest, jump = decoded[end - 1]
+        halt_check = end - 1 if jump == 7 and not dest else None
+        block = (namespace['block'], end - start, halt_check)
+        self.blocks[start] = block
+        return block
+
+    # Same contract as HackCPU.run. Whole blocks are executed at a time; when
+    # the remaining cycle budget is smaller than the next block, execution
+    # finishes on the interpreter so that cycle limits are exact.
+    def run(self, max_cycles = None, breakpoints = ()):
+        breakpoints = frozenset(breakpoints)
+        if breakpoints != self.block_breakpoints:
+            self.invalidate()
+            self.block_breakpoints = breakpoints
+
+        decoded = self.decoded
+        ram = self.ram
+        blocks = self.blocks
+        a, d, pc = self.a, self.d, self.pc
+        end = len(decoded)
+        budget = -1 if max_cycles is None else max_cycles
+        cycles = 0
+
+        # The checks are made in the same order as in HackCPU.run, so both
+        # stop for the same reason when several apply at once.
+        while True:
+            if cycles == budget:
+                reason = CYCLE_LIMIT
+                break
+            if pc >= end:
+                reason = END_OF_PROGRAM
+                break
+            if breakpoints and cycles and pc in breakpoints:
+                reason = BREAKPOINT
+                break
+            function, length, halt_check = (
+                blocks.get(pc) or self.compile_block(pc)
+            )
+            if budget >= 0 and cycles + length > budget:
+                self.a, self.d, self.pc = a, d, pc
+                self.cycles += cycles
+                return HackCPU.run(self, budget - cycles, breakpoints)
+
+            a, d, pc = function(a, d, ram)
+            cycles += length
+
+            if halt_check is not None and (pc == halt_check or (
+                pc == halt_check - 1 and decoded[pc] == (None, pc, 0)
+            )):
+                reason = HALTED
+                break
+
+        self.a, self.d, self.pc = a, d, pc
+        self.cycles += cycles
+        return reason
@@ -0,0 +1,307 @@
+from syntaxtree import Node, NodeKind
+from tokenizer import TokenKind
+
+# Map from Jack binary operators to the VM commands implementing them.
+BINARY_OPS = {
+    '+': 'add',
+    '-': 'sub',
+    '*': 'call Math.multiply 2',
+    '/': 'call Math.divide 2',
+    '&': 'and',
+    '|': 'or',
+    '<': 'lt',
+    '>': 'gt',
+    '=': 'eq',
+}
+
+# Map from Jack unary operators to the VM commands implementing them.
+UNARY_OPS = {'-': 'neg', '~': 'not'}
+
+# Map from the kind of a variable to the VM segment it is stored in.
+SEGMENTS = {
+    'static'  : 'static',
+    'field'   : 'this',
+    'argument': 'argument',
+    'var'     : 'local',
+}
+
+
+# Symbol table for a single scope, mapping variable names to their type,
+# kind and index within the kind's segment.
+class SymbolTable:
+    def __init__(self):
+        self.symbols = {}
+        self.counts = {kind: 0 for kind in SEGMENTS}
+
+    def define(self, name: str, type: str, kind: str):
+        if name in self.symbols:
+            raise ValueError(f'Duplicate declaration of "{name}"')
+        self.symbols[name] = (type, kind, self.counts[kind])
+        self.counts[kind] += 1
+
+    def get(self, name: str):
+        return self.symbols.get(name)
+
+
+# Class to generate VM code from the Node of a Jack file. It walks the
+# tree built by compile_file directly, so the whole Jack to VM path happens in
+# one process without going through the XML output.
+class CodeGenerator:
+    def __init__(self):
+        self.lines = []
+        self.class_name = None
+        self.class_symbols = None
+        self.subroutine_name = None
+        self.subroutine_symbols = None
+        self.label_count = 0
+
+    # Entry function for converting a file's Node into VM code.
+    def generate(self, tree: Node):
+        for class_tree in tree.subtrees(NodeKind.CLASS):
+            self.generate_class(class_tree)
+        return '\n'.join(self.lines) + '\n'
+
+    def emit(self, command: str):
+        self.lines.append(command)
+
+    # Labels are prefixed with the function name, which makes them unique
+    # across the whole program as vmtranslator requires.
+    def new_label(self, kind: str):
+        label = f'{self.class_name}.{self.subroutine_name}${kind}'
+        label += str(self.label_count)
+        self.label_count += 1
+        return label
+
+    def lookup(self, name: str):
+        symbol = self.subroutine_symbols.get(name)
+        if symbol is None:
+            symbol = self.class_symbols.get(name)
+        return symbol
+
+    # Returns the VM segment and index of a variable in the current scope.
+    def resolve(self, name: str):
+        if (symbol := self.lookup(name)) is None:
+            raise ValueError(
+                f'Undefined variable "{name}" in '
+                f'{self.class_name}.{self.subroutine_name}'
+            )
+        type, kind, index = symbol
+        return f'{SEGMENTS[kind]} {index}'
+
+    def push_variable(self, name: str):
+        self.emit(f'push {self.resolve(name)}')
+
+    def pop_variable(self, name: str):
+        self.emit(f'pop {self.resolve(name)}')
+
+    # 'class' className '{' classVarDec* subroutineDec* '}'
+    def generate_class(self, tree: Node):
+        self.class_name = tree.values()[1]
+        self.class_symbols = SymbolTable()
+        for var_dec in tree.subtrees(NodeKind.CLASS_VAR_DEC):
+            kind, type, *names = var_dec.values()[ :-1]
+            for name in names[::2]:
+                self.class_symbols.define(name, type, kind)
+        for subroutine_dec in tree.subtrees(NodeKind.SUBROUTINE_DEC):
+            self.generate_subroutine(subroutine_dec)
+
+    # ('constructor' | 'function' | 'method') ('void' | type) subroutineName
+    # '(' parameterList ')' subroutineBody
+    def generate_subroutine(self, tree: Node):
+        kind, return_type, self.subroutine_name = tree.values()[ :3]
+        self.subroutine_symbols = SymbolTable()
+        self.label_count = 0
+
+        # Methods get the object they are called on as a hidden first argument.
+        if kind == 'method':
+            self.subroutine_symbols.define('this', self.class_name, 'argument')
+
+        # Parameters come in (type, name) pairs separated by ',' tokens.
+        parameter_list = tree.subtrees(NodeKind.PARAMETER_LIST)[0]
+        parameters = [
+            value for value in parameter_list.values() if value != ','
+        ]
+        for type, name in zip(parameters[::2], parameters[1::2]):
+            self.subroutine_symbols.define(name, type, 'argument')
+
+        body = tree.subtrees(NodeKind.SUBROUTINE_BODY)[0]
+        for var_dec in body.subtrees(NodeKind.VAR_DEC):
+            type, *names = var_dec.values()[1:-1]
+            for name in names[::2]:
+                self.subroutine_symbols.define(name, type, 'var')
+
+        num_locals = self.subroutine_symbols.counts['var']
+        self.emit(f'function {self.class_name}.{self.subroutine_name} '
+                  f'{num_locals}')
+
+        # Constructors allocate the object, methods anchor the this segment.
+        if kind == 'constructor':
+            self.emit(f'push constant {self.class_symbols.counts["field"]}')
+            self.emit('call Memory.alloc 1')
+            self.emit('pop pointer 0')
+        elif kind == 'method':
+            self.emit('push argument 0')
+            self.emit('pop pointer 0')
+
+        self.generate_statements(body.subtrees(NodeKind.STATEMENTS)[0])
+
+    # statement*
+    def generate_statements(self, tree: Node):
+        for statement in tree.children:
+            if statement.kind is NodeKind.LET_STATEMENT:
+                self.generate_let_statement(statement)
+            elif statement.kind is NodeKind.IF_STATEMENT:
+                self.generate_if_statement(statement)
+            elif statement.kind is NodeKind.WHILE_STATEMENT:
+                self.generate_while_statement(statement)
+            elif statement.kind is NodeKind.DO_STATEMENT:
+                self.generate_do_statement(statement)
+            elif statement.kind is NodeKind.RETURN_STATEMENT:
+                self.generate_return_statement(statement)
+
+    # 'let' varName ('[' expression ']')? '=' expression ';'
+    def generate_let_statement(self, tree: Node):
+        name = tree.values()[1]
+        expressions = tree.subtrees(NodeKind.EXPRESSION)
+
+        # For an array element, compute the target address first, and only
+        # set the that segment after evaluating the value, since the value
+        # may itself access an array.
+        if len(expressions) == 2:
+            self.push_variable(name)
+            self.generate_expression(expressions[0])
+            self.emit('add')
+            self.generate_expression(expressions[1])
+            self.emit('pop temp 0')
+            self.emit('pop pointer 1')
+            self.emit('push temp 0')
+            self.emit('pop that 0')
+        else:
+            self.generate_expression(expressions[0])
+            self.pop_variable(name)
+
+    # 'if' '(' expression ')' '{' statements '}' ('else' '{' statements '}')?
+    def generate_if_statement(self, tree: Node):
+        condition = tree.subtrees(NodeKind.EXPRESSION)[0]
+        branches = tree.subtrees(NodeKind.STATEMENTS)
+        else_label = self.new_label('IF_ELSE')
+
+        self.generate_expression(condition)
+        self.emit('not')
+        self.emit(f'if-goto {else_label}')
+        self.generate_statements(branches[0])
+        if len(branches) == 2:
+            end_label = self.new_label('IF_END')
+            self.emit(f'goto {end_label}')
+            self.emit(f'label {else_label}')
+            self.generate_statements(branches[1])
+            self.emit(f'label {end_label}')
+        else:
+            self.emit(f'label {else_label}')
+
+    # 'while' '(' expression ')' '{' statements '}'
+    def generate_while_statement(self, tree: Node):
+        start_label = self.new_label('WHILE_EXP')
+        end_label = self.new_label('WHILE_END')
+
+        self.emit(f'label {start_label}')
+        self.generate_expression(tree.subtrees(NodeKind.EXPRESSION)[0])
+        self.emit('not')
+        self.emit(f'if-goto {end_label}')
+        self.generate_statements(tree.subtrees(NodeKind.STATEMENTS)[0])
+        self.emit(f'goto {start_label}')
+        self.emit(f'label {end_label}')
+
+    # 'do' subroutineCall ';'
+    def generate_do_statement(self, tree: Node):
+        call = tree.subtrees(NodeKind.SUBROUTINE_CALL)[0]
+        self.generate_subroutine_call(call)
+        self.emit('pop temp 0')
+
+    # 'return' expression? ';'
+    def generate_return_statement(self, tree: Node):
+        if expressions := tree.subtrees(NodeKind.EXPRESSION):
+            self.generate_expression(expressions[0])
+        else:
+            self.emit('push constant 0')
+        self.emit('return')
+
+    # term (op term)*
+    def generate_expression(self, tree: Node):
+        children = tree.values()
+        self.generate_term(children[0])
+        for op, term in zip(children[1::2], children[2::2]):
+            self.generate_term(term)
+            self.emit(BINARY_OPS[op])
+
+    # integerConstant | stringConstant | keywordConstant | varName | varName
+    # '[' expression ']' | subroutineCall | '(' expression ')' | unaryOp term
+    def generate_term(self, tree: Node):
+        first, *rest = tree.children
+
+        if type(first) is Node:
+            self.generate_subroutine_call(first)
+
+        elif first.kind == TokenKind.INTEGER_CONSTANT:
+            if first.value > 32767:
+                raise ValueError(f'Integer constant too large "{first.value}"')
+            self.emit(f'push constant {first.value}')
+
+        elif first.kind == TokenKind.STRING_CONSTANT:
+            self.emit(f'push constant {len(first.value)}')
+            self.emit('call String.new 1')
+            for char in first.value:
+                self.emit(f'push constant {ord(char)}')
+                self.emit('call String.appendChar 2')
+
+        elif first.kind == TokenKind.KEYWORD:
+            if first.value == 'true':
+                self.emit('push constant 1')
+                self.emit('neg')
+            elif first.value == 'this':
+                self.emit('push pointer 0')
+            else:
+                self.emit('push constant 0')
+
+        elif first.kind == TokenKind.IDENTIFIER:
+            self.push_variable(first.value)
+            if rest:
+                self.generate_expression(rest[1])
+                self.emit('add')
+                self.emit('pop pointer 1')
+                self.emit('push that 0')
+
+        elif first.value == '(':
+            self.generate_expression(rest[0])
+
+        else:
+            self.generate_term(rest[0])
+            self.emit(UNARY_OPS[first.value])
+
+    # subroutineName '(' expressionList ')' |
+    # (className | varName) '.' subroutineName '(' expressionList ')'
+    def generate_subroutine_call(self, tree: Node):
+        children = tree.values()
+        expression_list = tree.subtrees(NodeKind.EXPRESSION_LIST)[0]
+        arguments = expression_list.subtrees(NodeKind.EXPRESSION)
+        num_args = len(arguments)
+
+        # A call without a qualifier is a method call on the current object.
+        if children[1] != '.':
+            self.emit('push pointer 0')
+            function = f'{self.class_name}.{children[0]}'
+            num_args += 1
+
+        # A call qualified by a variable is a method call on that object,
+        # anything else is a function or constructor call on a class.
+        elif (symbol := self.lookup(children[0])) is not None:
+            self.push_variable(children[0])
+            function = f'{symbol[0]}.{children[2]}'
+            num_args += 1
+
+        else:
+            function = f'{children[0]}.{children[2]}'
+
+        for argument in arguments:
+            self.generate_expression(argument)
+        self.emit(f'call {function} {num_args}')
@@ -1,4 +1,5 @@
-from tokenizer import TokenList
+from syntaxtree import Node, NodeKind
+from tokenizer import TokenKind, TokenList
 
 # Set of all the native types in the Jack grammar.
 TYPES = {'int', 'char', 'boolean'}
@@ -6,75 +7,43 @@ TYPES = {'int', 'char', 'boolean'}
 # Set of all the statement keywords in the Jack grammar.
 STATEMENTS = {'let', 'if', 'while', 'do', 'return'}
 
+# Set of all the keywords starting class member declarations.
+MEMBERS = {'static', 'field', 'constructor', 'function', 'method'}
+
 # Set of all the operators in the Jack grammar.
 OPS = {'+', '-', '*', '/', '&', '|', '<', '>', '='}
 
-# Set of all the non-terminals in the XML output spec.
-NON_TERMINALS = {
-    'class', 'classVarDec', 'subroutineDec', 'parameterList', 'subroutineBody',
-    'varDec', 'statements', 'whileStatement', 'ifStatement', 'returnStatement',
-    'letStatement', 'doStatement', 'expression', 'term', 'expressionList'
-}
-
-# Recursive class to form a parse tree of the compiled tokens.
-class ParseTree:
-    def __init__(self):
-        self.children = []
-
-    def add_token(self, token):
-        self.children.append((token.type, token.value))
-
-    def add_subtree(self, tag, tree):
-        self.children.append((tag, tree))
-
-    def as_xml(self, indent_level = 2, to_spec = False):
-        string = ''
-        padding = ' ' * indent_level
-        for tag, value in self.children:
-            if type(value) is ParseTree:                    
-                value = value.as_xml(indent_level, to_spec)
-                if to_spec and tag not in NON_TERMINALS:
-                    string += value
-                else:
-                    value = value.replace('\n', '\n' + padding)
-                    string += f'\n<{tag}>{value}\n</{tag}>'
-            else:
-                if to_spec and type(value) is str:
-                    value = value.replace('&', '&amp;')
-                    value = value.replace('<', '&lt;')
-                    value = value.replace('>', '&gt;')
-                    value = value.replace('"', '&quot;')
-                string += f'\n<{tag}> {value} </{tag}>'
-        return string
 
-    def __str__(self):
-        return self.as_xml()
+# Raised when the end of the file is reached while recovering from a syntax
+# error, to stop parsing the file.
+class UnrecoverableError(Exception):
+    pass
 
 
 # Helper function for eating an identifier.
-def eat_identifier_helper(tokens: TokenList, tree: ParseTree):
-    if (token := tokens.pop()).type == 'identifier':
-        tree.add_token(token)
+def eat_identifier_helper(tokens: TokenList, tree: Node):
+    if (token := tokens.pop()).kind == TokenKind.IDENTIFIER:
+        tree.add(token)
     else:
         tokens.error(ValueError(f'Invalid identifier "{token.value}"'))
 
 
 # Helper function for eating an expected symbol.
-def eat_symbol_helper(tokens: TokenList, tree: ParseTree, symbol: str):
+def eat_symbol_helper(tokens: TokenList, tree: Node, symbol: str):
     if (token := tokens.pop()).value == symbol:
-        tree.add_token(token)
+        tree.add(token)
     else:
         tokens.error(ValueError(f'Expected "{symbol}"'))
 
 
 # Helper function for compiling variable declarations.
-def variable_declaration_helper(tokens: TokenList, tree: ParseTree):
+def variable_declaration_helper(tokens: TokenList, tree: Node):
 
     # Eat the keyword or identifier indicating the type of the variable.
     if (token := tokens.pop()).value in TYPES:
-        tree.add_token(token)
-    elif token.type == 'identifier':
-        tree.add_token(token)
+        tree.add(token)
+    elif token.kind == TokenKind.IDENTIFIER:
+        tree.add(token)
     else:
         tokens.error(ValueError(f'Invalid type "{token.value}"'))
 
@@ -85,51 +54,138 @@ def variable_declaration_helper(tokens: TokenList, tree: ParseTree):
     # that indicate additional variables being declared.
     while (token := tokens.pop()).value != ';':
         if token.value == ',':
-            tree.add_token(token)
+            tree.add(token)
         else:
             tokens.error(ValueError('Expected "," or ";"'))
         eat_identifier_helper(tokens, tree)
 
     # Add the ';' token indicating the end of the statement.
-    tree.add_token(token)
+    tree.add(token)
 
 
 # Helper function for compiling curly bracketed statements.
-def bracketed_statements_helper(tokens: TokenList, tree: ParseTree):
+def bracketed_statements_helper(tokens: TokenList, tree: Node):
 
     # Eat the '{' token indicating the start of the statement body.
     eat_symbol_helper(tokens, tree, '{')
 
     # Eat the statements.
-    tree.add_subtree('statements', compile_statements(tokens))
+    tree.add(compile_statements(tokens))
 
     # Eat the '}' token indicating the end of the statement body.
     eat_symbol_helper(tokens, tree, '}')
 
 
-# Entry function for converting a TokenList into a ParseTree.
+# Helper function for recording a syntax error in the diagnostics list of the
+# TokenList. Without a diagnostics list, the error is raised again.
+def record_error_helper(tokens: TokenList, error: ValueError):
+    if tokens.diagnostics is None:
+        raise error
+    tokens.diagnostics.append(str(error))
+
+
+# Helper function for the start of recovery. The parser checks each token
+# after popping it, so the token in error has already been popped. It is put
+# back, so that recovery looks at it too, and a '{', '}', ';' or keyword it
+# stops at is not lost. When the code has ended, or the scanner has stopped
+# at an error in the tokens themselves, there is nothing left to recover to.
+def unpop_error_token_helper(tokens: TokenList):
+
+    # Getting past the EOF token raises an IndexError, like in the tokenizer.
+    try:
+        if tokens.get().kind == TokenKind.EOF:
+            raise UnrecoverableError()
+    except IndexError:
+        raise UnrecoverableError()
+    tokens.unpop()
+
+
+# Helper function for recovering from a syntax error in a statement or
+# variable declaration. The error is recorded, and tokens are skipped up to a
+# ';', which is eaten, or a '}' or statement keyword, which are left for the
+# caller to continue parsing from. Blocks opened by a skipped '{' are skipped
+# as a whole, so that the rest of a broken if or while statement is not taken
+# for the enclosing statements.
+def recover_helper(tokens: TokenList, error: ValueError):
+    record_error_helper(tokens, error)
+    unpop_error_token_helper(tokens)
+
+    # Popping past the EOF token raises an IndexError, like in the tokenizer.
+    depth = 0
+    try:
+        while (token := tokens.get()).kind != TokenKind.EOF:
+            if token.kind == TokenKind.SYMBOL:
+                if token.value == '{':
+                    depth += 1
+                elif token.value == '}':
+                    if depth == 0:
+                        return
+                    depth -= 1
+                elif token.value == ';' and depth == 0:
+                    tokens.pop()
+                    return
+            elif token.kind == TokenKind.KEYWORD and depth == 0:
+                if token.value in STATEMENTS:
+                    return
+            tokens.pop()
+    except IndexError:
+        pass
+    raise UnrecoverableError()
+
+
+# Helper function for recovering from a syntax error in a class member. The
+# error is recorded, and tokens are skipped up to the keyword starting the
+# next member, which only appear at the class level.
+def recover_member_helper(tokens: TokenList, error: ValueError):
+    record_error_helper(tokens, error)
+    unpop_error_token_helper(tokens)
+
+    # Popping past the EOF token raises an IndexError, like in the tokenizer.
+    try:
+        while (token := tokens.get()).kind != TokenKind.EOF:
+            if token.kind == TokenKind.KEYWORD and token.value in MEMBERS:
+                return
+            tokens.pop()
+    except IndexError:
+        pass
+    raise UnrecoverableError()
+
+
+# Entry function for converting a TokenList into a Node. If the TokenList has
+# a diagnostics list, syntax errors are recorded in it and parsing carries on
+# after them, and the returned tree leaves out the parts in error.
 def compile_file(tokens: TokenList):
-    tree = ParseTree()
-
-    # Look for class declarations.
-    while tokens.get().value == 'class':
-        tree.add_subtree('class', compile_class(tokens))
-
-    # If anything but a class declaration is encountered before the end of the
-    # file is reached, raise an error.
-    if tokens.pop().type != 'eof':
-        tokens.error(ValueError('All top level declarations must be classes'))
+    tree = Node(NodeKind.FILE)
+
+    try:
+        # Look for class declarations.
+        while tokens.get().value == 'class':
+            tree.add(compile_class(tokens))
+
+        # If anything but a class declaration is encountered before the end of
+        # the file is reached, raise an error.
+        if tokens.pop().kind != TokenKind.EOF:
+            tokens.error(
+                ValueError('All top level declarations must be classes')
+            )
+
+    # Errors outside of any class member cannot be recovered from, and end
+    # the parse in recovery mode.
+    except ValueError as error:
+        record_error_helper(tokens, error)
+    except UnrecoverableError:
+        pass
 
     return tree
 
 
 # 'class' className '{' classVarDec* subroutineDec* '}'
 def compile_class(tokens: TokenList):
-    tree = ParseTree()
+    tree = Node(NodeKind.CLASS)
 
     # Eat the 'class' keyword at the top of the list.
     if (token := tokens.pop()).value == 'class':
-        tree.add_token(token)
+        tree.add(token)
     else:
         tokens.error(ValueError(f'Invalid class declaration'))
 
@@ -142,12 +198,17 @@ def compile_class(tokens: TokenList):
     # Look for keywords indicating a class variable or subroutine declaration 
     # and call the appropriate compile function.
     while (token := tokens.get()).value != '}':
-        if token.value in ('static', 'field'):
-            tree.add_subtree('classVarDec', compile_class_var_dec(tokens))
-        elif token.value in ('constructor', 'function', 'method'):
-            tree.add_subtree('subroutineDec', compile_subroutine_dec(tokens))
-        else:
-            tokens.error(ValueError(f'Unexpected token "{tokens.pop().value}"'))
+        try:
+            if token.value in ('static', 'field'):
+                tree.add(compile_class_var_dec(tokens))
+            elif token.value in ('constructor', 'function', 'method'):
+                tree.add(compile_subroutine_dec(tokens))
+            else:
+                tokens.error(
+                    ValueError(f'Unexpected token "{tokens.pop().value}"')
+                )
+        except ValueError as error:
+            recover_member_helper(tokens, error)
 
     # Eat the '}' token indicating the end of the class body.
     eat_symbol_helper(tokens, tree, '}')
@@ -157,11 +218,11 @@ def compile_class(tokens: TokenList):
 
 # ('static' | 'field') type varName (',' varName)* ';'
 def compile_class_var_dec(tokens: TokenList):
-    tree = ParseTree()
+    tree = Node(NodeKind.CLASS_VAR_DEC)
 
     # Eat the keyword indicating whether the variable is static or not.
     if (token := tokens.pop()).value in ('static', 'field'):
-        tree.add_token(token)
+        tree.add(token)
     else:
         tokens.error(ValueError('Invalid class variable declaration'))
 
@@ -174,19 +235,19 @@ def compile_class_var_dec(tokens: TokenList):
 # ('constructor' | 'function' | 'method') ('void' | type) subroutineName
 # '(' parameterList ')' subroutineBody
 def compile_subroutine_dec(tokens: TokenList):
-    tree = ParseTree()
+    tree = Node(NodeKind.SUBROUTINE_DEC)
 
     # Eat the keyword indicating the type of this subroutine.
     if (token := tokens.pop()).value in ('constructor', 'function', 'method'):
-        tree.add_token(token)
+        tree.add(token)
     else:
         tokens.error(ValueError(f'Invalid subroutine declaration'))
 
     # Eat the keyword or identifier indicating the return value type.
     if (token := tokens.pop()).value in ('void', *TYPES):
-        tree.add_token(token)
-    elif token.type == 'identifier':
-        tree.add_token(token)
+        tree.add(token)
+    elif token.kind == TokenKind.IDENTIFIER:
+        tree.add(token)
     else:
         tokens.error(ValueError(f'Invalid type "{token.value}"'))
 
@@ -197,27 +258,27 @@ def compile_subroutine_dec(tokens: TokenList):
     eat_symbol_helper(tokens, tree, '(')
 
     # Eat the parameterList.
-    tree.add_subtree('parameterList', compile_parameter_list(tokens))
+    tree.add(compile_parameter_list(tokens))
 
     # Eat the ')' token indicating the end of the parameterList.
     eat_symbol_helper(tokens, tree, ')')
 
     # Eat the subroutineBody.
-    tree.add_subtree('subroutineBody', compile_subroutine_body(tokens))
+    tree.add(compile_subroutine_body(tokens))
 
     return tree
 
 
 # ((type varName) (',' type varName)*)?
 def compile_parameter_list(tokens: TokenList):
-    tree = ParseTree()
+    tree = Node(NodeKind.PARAMETER_LIST)
 
     # Check if the next token is a keyword or identifier indicating the type
     # of a parameter. If it is, eat it and then eat the identifier representing
     # the parameter's name. Else, only a ')' token is valid.
     token = tokens.get()
-    if token.value in TYPES or token.type == 'identifier':
-        tree.add_token(tokens.pop())
+    if token.value in TYPES or token.kind == TokenKind.IDENTIFIER:
+        tree.add(tokens.pop())
         eat_identifier_helper(tokens, tree)
     elif token.value != ')':
         tokens.error(ValueError(f'Invalid type "{tokens.pop().value}"'))
@@ -226,13 +287,13 @@ def compile_parameter_list(tokens: TokenList):
     # a keyword or identifier, and a final identifier indicating a parameter.
     while tokens.get().value != ')':
         if (token := tokens.pop()).value == ',':
-            tree.add_token(token)
+            tree.add(token)
         else:
             tokens.error(ValueError('Expected "," or ")"'))
         if (token := tokens.pop()).value in TYPES:
-            tree.add_token(token)
-        elif token.type == 'identifier':
-            tree.add_token(token)
+            tree.add(token)
+        elif token.kind == TokenKind.IDENTIFIER:
+            tree.add(token)
         else:
             tokens.error(ValueError(f'Invalid type "{token.value}"'))
         eat_identifier_helper(tokens, tree)
@@ -242,7 +303,7 @@ def compile_parameter_list(tokens: TokenList):
 
 # '{' varDec* statements '}'
 def compile_subroutine_body(tokens: TokenList):
-    tree = ParseTree()
+    tree = Node(NodeKind.SUBROUTINE_BODY)
 
     # Eat the '{' token indicating the start of the subroutine body.
     eat_symbol_helper(tokens, tree, '{')
@@ -250,10 +311,13 @@ def compile_subroutine_body(tokens: TokenList):
     # While the next token is the 'var' keyword, we are still in the varDec
     # area of the body, so call the appropriate compile function.
     while tokens.get().value == 'var':
-        tree.add_subtree('varDec', compile_var_dec(tokens))
+        try:
+            tree.add(compile_var_dec(tokens))
+        except ValueError as error:
+            recover_helper(tokens, error)
 
     # Eat the statements.
-    tree.add_subtree('statements', compile_statements(tokens))
+    tree.add(compile_statements(tokens))
 
     # Eat the '}' token indicating the end of the subroutine body.
     eat_symbol_helper(tokens, tree, '}')
@@ -263,11 +327,11 @@ def compile_subroutine_body(tokens: TokenList):
 
 # 'var' type varName (',' varName)* ';'
 def compile_var_dec(tokens: TokenList):
-    tree = ParseTree()
+    tree = Node(NodeKind.VAR_DEC)
 
     # Eat the 'var' keyword at the top of the list.
     if (token := tokens.pop()).value == 'var':
-        tree.add_token(token)
+        tree.add(token)
     else:
         tokens.error(ValueError(f'Invalid variable declaration'))
 
@@ -279,34 +343,39 @@ def compile_var_dec(tokens: TokenList):
 
 # statement*
 def compile_statements(tokens: TokenList):
-    tree = ParseTree()
+    tree = Node(NodeKind.STATEMENTS)
 
     # Until the next token is '}', look for keywords indicating a statement and
     # call the appropriate compile function.
     while (token := tokens.get()).value in STATEMENTS:
-        if token.value == 'let':
-            tree.add_subtree('letStatement', compile_let_statement(tokens))
-        elif token.value == 'if':
-            tree.add_subtree('ifStatement', compile_if_statement(tokens))
-        elif token.value == 'while':
-            tree.add_subtree('whileStatement', compile_while_statement(tokens))
-        elif token.value == 'do':
-            tree.add_subtree('doStatement', compile_do_statement(tokens))
-        elif token.value == 'return':
-            tree.add_subtree('returnStatement', compile_return_statement(tokens))
-        else:
-            tokens.error(ValueError(f'Unexpected token "{tokens.pop().value}"'))
+        try:
+            if token.value == 'let':
+                tree.add(compile_let_statement(tokens))
+            elif token.value == 'if':
+                tree.add(compile_if_statement(tokens))
+            elif token.value == 'while':
+                tree.add(compile_while_statement(tokens))
+            elif token.value == 'do':
+                tree.add(compile_do_statement(tokens))
+            elif token.value == 'return':
+                tree.add(compile_return_statement(tokens))
+            else:
+                tokens.error(
+                    ValueError(f'Unexpected token "{tokens.pop().value}"')
+                )
+        except ValueError as error:
+            recover_helper(tokens, error)
 
     return tree
 
 
 # 'let' varName ('[' expression ']')? '=' expression ';'
 def compile_let_statement(tokens: TokenList):
-    tree = ParseTree()
+    tree = Node(NodeKind.LET_STATEMENT)
     
     # Eat the 'let' keyword at the top of the list.
     if (token := tokens.pop()).value == 'let':
-        tree.add_token(token)
+        tree.add(token)
     else:
         tokens.error(ValueError(f'Invalid let statement'))
 
@@ -315,15 +384,15 @@ def compile_let_statement(tokens: TokenList):
 
     # Check for a '[' token indicating an array access.
     if tokens.get().value == '[':
-        tree.add_token(tokens.pop())
-        tree.add_subtree('expression', compile_expression(tokens))
+        tree.add(tokens.pop())
+        tree.add(compile_expression(tokens))
         eat_symbol_helper(tokens, tree, ']')
 
     # Eat the '=' token that is part of the syntax.
     eat_symbol_helper(tokens, tree, '=')
 
     # Eat the expression being assigned.
-    tree.add_subtree('expression', compile_expression(tokens))
+    tree.add(compile_expression(tokens))
 
     # Eat the ';' token indicating the end of the statement.
     eat_symbol_helper(tokens, tree, ';')
@@ -333,11 +402,11 @@ def compile_let_statement(tokens: TokenList):
 
 # 'if' '(' expression ')' '{' statements '}' ('else' '{' statements '}')?
 def compile_if_statement(tokens: TokenList):
-    tree = ParseTree()
+    tree = Node(NodeKind.IF_STATEMENT)
 
     # Eat the 'if' keyword at the top of the list.
     if (token := tokens.pop()).value == 'if':
-        tree.add_token(token)
+        tree.add(token)
     else:
         tokens.error(ValueError(f'Invalid if statement'))
 
@@ -345,7 +414,7 @@ def compile_if_statement(tokens: TokenList):
     eat_symbol_helper(tokens, tree, '(')
 
     # Eat the expression representing the condition.
-    tree.add_subtree('expression', compile_expression(tokens))
+    tree.add(compile_expression(tokens))
 
     # Eat the ')' token indicating the end of the condition.
     eat_symbol_helper(tokens, tree, ')')
@@ -355,7 +424,7 @@ def compile_if_statement(tokens: TokenList):
 
     # Check next token to see if there is an else condition.
     if tokens.get().value == 'else':
-        tree.add_token(tokens.pop())
+        tree.add(tokens.pop())
         bracketed_statements_helper(tokens, tree)
 
     return tree
@@ -363,11 +432,11 @@ def compile_if_statement(tokens: TokenList):
 
 # 'while' '(' expression ')' '{' statements '}'
 def compile_while_statement(tokens: TokenList):
-    tree = ParseTree()
+    tree = Node(NodeKind.WHILE_STATEMENT)
 
     # Eat the 'while' keyword at the top of the list.
     if (token := tokens.pop()).value == 'while':
-        tree.add_token(token)
+        tree.add(token)
     else:
         tokens.error(ValueError(f'Invalid while statement'))
 
@@ -375,7 +444,7 @@ def compile_while_statement(tokens: TokenList):
     eat_symbol_helper(tokens, tree, '(')
 
     # Eat the expression representing the condition.
-    tree.add_subtree('expression', compile_expression(tokens))
+    tree.add(compile_expression(tokens))
 
     # Eat the ')' token indicating the end of the condition.
     eat_symbol_helper(tokens, tree, ')')
@@ -388,16 +457,16 @@ def compile_while_statement(tokens: TokenList):
 
 # 'do' subroutineCall ';'
 def compile_do_statement(tokens: TokenList):
-    tree = ParseTree()
+    tree = Node(NodeKind.DO_STATEMENT)
 
     # Eat the 'do' keyword at the top of the list.
     if (token := tokens.pop()).value == 'do':
-        tree.add_token(token)
+        tree.add(token)
     else:
         tokens.error(ValueError(f'Invalid do statement'))
 
     # Eat the subroutine call.
-    tree.add_subtree('subroutineCall', compile_subroutine_call(tokens))
+    tree.add(compile_subroutine_call(tokens))
 
     # Eat the ';' token indicating the end of the statement.
     eat_symbol_helper(tokens, tree, ';')
@@ -407,17 +476,17 @@ def compile_do_statement(tokens: TokenList):
 
 # 'return' expression? ';'
 def compile_return_statement(tokens: TokenList):
-    tree = ParseTree()
+    tree = Node(NodeKind.RETURN_STATEMENT)
 
     # Eat the 'return' keyword at the top of the list.
     if (token := tokens.pop()).value == 'return':
-        tree.add_token(token)
+        tree.add(token)
     else:
         tokens.error(ValueError(f'Invalid return statement'))
 
     # Eat the optional expression.
     if tokens.get().value != ';':
-        tree.add_subtree('expression', compile_expression(tokens))
+        tree.add(compile_expression(tokens))
 
     # Eat the ';' token indicating the end of the statement.
     eat_symbol_helper(tokens, tree, ';')
@@ -427,15 +496,15 @@ def compile_return_statement(tokens: TokenList):
 
 # term (op term)*
 def compile_expression(tokens: TokenList):
-    tree = ParseTree()
+    tree = Node(NodeKind.EXPRESSION)
 
     # Eat the first term.
-    tree.add_subtree('term', compile_term(tokens))
+    tree.add(compile_term(tokens))
 
     # While the next token is an operator, eat it and the following term.
     while tokens.get().value in OPS:
-        tree.add_token(tokens.pop())
-        tree.add_subtree('term', compile_term(tokens))
+        tree.add(tokens.pop())
+        tree.add(compile_term(tokens))
 
     return tree
 
@@ -443,40 +512,42 @@ def compile_expression(tokens: TokenList):
 # integerConstant | stringConstant | keywordConstant | varName | varName 
 # '[' expression ']' | subroutineCall | '(' expression ')' | unaryOp term
 def compile_term(tokens: TokenList):
-    tree = ParseTree()
+    tree = Node(NodeKind.TERM)
 
     # If the next token is a literal, it can be eaten as is.
-    if (token := tokens.get()).type in ('integerConstant', 'stringConstant'):
-        tree.add_token(tokens.pop())
+    if (token := tokens.get()).kind in (
+        TokenKind.INTEGER_CONSTANT, TokenKind.STRING_CONSTANT
+    ):
+        tree.add(tokens.pop())
 
     # If the next token is a keyword constant, it can be eaten as is.
     elif token.value in ('true', 'false', 'null', 'this'):
-        tree.add_token(tokens.pop())
+        tree.add(tokens.pop())
 
     # If the next token is an identifier, it may be a variable name, an array
     # access, or a subroutine call to one which may be in another class. Look
     # ahead to the next to next token to determine what it is.
-    elif token.type == 'identifier':
+    elif token.kind == TokenKind.IDENTIFIER:
         if (n2n_token := tokens.get(1)).value == '[':
-            tree.add_token(tokens.pop())
-            tree.add_token(tokens.pop())
-            tree.add_subtree('expression', compile_expression(tokens))
+            tree.add(tokens.pop())
+            tree.add(tokens.pop())
+            tree.add(compile_expression(tokens))
             eat_symbol_helper(tokens, tree, ']')
         elif n2n_token.value in ('(', '.'):
-            tree.add_subtree('subroutineCall', compile_subroutine_call(tokens))
+            tree.add(compile_subroutine_call(tokens))
         else:
-            tree.add_token(tokens.pop())
+            tree.add(tokens.pop())
 
     # If the next token is '(', it must indicate a paranthesized expression.
     elif token.value == '(':
-        tree.add_token(tokens.pop())
-        tree.add_subtree('expression', compile_expression(tokens))
+        tree.add(tokens.pop())
+        tree.add(compile_expression(tokens))
         eat_symbol_helper(tokens, tree, ')')
 
     # If the next token is a unary operator, it must be followed by a term.
     elif token.value in ('-', '~'):
-        tree.add_token(tokens.pop())
-        tree.add_subtree('term', compile_term(tokens))
+        tree.add(tokens.pop())
+        tree.add(compile_term(tokens))
 
     # If the next token is none of these, raise an error.
     else:
@@ -488,7 +559,7 @@ def compile_term(tokens: TokenList):
 # subroutineName '(' expressionList ')' | 
 # (className | varName) '.' subroutineName '(' expressionList ')'
 def compile_subroutine_call(tokens: TokenList):
-    tree = ParseTree()
+    tree = Node(NodeKind.SUBROUTINE_CALL)
 
     # Eat the identifier representing the name of the subroutine/class/object.
     eat_identifier_helper(tokens, tree)
@@ -496,14 +567,14 @@ def compile_subroutine_call(tokens: TokenList):
     # If the next token is '.', the last identifier represented a class/object.
     # Eat it and the identifier representing the name of the subroutine.
     if tokens.get().value == '.':
-        tree.add_token(tokens.pop())
+        tree.add(tokens.pop())
         eat_identifier_helper(tokens, tree)
 
     # Eat the '(' token indicating the start of the expressionList.
     eat_symbol_helper(tokens, tree, '(')
 
     # Eat the expressionList.
-    tree.add_subtree('expressionList', compile_expression_list(tokens))
+    tree.add(compile_expression_list(tokens))
 
     # Eat the ')' token indicating the end of the expressionList.
     eat_symbol_helper(tokens, tree, ')')
@@ -513,19 +584,19 @@ def compile_subroutine_call(tokens: TokenList):
 
 # (expression (',' expression)* )?
 def compile_expression_list(tokens: TokenList):
-    tree = ParseTree()
+    tree = Node(NodeKind.EXPRESSION_LIST)
 
     # If the next token is not ')', eat the first expression.
     if tokens.get().value != ')':
-        tree.add_subtree('expression', compile_expression(tokens))
+        tree.add(compile_expression(tokens))
 
     # Look to see if the next token is ')'. If it is not, eat a ',' token,
     # and the following expression. Repeat.
     while tokens.get().value != ')':
         if (token := tokens.pop()).value == ',':
-            tree.add_token(token)
+            tree.add(token)
         else:
             tokens.error(ValueError('Expected "," or ")"'))
-        tree.add_subtree('expression', compile_expression(tokens))
+        tree.add(compile_expression(tokens))
 
     return tree
@@ -1,22 +1,113 @@
+import argparse
+import io
 import os
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from functools import partial
 
+# The profiler is shared by all the tools, from a sibling directory.
+sys.path.insert(0, os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', 'profiling'
+))
+
+import profiler
+from codegen import CodeGenerator
 from compengine import compile_file
-from tokenizer import TokenList
+from profiler import NULL_PROFILE
+from tokenizer import RegexTokenList, TokenList, TokenStream
+
+# Map from the names of the tokenizer engines to their TokenList classes.
+TOKENIZERS = {
+    'regex' : RegexTokenList,
+    'loop'  : TokenList,
+    'stream': TokenStream,
+}
+
+
+# Compiles a single .jack file into its .xml parse tree, or its .vm code, and
+# returns it along with the list of errors found and the profile. Normally
+# compiling stops at the first error. In recovery mode, parsing carries on
+# after syntax errors to find all of them. If there are any errors, no output
+# is returned. With an output_path, the output is written straight to that
+# file instead. Used as the unit of work for the process pool, so it only
+# takes and returns picklable values.
+def analyze_file(target_path, tokenizer = 'regex', vm = False,
+                 recover = False, output_path = None, profile = NULL_PROFILE):
+    with profile:
+        with profile.stage('read'):
+            with open(target_path, 'r') as f:
+                target_contents = f.read()
+        if profile:
+            profile.count('lines', target_contents.count('\n'))
+        diagnostics = [] if recover else None
+
+        # Tokenize the code and generate the parse tree, and the VM code from
+        # it if requested. The stream tokenizer scans as the parser reads, so
+        # its tokenize stage only sets it up.
+        try:
+            with profile.stage('tokenize'):
+                token_list = TOKENIZERS[tokenizer](target_contents)
+            token_list.diagnostics = diagnostics
+            with profile.stage('parse'):
+                parse_tree = compile_file(token_list)
+            if profile and hasattr(token_list, 'tokens'):
+                profile.count('tokens', len(token_list.tokens) - 1)
+            if diagnostics:
+                return None, diagnostics, profile
+            if vm:
+                with profile.stage('codegen'):
+                    vm_code = CodeGenerator().generate(parse_tree)
+        except ValueError as exc:
+            return None, (diagnostics or []) + [str(exc)], profile
+
+        # The XML is serialized from the tree as it is written.
+        with profile.stage('write'):
+            with open(output_path, 'w') if output_path else io.StringIO() as f:
+                if vm:
+                    f.write(vm_code)
+                else:
+                    parse_tree.write_xml(f, 2, True)
+                output = None if output_path else f.getvalue()
+
+    return output, [], profile
 
 
 def main():
-    # Get the target directory from the command line args.
-    input_path = sys.argv[1]
+    # Get the target path and options from the command line args.
+    parser = argparse.ArgumentParser(description='Jack analyzer and compiler')
+    parser.add_argument('input_path')
+    parser.add_argument(
+        '--vm', action='store_true',
+        help='write compiled .vm code instead of the .xml parse tree',
+    )
+    parser.add_argument(
+        '--tokenizer', choices=TOKENIZERS, default='regex',
+        help='scan with one compiled regex, the character by character loop, '
+             'or lazily as the parser reads tokens',
+    )
+    parser.add_argument(
+        '--recover', action='store_true',
+        help='report every syntax error in a file instead of the first',
+    )
+    parser.add_argument(
+        '-j', '--jobs', type=int, default=1,
+        help='number of worker processes to compile files in parallel',
+    )
+    profiler.add_arguments(parser)
+    args = parser.parse_args()
+    input_path = args.input_path
 
     if os.path.isdir(input_path):
         # Get a list of all Jack files in the supplied directory.
         print(f'Looking for .jack files in {input_path}')
-        target_paths = [
+        # The list is sorted so that the output is the same on every run.
+        target_paths = sorted(
             os.path.join(input_path, f)
             for f in os.listdir(input_path)
             if os.path.splitext(f)[1] == '.jack'
-        ]
+        )
         # If there are no .jack files, raise an error
         if not target_paths:
             raise ValueError('No .jack files in specified directory')
@@ -27,25 +118,67 @@ def main():
         print(f'Compiling file at {input_path}')
         target_paths = [input_path]
 
-    # Iterate through each target file and compile it separately.
-    for target_path in target_paths:
-        print(f'Analyzing {target_path}')
-        with open(target_path, 'r') as f:
-            target_contents = f.read()
-        
-        # Tokenize the code and generate the parse tree
-        try:
-            token_list = TokenList(target_contents)
-            parse_tree = compile_file(token_list)
-        except ValueError as exc:
-            raise SystemExit(exc)
+    # Compile each target file separately. Without a pool, each file's output
+    # is written as it is generated. With a pool, the workers return their
+    # output to be written by this process. Either way the results are handled
+    # in the order of target_paths, and errors are reported by this process.
+    extension = '.vm' if args.vm else '.xml'
+    output_paths = [
+        os.path.splitext(target_path)[0] + extension
+        for target_path in target_paths
+    ]
+    errors = failed = 0
+    analyze_one = partial(
+        analyze_file, tokenizer=args.tokenizer, vm=args.vm,
+        recover=args.recover,
+    )
+    run_profiler = profiler.Profiler.from_args('jackanalyzer', args)
+    profiles = [run_profiler.file(target_path) for target_path in target_paths]
+    start = time.perf_counter()
+    pool = ProcessPoolExecutor(args.jobs) if args.jobs > 1 else nullcontext()
+    with pool as executor:
+        if executor:
+            futures = [
+                executor.submit(analyze_one, target_path, profile=profile)
+                for target_path, profile in zip(target_paths, profiles)
+            ]
+            results = (future.result() for future in futures)
+        else:
+            results = (
+                analyze_one(
+                    target_path, output_path=output_path, profile=profile
+                )
+                for target_path, output_path, profile in zip(
+                    target_paths, output_paths, profiles
+                )
+            )
+        for target_path, output_path, (output, diagnostics, profile) in zip(
+            target_paths, output_paths, results
+        ):
+            run_profiler.add(profile)
+            print(f'Analyzed {target_path}')
+
+            # Report the errors in the file, and carry on with the next one.
+            if diagnostics:
+                for diagnostic in diagnostics:
+                    print(f'{target_path}: {diagnostic}\n', file=sys.stderr)
+                errors += len(diagnostics)
+                failed += 1
+                continue
 
-        # Write the parse tree to a .xml file
-        output_path = os.path.splitext(target_path)[0] + '.xml'
-        with open(output_path, 'w') as f:
-            f.write(parse_tree.as_xml(2, True)[1: ] + '\n')
+            # Write the VM code to a .vm file, or the parse tree to a .xml file
+            if output is not None:
+                with profile.stage('write'), open(output_path, 'w') as f:
+                    f.write(output)
+            print(f'Wrote {"compiled" if args.vm else "parsed"} output to '
+                  f'{output_path}')
 
-        print(f'Wrote parsed output to {output_path}')
+    elapsed = time.perf_counter() - start
+    print(f'Analyzed {len(target_paths)} file(s) in {elapsed:.3f}s using '
+          f'{args.jobs} job(s)')
+    run_profiler.report()
+    if errors:
+        raise SystemExit(f'Found {errors} error(s) in {failed} file(s)')
 
 if __name__ == '__main__':
     main()
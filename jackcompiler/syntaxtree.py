@@ -0,0 +1,143 @@
+from enum import Enum
+
+from tokenizer import Token
+
+
+# Kinds of the nodes in the syntax tree. The values are the tags used for the
+# nodes in the XML output. FILE is the root node returned by compile_file,
+# which has no tag of its own.
+class NodeKind(Enum):
+    FILE = 'file'
+    CLASS = 'class'
+    CLASS_VAR_DEC = 'classVarDec'
+    SUBROUTINE_DEC = 'subroutineDec'
+    PARAMETER_LIST = 'parameterList'
+    SUBROUTINE_BODY = 'subroutineBody'
+    VAR_DEC = 'varDec'
+    STATEMENTS = 'statements'
+    LET_STATEMENT = 'letStatement'
+    IF_STATEMENT = 'ifStatement'
+    WHILE_STATEMENT = 'whileStatement'
+    DO_STATEMENT = 'doStatement'
+    RETURN_STATEMENT = 'returnStatement'
+    EXPRESSION = 'expression'
+    TERM = 'term'
+    SUBROUTINE_CALL = 'subroutineCall'
+    EXPRESSION_LIST = 'expressionList'
+
+# Set of all the node kinds that are non-terminals in the XML output spec.
+# The others are flattened into their parent when writing to spec.
+NON_TERMINALS = {
+    kind for kind in NodeKind
+    if kind not in (NodeKind.FILE, NodeKind.SUBROUTINE_CALL)
+}
+
+
+# Translation table escaping the characters that are special in XML.
+XML_ESCAPES = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+})
+
+# Number of lines write_xml collects before writing them to the file.
+XML_CHUNK_LINES = 4096
+
+
+# Node of the syntax tree. Its children are Nodes and the Tokens eaten by the
+# parser, which are kept as is rather than copied into the tree.
+class Node:
+    __slots__ = ('kind', 'children')
+
+    def __init__(self, kind: NodeKind):
+        self.kind = kind
+        self.children = []
+
+    def add(self, child):
+        self.children.append(child)
+
+    # Returns the child Nodes of the given kind.
+    def subtrees(self, kind: NodeKind):
+        return [
+            child for child in self.children
+            if type(child) is Node and child.kind is kind
+        ]
+
+    # Returns the children, with Tokens replaced by their values.
+    def values(self):
+        return [
+            child.value if type(child) is Token else child
+            for child in self.children
+        ]
+
+    def as_xml(self, indent_level = 2, to_spec = False):
+        string = ''
+        padding = ' ' * indent_level
+        for child in self.children:
+            if type(child) is Node:
+                tag = child.kind.value
+                value = child.as_xml(indent_level, to_spec)
+                if to_spec and child.kind not in NON_TERMINALS:
+                    string += value
+                else:
+                    value = value.replace('\n', '\n' + padding)
+                    string += f'\n<{tag}>{value}\n</{tag}>'
+            else:
+                tag = child.type
+                value = child.value
+                if to_spec and type(value) is str:
+                    value = value.translate(XML_ESCAPES)
+                string += f'\n<{tag}> {value} </{tag}>'
+        return string
+
+    # Writes the same XML as as_xml to a file, without the leading newline and
+    # with a trailing one, which is written on its own when there is no XML,
+    # as for a file with no classes. The tree is walked with an explicit stack
+    # of child iterators instead of recursion, each line is written with the
+    # padding of its depth instead of re-indenting whole subtrees, and lines
+    # are written out in chunks as they are generated.
+    def write_xml(self, f, indent_level = 2, to_spec = False):
+        lines = []
+        written = False
+        stack = [(iter(self.children), 0, None)]
+        while stack:
+            children, depth, tag = stack[-1]
+            padding = ' ' * (indent_level * depth)
+
+            # Once all the children of a node are written, close its tag.
+            if (child := next(children, None)) is None:
+                stack.pop()
+                if tag is not None:
+                    lines.append(f'{padding[indent_level: ]}</{tag}>\n')
+
+            elif type(child) is Node:
+                if to_spec and child.kind not in NON_TERMINALS:
+                    stack.append((iter(child.children), depth, None))
+                else:
+                    tag = child.kind.value
+                    lines.append(f'{padding}<{tag}>\n')
+                    stack.append((iter(child.children), depth + 1, tag))
+
+            # Newlines inside string constants are padded like the other
+            # lines, as as_xml does.
+            else:
+                value = child.value
+                if type(value) is str:
+                    if to_spec:
+                        value = value.translate(XML_ESCAPES)
+                    if '\n' in value:
+                        value = value.replace('\n', '\n' + padding)
+                name = child.type
+                lines.append(f'{padding}<{name}> {value} </{name}>\n')
+
+            if len(lines) >= XML_CHUNK_LINES:
+                f.write(''.join(lines))
+                lines.clear()
+                written = True
+        if not written and not lines:
+            lines.append('\n')
+        f.write(''.join(lines))
+
+    def __str__(self):
+        return self.as_xml()
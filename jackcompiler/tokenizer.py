@@ -1,3 +1,9 @@
+import re
+from array import array
+from bisect import bisect_right
+from collections import deque
+from enum import IntEnum
+
 # Set of all keywords in the Jack grammar.
 KEYWORDS = {
     'class',
@@ -30,38 +36,99 @@ SYMBOLS = {
     '&', '|', '<', '>', '=', '~',
 }
 
+# Master pattern for RegexTokenList, with one named group per kind of lexeme.
+# Alternatives are tried in order at each position, so comments are matched
+# before the '/' symbol, integers and identifiers that run into a character
+# other than a symbol or whitespace are matched as errors before the valid
+# ones, and the unterminated group only matches the opening of a comment or
+# string that has no end.
+TOKEN_PATTERN = re.compile(r'''
+    (?P<skip>\s+|//[^\n]*\n|/\*.*?\*/)
+  | (?P<invalid_integer>\d+(?=[^\s\d{}()\[\].,;+\-*/&|<>=~]))
+  | (?P<integer>\d+)
+  | (?P<string>"[^"]*")
+  | (?P<invalid_identifier>[^\W\d]\w*(?=[^\s\w{}()\[\].,;+\-*/&|<>=~]))
+  | (?P<word>[^\W\d]\w*)
+  | (?P<unterminated>/\*|")
+  | (?P<symbol>[{}()\[\].,;+\-*/&|<>=~])
+  | (?P<invalid>.)
+''', re.VERBOSE | re.DOTALL)
+
+# Groups of TOKEN_PATTERN that indicate an error in the code.
+SCAN_ERRORS = {
+    'invalid_integer', 'invalid_identifier', 'unterminated', 'invalid',
+}
+
+# Integer codes for the kinds of tokens. Tokens store these instead of their
+# type names, which are looked up in TOKEN_TYPES when needed.
+class TokenKind(IntEnum):
+    KEYWORD = 0
+    SYMBOL = 1
+    INTEGER_CONSTANT = 2
+    STRING_CONSTANT = 3
+    IDENTIFIER = 4
+    EOF = 5
+
+# Names of the token kinds as used in the XML output, indexed by TokenKind.
+TOKEN_TYPES = (
+    'keyword',
+    'symbol',
+    'integerConstant',
+    'stringConstant',
+    'identifier',
+    'eof',
+)
+
 # Simple class that takes a token string as input and classifies it into the
-# correct type and correctly formats its value.
+# correct kind and correctly formats its value.
 class Token:
+    __slots__ = ('kind', 'value')
+
     def __init__(self, token: str):
         if token == '':
-            self.type = 'eof'
+            self.kind = TokenKind.EOF
             self.value = token
         elif token in KEYWORDS:
-            self.type = 'keyword'
+            self.kind = TokenKind.KEYWORD
             self.value = token
         elif token in SYMBOLS:
-            self.type = 'symbol'
+            self.kind = TokenKind.SYMBOL
             self.value = token
         elif token[0].isdigit():
-            self.type = 'integerConstant'
+            self.kind = TokenKind.INTEGER_CONSTANT
             self.value = int(token)
         elif token[0] == '"':
-            self.type = 'stringConstant'
+            self.kind = TokenKind.STRING_CONSTANT
             self.value = token[1:-1]
         else:
-            self.type = 'identifier'
+            self.kind = TokenKind.IDENTIFIER
             self.value = token
 
+    @property
+    def type(self):
+        return TOKEN_TYPES[self.kind]
+
     def __repr__(self):
         return f'{self.type}: {self.value}'
 
 
+# Returns an array of the offsets at which the lines of the code start.
+def find_line_starts(code: str):
+    starts = array('L', [0])
+    pos = code.find('\n')
+    while pos != -1:
+        starts.append(pos + 1)
+        pos = code.find('\n', pos + 1)
+    return starts
+
+
 # Class to generate and store a list of Tokens from the given code, along with 
 # metadata to be able to generate descriptive error messages later.
 class TokenList:
     def __init__(self, code: str):
         self.original = code
+        self.line_starts = None
+        self.diagnostics = None
         self.tokens = []
         self.map = []
         self.pos = 0
@@ -158,35 +225,41 @@ class TokenList:
     def error(self, error: Exception, incomplete: bool = False):
         if incomplete:
             pos = self.map[-1]
+        elif self.pos > len(self.map):
+            # The last popped token is the EOF token, which has no position.
+            raise ValueError('Unexpected EOF')
         else:
             pos = self.map[self.pos - 1]
+        self.error_at(pos, error)
 
+    # Function to raise a syntax error with the line and column of the given
+    # position in the code, and the code around it. The line is found by a
+    # binary search of the line starts, which are found once on the first
+    # error, so reporting many errors in a big file stays cheap.
+    def error_at(self, pos: int, error: Exception):
         code = self.original
+        if self.line_starts is None:
+            self.line_starts = find_line_starts(code)
+        starts = self.line_starts
 
-        last_newline = pos - 1
-        while code[last_newline] != '\n' and last_newline > 0:
-            last_newline -= 1
-
-        next_newline = pos + 1
-        while code[next_newline] != '\n' and next_newline < len(code):
-            next_newline += 1
-
-        col_num = pos - last_newline
-        line_num = 1 + code[ :last_newline + 1].count('\n')
+        line_num = bisect_right(starts, pos)
+        line_start = starts[line_num - 1]
+        if line_num < len(starts):
+            line_end = starts[line_num] - 1
+        else:
+            line_end = len(code)
+        col_num = pos - line_start + 1
 
         lines = ''
         if line_num > 1:
-            l2l_newline = last_newline - 1
-            while code[l2l_newline] != '\n' and l2l_newline > 0:
-                l2l_newline -= 1
             lines += str(line_num - 1) + ' '
             lines += ' ' * (len(str(line_num)) - len(str(line_num - 1)))
-            lines += code[l2l_newline + 1 : last_newline] + '\n'
+            lines += code[starts[line_num - 2] : line_start - 1] + '\n'
         lines += str(line_num) + ' '
-        lines += code[last_newline + 1 : next_newline] + '\n'
+        lines += code[line_start : line_end] + '\n'
         lines += ' ' * len(str(line_num)) + ' ' + ''.join(
             char if char.isspace() else ' '
-            for char in code[last_newline + 1 : pos]
+            for char in code[line_start : pos]
         ) + '^'
 
         message = f'Error in line {line_num}, col {col_num}\n\n'
@@ -200,6 +273,11 @@ class TokenList:
         self.pos += 1
         return token
 
+    # Function to put the last popped token back, to be returned again by the
+    # next get or pop.
+    def unpop(self):
+        self.pos -= 1
+
     # Function to return a token "skip" positions from the current one.
     def get(self, skip: int = 0):
         return self.tokens[self.pos + skip]
@@ -207,3 +285,121 @@ class TokenList:
     # Function to neatly display all the parsed tokens.
     def __str__(self):
         return str([str(token) for token in self.tokens])
+
+
+# TokenList that scans the code with the single compiled TOKEN_PATTERN
+# instead of a character by character loop. It produces the same tokens, map
+# and errors as TokenList. Tokens are never modified once created, so equal
+# lexemes share one Token object rather than classifying the text again.
+class RegexTokenList(TokenList):
+    def __init__(self, code: str):
+        self.original = code
+        self.line_starts = None
+        self.diagnostics = None
+        self.tokens = []
+        self.map = []
+        self.pos = 0
+        tokens = self.tokens
+        positions = self.map
+
+        for position, token in self.scan(code):
+            positions.append(position)
+            tokens.append(token)
+
+        # Add an extra EOF token.
+        tokens.append(Token(''))
+
+    # Generator yielding the position and Token of each lexeme in the code as
+    # it is scanned.
+    def scan(self, code: str):
+        known = {}
+        previous = None
+
+        # Add a newline at the end of the code if there isn't one there
+        if not code.endswith('\n'):
+            code += '\n'
+
+        # Try block to catch an error being reported before any token has been
+        # found, or an unterminated comment or string, the same way as
+        # TokenList.
+        try:
+            for match in TOKEN_PATTERN.finditer(code):
+                kind = match.lastgroup
+                if kind == 'skip':
+                    continue
+                if kind in SCAN_ERRORS:
+                    self.scan_error(kind, match, code, previous)
+                previous = match.start()
+                lexeme = match.group()
+                if (token := known.get(lexeme)) is None:
+                    token = known[lexeme] = Token(lexeme)
+                yield previous, token
+
+        except IndexError:
+            raise ValueError('Unexpected EOF')
+
+    # Reports an error matched by one of the SCAN_ERRORS groups. Invalid
+    # characters are reported at the previous token like in TokenList.
+    def scan_error(self, kind: str, match: re.Match, code: str, previous):
+        if kind == 'invalid':
+            if previous is None:
+                raise IndexError()
+            self.error_at(previous, ValueError('Invalid character'))
+        if kind == 'unterminated':
+            raise IndexError()
+        if kind == 'invalid_integer':
+            self.error_at(match.start(), ValueError('Invalid integer'))
+        self.error_at(match.start(), ValueError(
+            f'Invalid character in identifier "{code[match.end()]}"'
+        ))
+
+
+# Token source that scans the code lazily as the parser asks for tokens, so
+# parsing starts right away and the whole token list is never built. Only the
+# tokens looked ahead at with get are kept, in a small ring buffer along with
+# their positions. The last popped token and its position are kept for
+# errors and unpop.
+class TokenStream(RegexTokenList):
+    def __init__(self, code: str):
+        self.original = code
+        self.line_starts = None
+        self.diagnostics = None
+        self.buffer = deque()
+        self.source = self.scan(code)
+        self.position = None
+        self.token = None
+
+    # Function to scan tokens into the buffer until it holds count tokens.
+    # Once the code is exhausted, EOF tokens are returned.
+    def fill(self, count: int):
+        while len(self.buffer) < count:
+            self.buffer.append(next(self.source, (None, Token(''))))
+
+    # Function to add line and column metadata to a syntax error. Errors in
+    # the tokens themselves are reported while scanning.
+    def error(self, error: Exception, incomplete: bool = False):
+        if self.position is None:
+            raise ValueError('Unexpected EOF')
+        self.error_at(self.position, error)
+
+    # Function to return the current token and prime the next token.
+    def pop(self):
+        if not self.buffer:
+            self.fill(1)
+        self.position, self.token = self.buffer.popleft()
+        return self.token
+
+    # Function to put the last popped token back, to be returned again by the
+    # next get or pop.
+    def unpop(self):
+        self.buffer.appendleft((self.position, self.token))
+
+    # Function to return a token "skip" positions from the current one.
+    def get(self, skip: int = 0):
+        if len(self.buffer) <= skip:
+            self.fill(skip + 1)
+        return self.buffer[skip][1]
+
+    # Function to neatly display the tokens scanned so far and not popped.
+    def __str__(self):
+        return str([str(token) for position, token in self.buffer])
@@ -0,0 +1,162 @@
+import cProfile
+import json
+import os
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+
+# Optional instrumentation shared by the command line tools. With --profile,
+# every input file gets a FileProfile recording the wall time and tracemalloc
+# peak of each stage of its processing, along with counts such as its lines,
+# tokens or instructions, and the whole run is written out as JSON at the end.
+# With --cprofile, the calls made while processing each file are also dumped
+# as cProfile stats into a .prof file per input file. Times are measured with
+# tracemalloc running, so they are higher than in a normal run, but their
+# proportions are the same. Without either flag, the tools get NULL_PROFILE,
+# which does nothing.
+
+
+# Profile of the processing of one file. It is a plain picklable object, so a
+# tool can create it in its main process, fill it in a worker process and get
+# it back with the result. Stages must not be nested, since each one resets
+# the tracemalloc peak.
+class FileProfile:
+    def __init__(self, path, cprofile_dir = None):
+        self.path = path
+        self.cprofile_dir = cprofile_dir
+        self.stages = {}
+        self.counts = {}
+        self.profiler = None
+
+    # Within the with block, the calls made are profiled with cProfile if a
+    # cprofile_dir was given, and their stats dumped there at the end.
+    def __enter__(self):
+        if self.cprofile_dir:
+            self.profiler = cProfile.Profile()
+            self.profiler.enable()
+        return self
+
+    def __exit__(self, *exc_info):
+        if self.profiler:
+            self.profiler.disable()
+            filename = os.path.basename(self.path) + '.prof'
+            self.profiler.dump_stats(os.path.join(self.cprofile_dir, filename))
+            self.profiler = None
+        return False
+
+    # Records the wall time and the memory allocated at the peak of the with
+    # block. A stage run more than once adds up its times.
+    @contextmanager
+    def stage(self, name):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1] - base
+            stage = self.stages.setdefault(
+                name, {'seconds': 0.0, 'peak_memory_bytes': 0}
+            )
+            stage['seconds'] += seconds
+            stage['peak_memory_bytes'] = max(stage['peak_memory_bytes'], peak)
+
+    def count(self, name, value):
+        self.counts[name] = self.counts.get(name, 0) + value
+
+    def as_dict(self):
+        return {
+            'path': self.path,
+            'stages': self.stages,
+            'counts': self.counts,
+        }
+
+
+# Stand-in for FileProfile when profiling is off. It is false, so that counts
+# which cost something to compute can be skipped with a check.
+class NullProfile:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def __bool__(self):
+        return False
+
+    def stage(self, name):
+        return NULL_STAGE
+
+    def count(self, name, value):
+        pass
+
+NULL_STAGE = nullcontext()
+
+NULL_PROFILE = NullProfile()
+
+
+# Collects the FileProfiles of a run of a tool, and the stages of the run that
+# are not part of any one file, and writes the report.
+class Profiler:
+    def __init__(self, tool, destination = None, cprofile_dir = None):
+        self.tool = tool
+        self.destination = destination
+        self.cprofile_dir = cprofile_dir
+        self.enabled = bool(destination or cprofile_dir)
+        self.run = self.file(tool)
+        self.files = []
+        self.start = time.perf_counter()
+        if cprofile_dir:
+            os.makedirs(cprofile_dir, exist_ok=True)
+
+    @classmethod
+    def from_args(cls, tool, args):
+        return cls(tool, args.profile, args.cprofile)
+
+    # Returns a new profile for the file at path, or NULL_PROFILE.
+    def file(self, path):
+        if self.enabled:
+            return FileProfile(path, self.cprofile_dir)
+        return NULL_PROFILE
+
+    def stage(self, name):
+        return self.run.stage(name)
+
+    def add(self, profile):
+        if profile:
+            self.files.append(profile)
+
+    # Writes the JSON report to the destination file, or to stderr if it is
+    # '-'.
+    def report(self):
+        if not self.destination:
+            return
+        report = {
+            'tool': self.tool,
+            'seconds': time.perf_counter() - self.start,
+            'stages': self.run.stages,
+            'files': [profile.as_dict() for profile in self.files],
+        }
+        if self.destination == '-':
+            json.dump(report, sys.stderr, indent=2)
+            print(file=sys.stderr)
+        else:
+            with open(self.destination, 'w') as f:
+                json.dump(report, f, indent=2)
+                f.write('\n')
+
+
+def add_arguments(parser):
+    parser.add_argument(
+        '--profile', nargs='?', const='-', metavar='FILE',
+        help='write per-file, per-stage times, counts and memory peaks as '
+             'JSON to FILE (default: stderr)',
+    )
+    parser.add_argument(
+        '--cprofile', metavar='DIR',
+        help='dump the cProfile stats of the processing of each file into DIR',
+    )
@@ -0,0 +1,91 @@
+import glob
+import os
+import sys
+
+import pytest
+
+# The tools import their modules as siblings, so their directories are put on
+# the path the same way the benchmarks do.
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+for directory in (
+    'benchmarks', 'hackassembler', 'hackemulator', 'jackcompiler',
+    'profiling', 'vmtranslator',
+):
+    sys.path.insert(0, os.path.join(ROOT, directory))
+
+from hackassembler import Assembler
+
+# A small Jack program with a mini OS, its compiled VM code, and the outputs
+# of the baseline tools for it: the analyzer's XML, the translator's Prog.asm
+# (from the .vm files in sorted order) and the assembler's Prog.hack.
+PROG_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data',
+                        'prog')
+EXPECTED_DIR = os.path.join(PROG_DIR, 'expected')
+
+# Main.main stores its results from RAM[5000] on.
+RESULT_ADDRESS = 5000
+RESULT = [55, -42, -14, 333, 295, 13, 24, 135, 3, 14, 60, 2, -1, -8]
+
+
+def read(path):
+    with open(path, 'r') as f:
+        return f.read()
+
+
+@pytest.fixture
+def jack_paths():
+    return sorted(glob.glob(os.path.join(PROG_DIR, '*.jack')))
+
+@pytest.fixture
+def vm_paths():
+    return sorted(glob.glob(os.path.join(PROG_DIR, '*.vm')))
+
+# List of the (filename, code) of every .vm file.
+@pytest.fixture
+def vm_sources(vm_paths):
+    return [
+        (os.path.splitext(os.path.basename(path))[0], read(path))
+        for path in vm_paths
+    ]
+
+@pytest.fixture
+def expected_asm():
+    return read(os.path.join(EXPECTED_DIR, 'Prog.asm'))
+
+@pytest.fixture
+def halt_address(expected_asm):
+    return assemble(expected_asm)[1]
+
+@pytest.fixture
+def expected_words():
+    with open(os.path.join(EXPECTED_DIR, 'Prog.hack'), 'r') as f:
+        return [int(line, 2) for line in f]
+
+# Copies of the .vm or .jack files in a temporary directory, for running main
+# on.
+@pytest.fixture
+def vm_dir(tmp_path, vm_paths):
+    return copy_files(tmp_path / 'Prog', vm_paths)
+
+@pytest.fixture
+def jack_dir(tmp_path, jack_paths):
+    return copy_files(tmp_path / 'Prog', jack_paths)
+
+
+def copy_files(directory, paths):
+    directory.mkdir()
+    for path in paths:
+        (directory / os.path.basename(path)).write_text(read(path))
+    return directory
+
+# Assembles a program, and returns its words and the address of Sys.halt,
+# which the program loops in once Main.main has stored its results.
+def assemble(asm_code):
+    assembler = Assembler()
+    words = assembler.assemble(asm_code.split('\n'))
+    return words, assembler.symbols['Sys.halt']
+
+# Returns the results a program leaves in RAM when it reaches halt_address.
+def run_result(cpu, halt_address, max_cycles = 10_000_000):
+    assert cpu.run(max_cycles, {halt_address}) == 'breakpoint'
+    return list(cpu.ram[RESULT_ADDRESS : RESULT_ADDRESS + len(RESULT)])
@@ -0,0 +1,7334 @@
+    @256
+    D=A
+    @SP
+    M=D
+    @Sys.init
+    0;JMP
+// function Array.new 0
+(Array.new)
+    @SP
+    A=M
+    @0
+    D=A
+    @SP
+    M=M+D
+// push argument 0
+    @0
+    D=A
+    @ARG
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// call Memory.alloc 1
+    @Array.3.RETURN_ADDRESS   // *(++SP) = Array.3.RETURN_ADDRESS
+    D=A
+    @SP
+    A=M
+    M=D
+    @LCL    // *(++SP) = LCL
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @ARG    // *(++SP) = ARG
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THIS   // *(++SP) = THIS
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THAT   // *(++SP) = THAT
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @SP     // SP++
+    M=M+1
+    @6     // ARG = SP - n - 5
+    D=-A
+    @SP
+    D=D+M
+    @ARG
+    M=D
+    @SP     // LCL = SP
+    D=M
+    @LCL
+    M=D
+    @Memory.alloc     // JMP TGT_FUNCTION
+    0;JMP
+(Array.3.RETURN_ADDRESS)
+// return
+    @LCL    // FRAME = LCL
+    D=M
+    @R14
+    M=D
+    @5      // RETURN_ADDRESS = *(FRAME - 5)
+    D=-A
+    @R14
+    A=M+D
+    D=M
+    @R13
+    M=D
+    @SP     // D = *(SP - 1)
+    A=M-1
+    D=M
+    @ARG    // *ARG = D
+    A=M
+    M=D
+    D=A+1   // SP = ARG + 1
+    @SP
+    M=D
+    @R14     // THAT = *(--FRAME)
+    AM=M-1
+    D=M
+    @THAT
+    M=D
+    @R14     // THIS = *(--FRAME)
+    AM=M-1
+    D=M
+    @THIS
+    M=D
+    @R14     // ARG = *(--FRAME)
+    AM=M-1
+    D=M
+    @ARG
+    M=D
+    @R14     // LCL = *(--FRAME)
+    AM=M-1
+    D=M
+    @LCL
+    M=D
+    @R13     // JMP RETURN_ADDRESS
+    A=M
+    0;JMP    
+// function Main.fib 0
+(Main.fib)
+    @SP
+    A=M
+    @0
+    D=A
+    @SP
+    M=M+D
+// push argument 0
+    @0
+    D=A
+    @ARG
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// push constant 2
+    @2
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// lt
+    @SP
+    AM=M-1
+    D=M
+    A=A-1
+    D=M-D
+    M=-1
+    @Main.4.TLT
+    D;JLT
+    @SP
+    A=M-1
+    M=0
+(Main.4.TLT)
+// not
+    @SP
+    A=M-1
+    M=!M
+// if-goto Main.fib$IF_ELSE0
+    @SP
+    AM=M-1
+    D=M
+    @Main.fib$IF_ELSE0
+    D;JNE
+// push argument 0
+    @0
+    D=A
+    @ARG
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// return
+    @LCL    // FRAME = LCL
+    D=M
+    @R14
+    M=D
+    @5      // RETURN_ADDRESS = *(FRAME - 5)
+    D=-A
+    @R14
+    A=M+D
+    D=M
+    @R13
+    M=D
+    @SP     // D = *(SP - 1)
+    A=M-1
+    D=M
+    @ARG    // *ARG = D
+    A=M
+    M=D
+    D=A+1   // SP = ARG + 1
+    @SP
+    M=D
+    @R14     // THAT = *(--FRAME)
+    AM=M-1
+    D=M
+    @THAT
+    M=D
+    @R14     // THIS = *(--FRAME)
+    AM=M-1
+    D=M
+    @THIS
+    M=D
+    @R14     // ARG = *(--FRAME)
+    AM=M-1
+    D=M
+    @ARG
+    M=D
+    @R14     // LCL = *(--FRAME)
+    AM=M-1
+    D=M
+    @LCL
+    M=D
+    @R13     // JMP RETURN_ADDRESS
+    A=M
+    0;JMP    
+// label Main.fib$IF_ELSE0
+(Main.fib$IF_ELSE0)
+// push argument 0
+    @0
+    D=A
+    @ARG
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// push constant 1
+    @1
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// sub
+    @SP
+    AM=M-1
+    D=M
+    A=A-1
+    M=M-D
+// call Main.fib 1
+    @Main.13.RETURN_ADDRESS   // *(++SP) = Main.13.RETURN_ADDRESS
+    D=A
+    @SP
+    A=M
+    M=D
+    @LCL    // *(++SP) = LCL
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @ARG    // *(++SP) = ARG
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THIS   // *(++SP) = THIS
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THAT   // *(++SP) = THAT
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @SP     // SP++
+    M=M+1
+    @6     // ARG = SP - n - 5
+    D=-A
+    @SP
+    D=D+M
+    @ARG
+    M=D
+    @SP     // LCL = SP
+    D=M
+    @LCL
+    M=D
+    @Main.fib     // JMP TGT_FUNCTION
+    0;JMP
+(Main.13.RETURN_ADDRESS)
+// push argument 0
+    @0
+    D=A
+    @ARG
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// push constant 2
+    @2
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// sub
+    @SP
+    AM=M-1
+    D=M
+    A=A-1
+    M=M-D
+// call Main.fib 1
+    @Main.17.RETURN_ADDRESS   // *(++SP) = Main.17.RETURN_ADDRESS
+    D=A
+    @SP
+    A=M
+    M=D
+    @LCL    // *(++SP) = LCL
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @ARG    // *(++SP) = ARG
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THIS   // *(++SP) = THIS
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THAT   // *(++SP) = THAT
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @SP     // SP++
+    M=M+1
+    @6     // ARG = SP - n - 5
+    D=-A
+    @SP
+    D=D+M
+    @ARG
+    M=D
+    @SP     // LCL = SP
+    D=M
+    @LCL
+    M=D
+    @Main.fib     // JMP TGT_FUNCTION
+    0;JMP
+(Main.17.RETURN_ADDRESS)
+// add
+    @SP
+    AM=M-1
+    D=M
+    A=A-1
+    M=M+D
+// return
+    @LCL    // FRAME = LCL
+    D=M
+    @R14
+    M=D
+    @5      // RETURN_ADDRESS = *(FRAME - 5)
+    D=-A
+    @R14
+    A=M+D
+    D=M
+    @R13
+    M=D
+    @SP     // D = *(SP - 1)
+    A=M-1
+    D=M
+    @ARG    // *ARG = D
+    A=M
+    M=D
+    D=A+1   // SP = ARG + 1
+    @SP
+    M=D
+    @R14     // THAT = *(--FRAME)
+    AM=M-1
+    D=M
+    @THAT
+    M=D
+    @R14     // THIS = *(--FRAME)
+    AM=M-1
+    D=M
+    @THIS
+    M=D
+    @R14     // ARG = *(--FRAME)
+    AM=M-1
+    D=M
+    @ARG
+    M=D
+    @R14     // LCL = *(--FRAME)
+    AM=M-1
+    D=M
+    @LCL
+    M=D
+    @R13     // JMP RETURN_ADDRESS
+    A=M
+    0;JMP    
+// function Main.put 0
+(Main.put)
+    @SP
+    A=M
+    @0
+    D=A
+    @SP
+    M=M+D
+// push static 0
+    @Main.0
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// push argument 0
+    @0
+    D=A
+    @ARG
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// call Memory.poke 2
+    @Main.23.RETURN_ADDRESS   // *(++SP) = Main.23.RETURN_ADDRESS
+    D=A
+    @SP
+    A=M
+    M=D
+    @LCL    // *(++SP) = LCL
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @ARG    // *(++SP) = ARG
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THIS   // *(++SP) = THIS
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THAT   // *(++SP) = THAT
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @SP     // SP++
+    M=M+1
+    @7     // ARG = SP - n - 5
+    D=-A
+    @SP
+    D=D+M
+    @ARG
+    M=D
+    @SP     // LCL = SP
+    D=M
+    @LCL
+    M=D
+    @Memory.poke     // JMP TGT_FUNCTION
+    0;JMP
+(Main.23.RETURN_ADDRESS)
+// pop temp 0
+    @0
+    D=A
+    @5
+    D=D+A
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// push static 0
+    @Main.0
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// push constant 1
+    @1
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// add
+    @SP
+    AM=M-1
+    D=M
+    A=A-1
+    M=M+D
+// pop static 0
+    @Main.0
+    D=A
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// push constant 0
+    @0
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// return
+    @LCL    // FRAME = LCL
+    D=M
+    @R14
+    M=D
+    @5      // RETURN_ADDRESS = *(FRAME - 5)
+    D=-A
+    @R14
+    A=M+D
+    D=M
+    @R13
+    M=D
+    @SP     // D = *(SP - 1)
+    A=M-1
+    D=M
+    @ARG    // *ARG = D
+    A=M
+    M=D
+    D=A+1   // SP = ARG + 1
+    @SP
+    M=D
+    @R14     // THAT = *(--FRAME)
+    AM=M-1
+    D=M
+    @THAT
+    M=D
+    @R14     // THIS = *(--FRAME)
+    AM=M-1
+    D=M
+    @THIS
+    M=D
+    @R14     // ARG = *(--FRAME)
+    AM=M-1
+    D=M
+    @ARG
+    M=D
+    @R14     // LCL = *(--FRAME)
+    AM=M-1
+    D=M
+    @LCL
+    M=D
+    @R13     // JMP RETURN_ADDRESS
+    A=M
+    0;JMP    
+// function Main.main 7
+(Main.main)
+    @SP
+    A=M
+    M=0
+    A=A+1
+    M=0
+    A=A+1
+    M=0
+    A=A+1
+    M=0
+    A=A+1
+    M=0
+    A=A+1
+    M=0
+    A=A+1
+    M=0
+    @7
+    D=A
+    @SP
+    M=M+D
+// push constant 5000
+    @5000
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// pop static 0
+    @Main.0
+    D=A
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// push constant 10
+    @10
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// call Main.fib 1
+    @Main.35.RETURN_ADDRESS   // *(++SP) = Main.35.RETURN_ADDRESS
+    D=A
+    @SP
+    A=M
+    M=D
+    @LCL    // *(++SP) = LCL
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @ARG    // *(++SP) = ARG
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THIS   // *(++SP) = THIS
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THAT   // *(++SP) = THAT
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @SP     // SP++
+    M=M+1
+    @6     // ARG = SP - n - 5
+    D=-A
+    @SP
+    D=D+M
+    @ARG
+    M=D
+    @SP     // LCL = SP
+    D=M
+    @LCL
+    M=D
+    @Main.fib     // JMP TGT_FUNCTION
+    0;JMP
+(Main.35.RETURN_ADDRESS)
+// call Main.put 1
+    @Main.36.RETURN_ADDRESS   // *(++SP) = Main.36.RETURN_ADDRESS
+    D=A
+    @SP
+    A=M
+    M=D
+    @LCL    // *(++SP) = LCL
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @ARG    // *(++SP) = ARG
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THIS   // *(++SP) = THIS
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THAT   // *(++SP) = THAT
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @SP     // SP++
+    M=M+1
+    @6     // ARG = SP - n - 5
+    D=-A
+    @SP
+    D=D+M
+    @ARG
+    M=D
+    @SP     // LCL = SP
+    D=M
+    @LCL
+    M=D
+    @Main.put     // JMP TGT_FUNCTION
+    0;JMP
+(Main.36.RETURN_ADDRESS)
+// pop temp 0
+    @0
+    D=A
+    @5
+    D=D+A
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// push constant 7
+    @7
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// push constant 6
+    @6
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// neg
+    @SP
+    A=M-1
+    M=-M
+// call Math.multiply 2
+    @Main.41.RETURN_ADDRESS   // *(++SP) = Main.41.RETURN_ADDRESS
+    D=A
+    @SP
+    A=M
+    M=D
+    @LCL    // *(++SP) = LCL
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @ARG    // *(++SP) = ARG
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THIS   // *(++SP) = THIS
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THAT   // *(++SP) = THAT
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @SP     // SP++
+    M=M+1
+    @7     // ARG = SP - n - 5
+    D=-A
+    @SP
+    D=D+M
+    @ARG
+    M=D
+    @SP     // LCL = SP
+    D=M
+    @LCL
+    M=D
+    @Math.multiply     // JMP TGT_FUNCTION
+    0;JMP
+(Main.41.RETURN_ADDRESS)
+// call Main.put 1
+    @Main.42.RETURN_ADDRESS   // *(++SP) = Main.42.RETURN_ADDRESS
+    D=A
+    @SP
+    A=M
+    M=D
+    @LCL    // *(++SP) = LCL
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @ARG    // *(++SP) = ARG
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THIS   // *(++SP) = THIS
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THAT   // *(++SP) = THAT
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @SP     // SP++
+    M=M+1
+    @6     // ARG = SP - n - 5
+    D=-A
+    @SP
+    D=D+M
+    @ARG
+    M=D
+    @SP     // LCL = SP
+    D=M
+    @LCL
+    M=D
+    @Main.put     // JMP TGT_FUNCTION
+    0;JMP
+(Main.42.RETURN_ADDRESS)
+// pop temp 0
+    @0
+    D=A
+    @5
+    D=D+A
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// push constant 100
+    @100
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// neg
+    @SP
+    A=M-1
+    M=-M
+// push constant 7
+    @7
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// call Math.divide 2
+    @Main.47.RETURN_ADDRESS   // *(++SP) = Main.47.RETURN_ADDRESS
+    D=A
+    @SP
+    A=M
+    M=D
+    @LCL    // *(++SP) = LCL
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @ARG    // *(++SP) = ARG
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THIS   // *(++SP) = THIS
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THAT   // *(++SP) = THAT
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @SP     // SP++
+    M=M+1
+    @7     // ARG = SP - n - 5
+    D=-A
+    @SP
+    D=D+M
+    @ARG
+    M=D
+    @SP     // LCL = SP
+    D=M
+    @LCL
+    M=D
+    @Math.divide     // JMP TGT_FUNCTION
+    0;JMP
+(Main.47.RETURN_ADDRESS)
+// call Main.put 1
+    @Main.48.RETURN_ADDRESS   // *(++SP) = Main.48.RETURN_ADDRESS
+    D=A
+    @SP
+    A=M
+    M=D
+    @LCL    // *(++SP) = LCL
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @ARG    // *(++SP) = ARG
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THIS   // *(++SP) = THIS
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THAT   // *(++SP) = THAT
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @SP     // SP++
+    M=M+1
+    @6     // ARG = SP - n - 5
+    D=-A
+    @SP
+    D=D+M
+    @ARG
+    M=D
+    @SP     // LCL = SP
+    D=M
+    @LCL
+    M=D
+    @Main.put     // JMP TGT_FUNCTION
+    0;JMP
+(Main.48.RETURN_ADDRESS)
+// pop temp 0
+    @0
+    D=A
+    @5
+    D=D+A
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// push constant 1000
+    @1000
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// push constant 3
+    @3
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// call Math.divide 2
+    @Main.52.RETURN_ADDRESS   // *(++SP) = Main.52.RETURN_ADDRESS
+    D=A
+    @SP
+    A=M
+    M=D
+    @LCL    // *(++SP) = LCL
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @ARG    // *(++SP) = ARG
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THIS   // *(++SP) = THIS
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THAT   // *(++SP) = THAT
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @SP     // SP++
+    M=M+1
+    @7     // ARG = SP - n - 5
+    D=-A
+    @SP
+    D=D+M
+    @ARG
+    M=D
+    @SP     // LCL = SP
+    D=M
+    @LCL
+    M=D
+    @Math.divide     // JMP TGT_FUNCTION
+    0;JMP
+(Main.52.RETURN_ADDRESS)
+// call Main.put 1
+    @Main.53.RETURN_ADDRESS   // *(++SP) = Main.53.RETURN_ADDRESS
+    D=A
+    @SP
+    A=M
+    M=D
+    @LCL    // *(++SP) = LCL
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @ARG    // *(++SP) = ARG
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THIS   // *(++SP) = THIS
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THAT   // *(++SP) = THAT
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @SP     // SP++
+    M=M+1
+    @6     // ARG = SP - n - 5
+    D=-A
+    @SP
+    D=D+M
+    @ARG
+    M=D
+    @SP     // LCL = SP
+    D=M
+    @LCL
+    M=D
+    @Main.put     // JMP TGT_FUNCTION
+    0;JMP
+(Main.53.RETURN_ADDRESS)
+// pop temp 0
+    @0
+    D=A
+    @5
+    D=D+A
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// push constant 10
+    @10
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// call Array.new 1
+    @Main.56.RETURN_ADDRESS   // *(++SP) = Main.56.RETURN_ADDRESS
+    D=A
+    @SP
+    A=M
+    M=D
+    @LCL    // *(++SP) = LCL
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @ARG    // *(++SP) = ARG
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THIS   // *(++SP) = THIS
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THAT   // *(++SP) = THAT
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @SP     // SP++
+    M=M+1
+    @6     // ARG = SP - n - 5
+    D=-A
+    @SP
+    D=D+M
+    @ARG
+    M=D
+    @SP     // LCL = SP
+    D=M
+    @LCL
+    M=D
+    @Array.new     // JMP TGT_FUNCTION
+    0;JMP
+(Main.56.RETURN_ADDRESS)
+// pop local 0
+    @0
+    D=A
+    @LCL
+    D=D+M
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// push constant 10
+    @10
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// call Array.new 1
+    @Main.59.RETURN_ADDRESS   // *(++SP) = Main.59.RETURN_ADDRESS
+    D=A
+    @SP
+    A=M
+    M=D
+    @LCL    // *(++SP) = LCL
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @ARG    // *(++SP) = ARG
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THIS   // *(++SP) = THIS
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THAT   // *(++SP) = THAT
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @SP     // SP++
+    M=M+1
+    @6     // ARG = SP - n - 5
+    D=-A
+    @SP
+    D=D+M
+    @ARG
+    M=D
+    @SP     // LCL = SP
+    D=M
+    @LCL
+    M=D
+    @Array.new     // JMP TGT_FUNCTION
+    0;JMP
+(Main.59.RETURN_ADDRESS)
+// pop local 1
+    @1
+    D=A
+    @LCL
+    D=D+M
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// push constant 0
+    @0
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// pop local 2
+    @2
+    D=A
+    @LCL
+    D=D+M
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// label Main.main$WHILE_EXP0
+(Main.main$WHILE_EXP0)
+// push local 2
+    @2
+    D=A
+    @LCL
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// push constant 10
+    @10
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// lt
+    @SP
+    AM=M-1
+    D=M
+    A=A-1
+    D=M-D
+    M=-1
+    @Main.66.TLT
+    D;JLT
+    @SP
+    A=M-1
+    M=0
+(Main.66.TLT)
+// not
+    @SP
+    A=M-1
+    M=!M
+// if-goto Main.main$WHILE_END1
+    @SP
+    AM=M-1
+    D=M
+    @Main.main$WHILE_END1
+    D;JNE
+// push local 0
+    @0
+    D=A
+    @LCL
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// push local 2
+    @2
+    D=A
+    @LCL
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// add
+    @SP
+    AM=M-1
+    D=M
+    A=A-1
+    M=M+D
+// push local 2
+    @2
+    D=A
+    @LCL
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// push local 2
+    @2
+    D=A
+    @LCL
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// call Math.multiply 2
+    @Main.74.RETURN_ADDRESS   // *(++SP) = Main.74.RETURN_ADDRESS
+    D=A
+    @SP
+    A=M
+    M=D
+    @LCL    // *(++SP) = LCL
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @ARG    // *(++SP) = ARG
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THIS   // *(++SP) = THIS
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THAT   // *(++SP) = THAT
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @SP     // SP++
+    M=M+1
+    @7     // ARG = SP - n - 5
+    D=-A
+    @SP
+    D=D+M
+    @ARG
+    M=D
+    @SP     // LCL = SP
+    D=M
+    @LCL
+    M=D
+    @Math.multiply     // JMP TGT_FUNCTION
+    0;JMP
+(Main.74.RETURN_ADDRESS)
+// pop temp 0
+    @0
+    D=A
+    @5
+    D=D+A
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// pop pointer 1
+    @1
+    D=A
+    @3
+    D=D+A
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// push temp 0
+    @0
+    D=A
+    @5
+    A=A+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// pop that 0
+    @0
+    D=A
+    @THAT
+    D=D+M
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// push local 2
+    @2
+    D=A
+    @LCL
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// push constant 1
+    @1
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// add
+    @SP
+    AM=M-1
+    D=M
+    A=A-1
+    M=M+D
+// pop local 2
+    @2
+    D=A
+    @LCL
+    D=D+M
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// goto Main.main$WHILE_EXP0
+    @Main.main$WHILE_EXP0
+    0;JMP
+// label Main.main$WHILE_END1
+(Main.main$WHILE_END1)
+// push constant 0
+    @0
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// pop local 2
+    @2
+    D=A
+    @LCL
+    D=D+M
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// label Main.main$WHILE_EXP2
+(Main.main$WHILE_EXP2)
+// push local 2
+    @2
+    D=A
+    @LCL
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// push constant 10
+    @10
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// lt
+    @SP
+    AM=M-1
+    D=M
+    A=A-1
+    D=M-D
+    M=-1
+    @Main.90.TLT
+    D;JLT
+    @SP
+    A=M-1
+    M=0
+(Main.90.TLT)
+// not
+    @SP
+    A=M-1
+    M=!M
+// if-goto Main.main$WHILE_END3
+    @SP
+    AM=M-1
+    D=M
+    @Main.main$WHILE_END3
+    D;JNE
+// push local 1
+    @1
+    D=A
+    @LCL
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// push local 0
+    @0
+    D=A
+    @LCL
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// push local 2
+    @2
+    D=A
+    @LCL
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// add
+    @SP
+    AM=M-1
+    D=M
+    A=A-1
+    M=M+D
+// pop pointer 1
+    @1
+    D=A
+    @3
+    D=D+A
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// push that 0
+    @0
+    D=A
+    @THAT
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// push local 2
+    @2
+    D=A
+    @LCL
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// push local 2
+    @2
+    D=A
+    @LCL
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// call Math.multiply 2
+    @Main.101.RETURN_ADDRESS   // *(++SP) = Main.101.RETURN_ADDRESS
+    D=A
+    @SP
+    A=M
+    M=D
+    @LCL    // *(++SP) = LCL
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @ARG    // *(++SP) = ARG
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THIS   // *(++SP) = THIS
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THAT   // *(++SP) = THAT
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @SP     // SP++
+    M=M+1
+    @7     // ARG = SP - n - 5
+    D=-A
+    @SP
+    D=D+M
+    @ARG
+    M=D
+    @SP     // LCL = SP
+    D=M
+    @LCL
+    M=D
+    @Math.multiply     // JMP TGT_FUNCTION
+    0;JMP
+(Main.101.RETURN_ADDRESS)
+// sub
+    @SP
+    AM=M-1
+    D=M
+    A=A-1
+    M=M-D
+// push local 2
+    @2
+    D=A
+    @LCL
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// add
+    @SP
+    AM=M-1
+    D=M
+    A=A-1
+    M=M+D
+// add
+    @SP
+    AM=M-1
+    D=M
+    A=A-1
+    M=M+D
+// push local 0
+    @0
+    D=A
+    @LCL
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// push local 2
+    @2
+    D=A
+    @LCL
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// add
+    @SP
+    AM=M-1
+    D=M
+    A=A-1
+    M=M+D
+// pop pointer 1
+    @1
+    D=A
+    @3
+    D=D+A
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// push that 0
+    @0
+    D=A
+    @THAT
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// push constant 1
+    @1
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// add
+    @SP
+    AM=M-1
+    D=M
+    A=A-1
+    M=M+D
+// pop temp 0
+    @0
+    D=A
+    @5
+    D=D+A
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// pop pointer 1
+    @1
+    D=A
+    @3
+    D=D+A
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// push temp 0
+    @0
+    D=A
+    @5
+    A=A+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// pop that 0
+    @0
+    D=A
+    @THAT
+    D=D+M
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// push local 2
+    @2
+    D=A
+    @LCL
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// push constant 1
+    @1
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// add
+    @SP
+    AM=M-1
+    D=M
+    A=A-1
+    M=M+D
+// pop local 2
+    @2
+    D=A
+    @LCL
+    D=D+M
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// goto Main.main$WHILE_EXP2
+    @Main.main$WHILE_EXP2
+    0;JMP
+// label Main.main$WHILE_END3
+(Main.main$WHILE_END3)
+// push constant 0
+    @0
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// pop local 3
+    @3
+    D=A
+    @LCL
+    D=D+M
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// push constant 0
+    @0
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// pop local 2
+    @2
+    D=A
+    @LCL
+    D=D+M
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// label Main.main$WHILE_EXP4
+(Main.main$WHILE_EXP4)
+// push local 2
+    @2
+    D=A
+    @LCL
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// push constant 10
+    @10
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// lt
+    @SP
+    AM=M-1
+    D=M
+    A=A-1
+    D=M-D
+    M=-1
+    @Main.130.TLT
+    D;JLT
+    @SP
+    A=M-1
+    M=0
+(Main.130.TLT)
+// not
+    @SP
+    A=M-1
+    M=!M
+// if-goto Main.main$WHILE_END5
+    @SP
+    AM=M-1
+    D=M
+    @Main.main$WHILE_END5
+    D;JNE
+// push local 3
+    @3
+    D=A
+    @LCL
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// push local 1
+    @1
+    D=A
+    @LCL
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// push local 2
+    @2
+    D=A
+    @LCL
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// add
+    @SP
+    AM=M-1
+    D=M
+    A=A-1
+    M=M+D
+// pop pointer 1
+    @1
+    D=A
+    @3
+    D=D+A
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// push that 0
+    @0
+    D=A
+    @THAT
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// add
+    @SP
+    AM=M-1
+    D=M
+    A=A-1
+    M=M+D
+// pop local 3
+    @3
+    D=A
+    @LCL
+    D=D+M
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// push local 2
+    @2
+    D=A
+    @LCL
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// push constant 1
+    @1
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// add
+    @SP
+    AM=M-1
+    D=M
+    A=A-1
+    M=M+D
+// pop local 2
+    @2
+    D=A
+    @LCL
+    D=D+M
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// goto Main.main$WHILE_EXP4
+    @Main.main$WHILE_EXP4
+    0;JMP
+// label Main.main$WHILE_END5
+(Main.main$WHILE_END5)
+// push local 3
+    @3
+    D=A
+    @LCL
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// call Main.put 1
+    @Main.148.RETURN_ADDRESS   // *(++SP) = Main.148.RETURN_ADDRESS
+    D=A
+    @SP
+    A=M
+    M=D
+    @LCL    // *(++SP) = LCL
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @ARG    // *(++SP) = ARG
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THIS   // *(++SP) = THIS
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THAT   // *(++SP) = THAT
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @SP     // SP++
+    M=M+1
+    @6     // ARG = SP - n - 5
+    D=-A
+    @SP
+    D=D+M
+    @ARG
+    M=D
+    @SP     // LCL = SP
+    D=M
+    @LCL
+    M=D
+    @Main.put     // JMP TGT_FUNCTION
+    0;JMP
+(Main.148.RETURN_ADDRESS)
+// pop temp 0
+    @0
+    D=A
+    @5
+    D=D+A
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// push constant 3
+    @3
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// push constant 4
+    @4
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// call Point.new 2
+    @Main.152.RETURN_ADDRESS   // *(++SP) = Main.152.RETURN_ADDRESS
+    D=A
+    @SP
+    A=M
+    M=D
+    @LCL    // *(++SP) = LCL
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @ARG    // *(++SP) = ARG
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THIS   // *(++SP) = THIS
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THAT   // *(++SP) = THAT
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @SP     // SP++
+    M=M+1
+    @7     // ARG = SP - n - 5
+    D=-A
+    @SP
+    D=D+M
+    @ARG
+    M=D
+    @SP     // LCL = SP
+    D=M
+    @LCL
+    M=D
+    @Point.new     // JMP TGT_FUNCTION
+    0;JMP
+(Main.152.RETURN_ADDRESS)
+// pop local 4
+    @4
+    D=A
+    @LCL
+    D=D+M
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// push local 4
+    @4
+    D=A
+    @LCL
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// push constant 10
+    @10
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// push constant 20
+    @20
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// call Point.new 2
+    @Main.157.RETURN_ADDRESS   // *(++SP) = Main.157.RETURN_ADDRESS
+    D=A
+    @SP
+    A=M
+    M=D
+    @LCL    // *(++SP) = LCL
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @ARG    // *(++SP) = ARG
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THIS   // *(++SP) = THIS
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THAT   // *(++SP) = THAT
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @SP     // SP++
+    M=M+1
+    @7     // ARG = SP - n - 5
+    D=-A
+    @SP
+    D=D+M
+    @ARG
+    M=D
+    @SP     // LCL = SP
+    D=M
+    @LCL
+    M=D
+    @Point.new     // JMP TGT_FUNCTION
+    0;JMP
+(Main.157.RETURN_ADDRESS)
+// call Point.plus 2
+    @Main.158.RETURN_ADDRESS   // *(++SP) = Main.158.RETURN_ADDRESS
+    D=A
+    @SP
+    A=M
+    M=D
+    @LCL    // *(++SP) = LCL
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @ARG    // *(++SP) = ARG
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THIS   // *(++SP) = THIS
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THAT   // *(++SP) = THAT
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @SP     // SP++
+    M=M+1
+    @7     // ARG = SP - n - 5
+    D=-A
+    @SP
+    D=D+M
+    @ARG
+    M=D
+    @SP     // LCL = SP
+    D=M
+    @LCL
+    M=D
+    @Point.plus     // JMP TGT_FUNCTION
+    0;JMP
+(Main.158.RETURN_ADDRESS)
+// pop local 5
+    @5
+    D=A
+    @LCL
+    D=D+M
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// push local 5
+    @5
+    D=A
+    @LCL
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// call Point.getX 1
+    @Main.161.RETURN_ADDRESS   // *(++SP) = Main.161.RETURN_ADDRESS
+    D=A
+    @SP
+    A=M
+    M=D
+    @LCL    // *(++SP) = LCL
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @ARG    // *(++SP) = ARG
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THIS   // *(++SP) = THIS
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THAT   // *(++SP) = THAT
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @SP     // SP++
+    M=M+1
+    @6     // ARG = SP - n - 5
+    D=-A
+    @SP
+    D=D+M
+    @ARG
+    M=D
+    @SP     // LCL = SP
+    D=M
+    @LCL
+    M=D
+    @Point.getX     // JMP TGT_FUNCTION
+    0;JMP
+(Main.161.RETURN_ADDRESS)
+// call Main.put 1
+    @Main.162.RETURN_ADDRESS   // *(++SP) = Main.162.RETURN_ADDRESS
+    D=A
+    @SP
+    A=M
+    M=D
+    @LCL    // *(++SP) = LCL
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @ARG    // *(++SP) = ARG
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THIS   // *(++SP) = THIS
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THAT   // *(++SP) = THAT
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @SP     // SP++
+    M=M+1
+    @6     // ARG = SP - n - 5
+    D=-A
+    @SP
+    D=D+M
+    @ARG
+    M=D
+    @SP     // LCL = SP
+    D=M
+    @LCL
+    M=D
+    @Main.put     // JMP TGT_FUNCTION
+    0;JMP
+(Main.162.RETURN_ADDRESS)
+// pop temp 0
+    @0
+    D=A
+    @5
+    D=D+A
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// push local 5
+    @5
+    D=A
+    @LCL
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// call Point.getY 1
+    @Main.165.RETURN_ADDRESS   // *(++SP) = Main.165.RETURN_ADDRESS
+    D=A
+    @SP
+    A=M
+    M=D
+    @LCL    // *(++SP) = LCL
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @ARG    // *(++SP) = ARG
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THIS   // *(++SP) = THIS
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THAT   // *(++SP) = THAT
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @SP     // SP++
+    M=M+1
+    @6     // ARG = SP - n - 5
+    D=-A
+    @SP
+    D=D+M
+    @ARG
+    M=D
+    @SP     // LCL = SP
+    D=M
+    @LCL
+    M=D
+    @Point.getY     // JMP TGT_FUNCTION
+    0;JMP
+(Main.165.RETURN_ADDRESS)
+// call Main.put 1
+    @Main.166.RETURN_ADDRESS   // *(++SP) = Main.166.RETURN_ADDRESS
+    D=A
+    @SP
+    A=M
+    M=D
+    @LCL    // *(++SP) = LCL
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @ARG    // *(++SP) = ARG
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THIS   // *(++SP) = THIS
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THAT   // *(++SP) = THAT
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @SP     // SP++
+    M=M+1
+    @6     // ARG = SP - n - 5
+    D=-A
+    @SP
+    D=D+M
+    @ARG
+    M=D
+    @SP     // LCL = SP
+    D=M
+    @LCL
+    M=D
+    @Main.put     // JMP TGT_FUNCTION
+    0;JMP
+(Main.166.RETURN_ADDRESS)
+// pop temp 0
+    @0
+    D=A
+    @5
+    D=D+A
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// push local 4
+    @4
+    D=A
+    @LCL
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// push local 5
+    @5
+    D=A
+    @LCL
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// call Point.dot 2
+    @Main.170.RETURN_ADDRESS   // *(++SP) = Main.170.RETURN_ADDRESS
+    D=A
+    @SP
+    A=M
+    M=D
+    @LCL    // *(++SP) = LCL
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @ARG    // *(++SP) = ARG
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THIS   // *(++SP) = THIS
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THAT   // *(++SP) = THAT
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @SP     // SP++
+    M=M+1
+    @7     // ARG = SP - n - 5
+    D=-A
+    @SP
+    D=D+M
+    @ARG
+    M=D
+    @SP     // LCL = SP
+    D=M
+    @LCL
+    M=D
+    @Point.dot     // JMP TGT_FUNCTION
+    0;JMP
+(Main.170.RETURN_ADDRESS)
+// call Main.put 1
+    @Main.171.RETURN_ADDRESS   // *(++SP) = Main.171.RETURN_ADDRESS
+    D=A
+    @SP
+    A=M
+    M=D
+    @LCL    // *(++SP) = LCL
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @ARG    // *(++SP) = ARG
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THIS   // *(++SP) = THIS
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THAT   // *(++SP) = THAT
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @SP     // SP++
+    M=M+1
+    @6     // ARG = SP - n - 5
+    D=-A
+    @SP
+    D=D+M
+    @ARG
+    M=D
+    @SP     // LCL = SP
+    D=M
+    @LCL
+    M=D
+    @Main.put     // JMP TGT_FUNCTION
+    0;JMP
+(Main.171.RETURN_ADDRESS)
+// pop temp 0
+    @0
+    D=A
+    @5
+    D=D+A
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// call Point.count 0
+    @Main.173.RETURN_ADDRESS   // *(++SP) = Main.173.RETURN_ADDRESS
+    D=A
+    @SP
+    A=M
+    M=D
+    @LCL    // *(++SP) = LCL
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @ARG    // *(++SP) = ARG
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THIS   // *(++SP) = THIS
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THAT   // *(++SP) = THAT
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @SP     // SP++
+    M=M+1
+    @5     // ARG = SP - n - 5
+    D=-A
+    @SP
+    D=D+M
+    @ARG
+    M=D
+    @SP     // LCL = SP
+    D=M
+    @LCL
+    M=D
+    @Point.count     // JMP TGT_FUNCTION
+    0;JMP
+(Main.173.RETURN_ADDRESS)
+// call Main.put 1
+    @Main.174.RETURN_ADDRESS   // *(++SP) = Main.174.RETURN_ADDRESS
+    D=A
+    @SP
+    A=M
+    M=D
+    @LCL    // *(++SP) = LCL
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @ARG    // *(++SP) = ARG
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THIS   // *(++SP) = THIS
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THAT   // *(++SP) = THAT
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @SP     // SP++
+    M=M+1
+    @6     // ARG = SP - n - 5
+    D=-A
+    @SP
+    D=D+M
+    @ARG
+    M=D
+    @SP     // LCL = SP
+    D=M
+    @LCL
+    M=D
+    @Main.put     // JMP TGT_FUNCTION
+    0;JMP
+(Main.174.RETURN_ADDRESS)
+// pop temp 0
+    @0
+    D=A
+    @5
+    D=D+A
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// push constant 14
+    @14
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// call String.new 1
+    @Main.177.RETURN_ADDRESS   // *(++SP) = Main.177.RETURN_ADDRESS
+    D=A
+    @SP
+    A=M
+    M=D
+    @LCL    // *(++SP) = LCL
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @ARG    // *(++SP) = ARG
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THIS   // *(++SP) = THIS
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THAT   // *(++SP) = THAT
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @SP     // SP++
+    M=M+1
+    @6     // ARG = SP - n - 5
+    D=-A
+    @SP
+    D=D+M
+    @ARG
+    M=D
+    @SP     // LCL = SP
+    D=M
+    @LCL
+    M=D
+    @String.new     // JMP TGT_FUNCTION
+    0;JMP
+(Main.177.RETURN_ADDRESS)
+// push constant 72
+    @72
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// call String.appendChar 2
+    @Main.179.RETURN_ADDRESS   // *(++SP) = Main.179.RETURN_ADDRESS
+    D=A
+    @SP
+    A=M
+    M=D
+    @LCL    // *(++SP) = LCL
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @ARG    // *(++SP) = ARG
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THIS   // *(++SP) = THIS
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THAT   // *(++SP) = THAT
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @SP     // SP++
+    M=M+1
+    @7     // ARG = SP - n - 5
+    D=-A
+    @SP
+    D=D+M
+    @ARG
+    M=D
+    @SP     // LCL = SP
+    D=M
+    @LCL
+    M=D
+    @String.appendChar     // JMP TGT_FUNCTION
+    0;JMP
+(Main.179.RETURN_ADDRESS)
+// push constant 105
+    @105
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// call String.appendChar 2
+    @Main.181.RETURN_ADDRESS   // *(++SP) = Main.181.RETURN_ADDRESS
+    D=A
+    @SP
+    A=M
+    M=D
+    @LCL    // *(++SP) = LCL
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @ARG    // *(++SP) = ARG
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THIS   // *(++SP) = THIS
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THAT   // *(++SP) = THAT
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @SP     // SP++
+    M=M+1
+    @7     // ARG = SP - n - 5
+    D=-A
+    @SP
+    D=D+M
+    @ARG
+    M=D
+    @SP     // LCL = SP
+    D=M
+    @LCL
+    M=D
+    @String.appendChar     // JMP TGT_FUNCTION
+    0;JMP
+(Main.181.RETURN_ADDRESS)
+// push constant 44
+    @44
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// call String.appendChar 2
+    @Main.183.RETURN_ADDRESS   // *(++SP) = Main.183.RETURN_ADDRESS
+    D=A
+    @SP
+    A=M
+    M=D
+    @LCL    // *(++SP) = LCL
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @ARG    // *(++SP) = ARG
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THIS   // *(++SP) = THIS
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THAT   // *(++SP) = THAT
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @SP     // SP++
+    M=M+1
+    @7     // ARG = SP - n - 5
+    D=-A
+    @SP
+    D=D+M
+    @ARG
+    M=D
+    @SP     // LCL = SP
+    D=M
+    @LCL
+    M=D
+    @String.appendChar     // JMP TGT_FUNCTION
+    0;JMP
+(Main.183.RETURN_ADDRESS)
+// push constant 32
+    @32
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// call String.appendChar 2
+    @Main.185.RETURN_ADDRESS   // *(++SP) = Main.185.RETURN_ADDRESS
+    D=A
+    @SP
+    A=M
+    M=D
+    @LCL    // *(++SP) = LCL
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @ARG    // *(++SP) = ARG
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THIS   // *(++SP) = THIS
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THAT   // *(++SP) = THAT
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @SP     // SP++
+    M=M+1
+    @7     // ARG = SP - n - 5
+    D=-A
+    @SP
+    D=D+M
+    @ARG
+    M=D
+    @SP     // LCL = SP
+    D=M
+    @LCL
+    M=D
+    @String.appendChar     // JMP TGT_FUNCTION
+    0;JMP
+(Main.185.RETURN_ADDRESS)
+// push constant 60
+    @60
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// call String.appendChar 2
+    @Main.187.RETURN_ADDRESS   // *(++SP) = Main.187.RETURN_ADDRESS
+    D=A
+    @SP
+    A=M
+    M=D
+    @LCL    // *(++SP) = LCL
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @ARG    // *(++SP) = ARG
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THIS   // *(++SP) = THIS
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THAT   // *(++SP) = THAT
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @SP     // SP++
+    M=M+1
+    @7     // ARG = SP - n - 5
+    D=-A
+    @SP
+    D=D+M
+    @ARG
+    M=D
+    @SP     // LCL = SP
+    D=M
+    @LCL
+    M=D
+    @String.appendChar     // JMP TGT_FUNCTION
+    0;JMP
+(Main.187.RETURN_ADDRESS)
+// push constant 74
+    @74
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// call String.appendChar 2
+    @Main.189.RETURN_ADDRESS   // *(++SP) = Main.189.RETURN_ADDRESS
+    D=A
+    @SP
+    A=M
+    M=D
+    @LCL    // *(++SP) = LCL
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @ARG    // *(++SP) = ARG
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THIS   // *(++SP) = THIS
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THAT   // *(++SP) = THAT
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @SP     // SP++
+    M=M+1
+    @7     // ARG = SP - n - 5
+    D=-A
+    @SP
+    D=D+M
+    @ARG
+    M=D
+    @SP     // LCL = SP
+    D=M
+    @LCL
+    M=D
+    @String.appendChar     // JMP TGT_FUNCTION
+    0;JMP
+(Main.189.RETURN_ADDRESS)
+// push constant 97
+    @97
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// call String.appendChar 2
+    @Main.191.RETURN_ADDRESS   // *(++SP) = Main.191.RETURN_ADDRESS
+    D=A
+    @SP
+    A=M
+    M=D
+    @LCL    // *(++SP) = LCL
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @ARG    // *(++SP) = ARG
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THIS   // *(++SP) = THIS
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THAT   // *(++SP) = THAT
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @SP     // SP++
+    M=M+1
+    @7     // ARG = SP - n - 5
+    D=-A
+    @SP
+    D=D+M
+    @ARG
+    M=D
+    @SP     // LCL = SP
+    D=M
+    @LCL
+    M=D
+    @String.appendChar     // JMP TGT_FUNCTION
+    0;JMP
+(Main.191.RETURN_ADDRESS)
+// push constant 99
+    @99
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// call String.appendChar 2
+    @Main.193.RETURN_ADDRESS   // *(++SP) = Main.193.RETURN_ADDRESS
+    D=A
+    @SP
+    A=M
+    M=D
+    @LCL    // *(++SP) = LCL
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @ARG    // *(++SP) = ARG
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THIS   // *(++SP) = THIS
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THAT   // *(++SP) = THAT
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @SP     // SP++
+    M=M+1
+    @7     // ARG = SP - n - 5
+    D=-A
+    @SP
+    D=D+M
+    @ARG
+    M=D
+    @SP     // LCL = SP
+    D=M
+    @LCL
+    M=D
+    @String.appendChar     // JMP TGT_FUNCTION
+    0;JMP
+(Main.193.RETURN_ADDRESS)
+// push constant 107
+    @107
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// call String.appendChar 2
+    @Main.195.RETURN_ADDRESS   // *(++SP) = Main.195.RETURN_ADDRESS
+    D=A
+    @SP
+    A=M
+    M=D
+    @LCL    // *(++SP) = LCL
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @ARG    // *(++SP) = ARG
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THIS   // *(++SP) = THIS
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THAT   // *(++SP) = THAT
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @SP     // SP++
+    M=M+1
+    @7     // ARG = SP - n - 5
+    D=-A
+    @SP
+    D=D+M
+    @ARG
+    M=D
+    @SP     // LCL = SP
+    D=M
+    @LCL
+    M=D
+    @String.appendChar     // JMP TGT_FUNCTION
+    0;JMP
+(Main.195.RETURN_ADDRESS)
+// push constant 62
+    @62
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// call String.appendChar 2
+    @Main.197.RETURN_ADDRESS   // *(++SP) = Main.197.RETURN_ADDRESS
+    D=A
+    @SP
+    A=M
+    M=D
+    @LCL    // *(++SP) = LCL
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @ARG    // *(++SP) = ARG
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THIS   // *(++SP) = THIS
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THAT   // *(++SP) = THAT
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @SP     // SP++
+    M=M+1
+    @7     // ARG = SP - n - 5
+    D=-A
+    @SP
+    D=D+M
+    @ARG
+    M=D
+    @SP     // LCL = SP
+    D=M
+    @LCL
+    M=D
+    @String.appendChar     // JMP TGT_FUNCTION
+    0;JMP
+(Main.197.RETURN_ADDRESS)
+// push constant 32
+    @32
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// call String.appendChar 2
+    @Main.199.RETURN_ADDRESS   // *(++SP) = Main.199.RETURN_ADDRESS
+    D=A
+    @SP
+    A=M
+    M=D
+    @LCL    // *(++SP) = LCL
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @ARG    // *(++SP) = ARG
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THIS   // *(++SP) = THIS
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THAT   // *(++SP) = THAT
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @SP     // SP++
+    M=M+1
+    @7     // ARG = SP - n - 5
+    D=-A
+    @SP
+    D=D+M
+    @ARG
+    M=D
+    @SP     // LCL = SP
+    D=M
+    @LCL
+    M=D
+    @String.appendChar     // JMP TGT_FUNCTION
+    0;JMP
+(Main.199.RETURN_ADDRESS)
+// push constant 38
+    @38
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// call String.appendChar 2
+    @Main.201.RETURN_ADDRESS   // *(++SP) = Main.201.RETURN_ADDRESS
+    D=A
+    @SP
+    A=M
+    M=D
+    @LCL    // *(++SP) = LCL
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @ARG    // *(++SP) = ARG
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THIS   // *(++SP) = THIS
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THAT   // *(++SP) = THAT
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @SP     // SP++
+    M=M+1
+    @7     // ARG = SP - n - 5
+    D=-A
+    @SP
+    D=D+M
+    @ARG
+    M=D
+    @SP     // LCL = SP
+    D=M
+    @LCL
+    M=D
+    @String.appendChar     // JMP TGT_FUNCTION
+    0;JMP
+(Main.201.RETURN_ADDRESS)
+// push constant 32
+    @32
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// call String.appendChar 2
+    @Main.203.RETURN_ADDRESS   // *(++SP) = Main.203.RETURN_ADDRESS
+    D=A
+    @SP
+    A=M
+    M=D
+    @LCL    // *(++SP) = LCL
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @ARG    // *(++SP) = ARG
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THIS   // *(++SP) = THIS
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THAT   // *(++SP) = THAT
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @SP     // SP++
+    M=M+1
+    @7     // ARG = SP - n - 5
+    D=-A
+    @SP
+    D=D+M
+    @ARG
+    M=D
+    @SP     // LCL = SP
+    D=M
+    @LCL
+    M=D
+    @String.appendChar     // JMP TGT_FUNCTION
+    0;JMP
+(Main.203.RETURN_ADDRESS)
+// push constant 120
+    @120
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// call String.appendChar 2
+    @Main.205.RETURN_ADDRESS   // *(++SP) = Main.205.RETURN_ADDRESS
+    D=A
+    @SP
+    A=M
+    M=D
+    @LCL    // *(++SP) = LCL
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @ARG    // *(++SP) = ARG
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THIS   // *(++SP) = THIS
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THAT   // *(++SP) = THAT
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @SP     // SP++
+    M=M+1
+    @7     // ARG = SP - n - 5
+    D=-A
+    @SP
+    D=D+M
+    @ARG
+    M=D
+    @SP     // LCL = SP
+    D=M
+    @LCL
+    M=D
+    @String.appendChar     // JMP TGT_FUNCTION
+    0;JMP
+(Main.205.RETURN_ADDRESS)
+// pop local 6
+    @6
+    D=A
+    @LCL
+    D=D+M
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// push local 6
+    @6
+    D=A
+    @LCL
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// call String.length 1
+    @Main.208.RETURN_ADDRESS   // *(++SP) = Main.208.RETURN_ADDRESS
+    D=A
+    @SP
+    A=M
+    M=D
+    @LCL    // *(++SP) = LCL
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @ARG    // *(++SP) = ARG
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THIS   // *(++SP) = THIS
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THAT   // *(++SP) = THAT
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @SP     // SP++
+    M=M+1
+    @6     // ARG = SP - n - 5
+    D=-A
+    @SP
+    D=D+M
+    @ARG
+    M=D
+    @SP     // LCL = SP
+    D=M
+    @LCL
+    M=D
+    @String.length     // JMP TGT_FUNCTION
+    0;JMP
+(Main.208.RETURN_ADDRESS)
+// call Main.put 1
+    @Main.209.RETURN_ADDRESS   // *(++SP) = Main.209.RETURN_ADDRESS
+    D=A
+    @SP
+    A=M
+    M=D
+    @LCL    // *(++SP) = LCL
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @ARG    // *(++SP) = ARG
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THIS   // *(++SP) = THIS
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THAT   // *(++SP) = THAT
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @SP     // SP++
+    M=M+1
+    @6     // ARG = SP - n - 5
+    D=-A
+    @SP
+    D=D+M
+    @ARG
+    M=D
+    @SP     // LCL = SP
+    D=M
+    @LCL
+    M=D
+    @Main.put     // JMP TGT_FUNCTION
+    0;JMP
+(Main.209.RETURN_ADDRESS)
+// pop temp 0
+    @0
+    D=A
+    @5
+    D=D+A
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// push local 6
+    @6
+    D=A
+    @LCL
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// push constant 4
+    @4
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// call String.charAt 2
+    @Main.213.RETURN_ADDRESS   // *(++SP) = Main.213.RETURN_ADDRESS
+    D=A
+    @SP
+    A=M
+    M=D
+    @LCL    // *(++SP) = LCL
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @ARG    // *(++SP) = ARG
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THIS   // *(++SP) = THIS
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THAT   // *(++SP) = THAT
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @SP     // SP++
+    M=M+1
+    @7     // ARG = SP - n - 5
+    D=-A
+    @SP
+    D=D+M
+    @ARG
+    M=D
+    @SP     // LCL = SP
+    D=M
+    @LCL
+    M=D
+    @String.charAt     // JMP TGT_FUNCTION
+    0;JMP
+(Main.213.RETURN_ADDRESS)
+// call Main.put 1
+    @Main.214.RETURN_ADDRESS   // *(++SP) = Main.214.RETURN_ADDRESS
+    D=A
+    @SP
+    A=M
+    M=D
+    @LCL    // *(++SP) = LCL
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @ARG    // *(++SP) = ARG
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THIS   // *(++SP) = THIS
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THAT   // *(++SP) = THAT
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @SP     // SP++
+    M=M+1
+    @6     // ARG = SP - n - 5
+    D=-A
+    @SP
+    D=D+M
+    @ARG
+    M=D
+    @SP     // LCL = SP
+    D=M
+    @LCL
+    M=D
+    @Main.put     // JMP TGT_FUNCTION
+    0;JMP
+(Main.214.RETURN_ADDRESS)
+// pop temp 0
+    @0
+    D=A
+    @5
+    D=D+A
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// push local 6
+    @6
+    D=A
+    @LCL
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// call String.length 1
+    @Main.217.RETURN_ADDRESS   // *(++SP) = Main.217.RETURN_ADDRESS
+    D=A
+    @SP
+    A=M
+    M=D
+    @LCL    // *(++SP) = LCL
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @ARG    // *(++SP) = ARG
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THIS   // *(++SP) = THIS
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THAT   // *(++SP) = THAT
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @SP     // SP++
+    M=M+1
+    @6     // ARG = SP - n - 5
+    D=-A
+    @SP
+    D=D+M
+    @ARG
+    M=D
+    @SP     // LCL = SP
+    D=M
+    @LCL
+    M=D
+    @String.length     // JMP TGT_FUNCTION
+    0;JMP
+(Main.217.RETURN_ADDRESS)
+// push constant 100
+    @100
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// gt
+    @SP
+    AM=M-1
+    D=M
+    A=A-1
+    D=M-D
+    M=-1
+    @Main.219.TGT
+    D;JGT
+    @SP
+    A=M-1
+    M=0
+(Main.219.TGT)
+// not
+    @SP
+    A=M-1
+    M=!M
+// if-goto Main.main$IF_ELSE6
+    @SP
+    AM=M-1
+    D=M
+    @Main.main$IF_ELSE6
+    D;JNE
+// push constant 1
+    @1
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// call Main.put 1
+    @Main.223.RETURN_ADDRESS   // *(++SP) = Main.223.RETURN_ADDRESS
+    D=A
+    @SP
+    A=M
+    M=D
+    @LCL    // *(++SP) = LCL
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @ARG    // *(++SP) = ARG
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THIS   // *(++SP) = THIS
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THAT   // *(++SP) = THAT
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @SP     // SP++
+    M=M+1
+    @6     // ARG = SP - n - 5
+    D=-A
+    @SP
+    D=D+M
+    @ARG
+    M=D
+    @SP     // LCL = SP
+    D=M
+    @LCL
+    M=D
+    @Main.put     // JMP TGT_FUNCTION
+    0;JMP
+(Main.223.RETURN_ADDRESS)
+// pop temp 0
+    @0
+    D=A
+    @5
+    D=D+A
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// goto Main.main$IF_END7
+    @Main.main$IF_END7
+    0;JMP
+// label Main.main$IF_ELSE6
+(Main.main$IF_ELSE6)
+// push constant 2
+    @2
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// call Main.put 1
+    @Main.228.RETURN_ADDRESS   // *(++SP) = Main.228.RETURN_ADDRESS
+    D=A
+    @SP
+    A=M
+    M=D
+    @LCL    // *(++SP) = LCL
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @ARG    // *(++SP) = ARG
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THIS   // *(++SP) = THIS
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THAT   // *(++SP) = THAT
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @SP     // SP++
+    M=M+1
+    @6     // ARG = SP - n - 5
+    D=-A
+    @SP
+    D=D+M
+    @ARG
+    M=D
+    @SP     // LCL = SP
+    D=M
+    @LCL
+    M=D
+    @Main.put     // JMP TGT_FUNCTION
+    0;JMP
+(Main.228.RETURN_ADDRESS)
+// pop temp 0
+    @0
+    D=A
+    @5
+    D=D+A
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// label Main.main$IF_END7
+(Main.main$IF_END7)
+// push constant 1
+    @1
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// neg
+    @SP
+    A=M-1
+    M=-M
+// push constant 0
+    @0
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// not
+    @SP
+    A=M-1
+    M=!M
+// and
+    @SP
+    AM=M-1
+    D=M
+    A=A-1
+    M=M&D
+// not
+    @SP
+    A=M-1
+    M=!M
+// if-goto Main.main$IF_ELSE8
+    @SP
+    AM=M-1
+    D=M
+    @Main.main$IF_ELSE8
+    D;JNE
+// push constant 0
+    @0
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// push constant 0
+    @0
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// eq
+    @SP
+    AM=M-1
+    D=M
+    A=A-1
+    D=M-D
+    M=-1
+    @Main.240.TEQ
+    D;JEQ
+    @SP
+    A=M-1
+    M=0
+(Main.240.TEQ)
+// call Main.put 1
+    @Main.241.RETURN_ADDRESS   // *(++SP) = Main.241.RETURN_ADDRESS
+    D=A
+    @SP
+    A=M
+    M=D
+    @LCL    // *(++SP) = LCL
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @ARG    // *(++SP) = ARG
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THIS   // *(++SP) = THIS
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THAT   // *(++SP) = THAT
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @SP     // SP++
+    M=M+1
+    @6     // ARG = SP - n - 5
+    D=-A
+    @SP
+    D=D+M
+    @ARG
+    M=D
+    @SP     // LCL = SP
+    D=M
+    @LCL
+    M=D
+    @Main.put     // JMP TGT_FUNCTION
+    0;JMP
+(Main.241.RETURN_ADDRESS)
+// pop temp 0
+    @0
+    D=A
+    @5
+    D=D+A
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// label Main.main$IF_ELSE8
+(Main.main$IF_ELSE8)
+// push constant 5
+    @5
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// push constant 2
+    @2
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// or
+    @SP
+    AM=M-1
+    D=M
+    A=A-1
+    M=M|D
+// not
+    @SP
+    A=M-1
+    M=!M
+// call Main.put 1
+    @Main.248.RETURN_ADDRESS   // *(++SP) = Main.248.RETURN_ADDRESS
+    D=A
+    @SP
+    A=M
+    M=D
+    @LCL    // *(++SP) = LCL
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @ARG    // *(++SP) = ARG
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THIS   // *(++SP) = THIS
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THAT   // *(++SP) = THAT
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @SP     // SP++
+    M=M+1
+    @6     // ARG = SP - n - 5
+    D=-A
+    @SP
+    D=D+M
+    @ARG
+    M=D
+    @SP     // LCL = SP
+    D=M
+    @LCL
+    M=D
+    @Main.put     // JMP TGT_FUNCTION
+    0;JMP
+(Main.248.RETURN_ADDRESS)
+// pop temp 0
+    @0
+    D=A
+    @5
+    D=D+A
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// push constant 0
+    @0
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// return
+    @LCL    // FRAME = LCL
+    D=M
+    @R14
+    M=D
+    @5      // RETURN_ADDRESS = *(FRAME - 5)
+    D=-A
+    @R14
+    A=M+D
+    D=M
+    @R13
+    M=D
+    @SP     // D = *(SP - 1)
+    A=M-1
+    D=M
+    @ARG    // *ARG = D
+    A=M
+    M=D
+    D=A+1   // SP = ARG + 1
+    @SP
+    M=D
+    @R14     // THAT = *(--FRAME)
+    AM=M-1
+    D=M
+    @THAT
+    M=D
+    @R14     // THIS = *(--FRAME)
+    AM=M-1
+    D=M
+    @THIS
+    M=D
+    @R14     // ARG = *(--FRAME)
+    AM=M-1
+    D=M
+    @ARG
+    M=D
+    @R14     // LCL = *(--FRAME)
+    AM=M-1
+    D=M
+    @LCL
+    M=D
+    @R13     // JMP RETURN_ADDRESS
+    A=M
+    0;JMP    
+// function Math.multiply 3
+(Math.multiply)
+    @SP
+    A=M
+    M=0
+    A=A+1
+    M=0
+    A=A+1
+    M=0
+    @3
+    D=A
+    @SP
+    M=M+D
+// push constant 0
+    @0
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// pop local 0
+    @0
+    D=A
+    @LCL
+    D=D+M
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// push constant 1
+    @1
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// pop local 1
+    @1
+    D=A
+    @LCL
+    D=D+M
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// push constant 0
+    @0
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// pop local 2
+    @2
+    D=A
+    @LCL
+    D=D+M
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// label Math.multiply$WHILE_EXP0
+(Math.multiply$WHILE_EXP0)
+// push local 2
+    @2
+    D=A
+    @LCL
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// push constant 16
+    @16
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// lt
+    @SP
+    AM=M-1
+    D=M
+    A=A-1
+    D=M-D
+    M=-1
+    @Math.11.TLT
+    D;JLT
+    @SP
+    A=M-1
+    M=0
+(Math.11.TLT)
+// not
+    @SP
+    A=M-1
+    M=!M
+// if-goto Math.multiply$WHILE_END1
+    @SP
+    AM=M-1
+    D=M
+    @Math.multiply$WHILE_END1
+    D;JNE
+// push argument 1
+    @1
+    D=A
+    @ARG
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// push local 1
+    @1
+    D=A
+    @LCL
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// and
+    @SP
+    AM=M-1
+    D=M
+    A=A-1
+    M=M&D
+// push constant 0
+    @0
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// eq
+    @SP
+    AM=M-1
+    D=M
+    A=A-1
+    D=M-D
+    M=-1
+    @Math.18.TEQ
+    D;JEQ
+    @SP
+    A=M-1
+    M=0
+(Math.18.TEQ)
+// not
+    @SP
+    A=M-1
+    M=!M
+// not
+    @SP
+    A=M-1
+    M=!M
+// if-goto Math.multiply$IF_ELSE2
+    @SP
+    AM=M-1
+    D=M
+    @Math.multiply$IF_ELSE2
+    D;JNE
+// push local 0
+    @0
+    D=A
+    @LCL
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// push argument 0
+    @0
+    D=A
+    @ARG
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// add
+    @SP
+    AM=M-1
+    D=M
+    A=A-1
+    M=M+D
+// pop local 0
+    @0
+    D=A
+    @LCL
+    D=D+M
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// label Math.multiply$IF_ELSE2
+(Math.multiply$IF_ELSE2)
+// push argument 0
+    @0
+    D=A
+    @ARG
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// push argument 0
+    @0
+    D=A
+    @ARG
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// add
+    @SP
+    AM=M-1
+    D=M
+    A=A-1
+    M=M+D
+// pop argument 0
+    @0
+    D=A
+    @ARG
+    D=D+M
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// push local 1
+    @1
+    D=A
+    @LCL
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// push local 1
+    @1
+    D=A
+    @LCL
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// add
+    @SP
+    AM=M-1
+    D=M
+    A=A-1
+    M=M+D
+// pop local 1
+    @1
+    D=A
+    @LCL
+    D=D+M
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// push local 2
+    @2
+    D=A
+    @LCL
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// push constant 1
+    @1
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// add
+    @SP
+    AM=M-1
+    D=M
+    A=A-1
+    M=M+D
+// pop local 2
+    @2
+    D=A
+    @LCL
+    D=D+M
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// goto Math.multiply$WHILE_EXP0
+    @Math.multiply$WHILE_EXP0
+    0;JMP
+// label Math.multiply$WHILE_END1
+(Math.multiply$WHILE_END1)
+// push local 0
+    @0
+    D=A
+    @LCL
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// return
+    @LCL    // FRAME = LCL
+    D=M
+    @R14
+    M=D
+    @5      // RETURN_ADDRESS = *(FRAME - 5)
+    D=-A
+    @R14
+    A=M+D
+    D=M
+    @R13
+    M=D
+    @SP     // D = *(SP - 1)
+    A=M-1
+    D=M
+    @ARG    // *ARG = D
+    A=M
+    M=D
+    D=A+1   // SP = ARG + 1
+    @SP
+    M=D
+    @R14     // THAT = *(--FRAME)
+    AM=M-1
+    D=M
+    @THAT
+    M=D
+    @R14     // THIS = *(--FRAME)
+    AM=M-1
+    D=M
+    @THIS
+    M=D
+    @R14     // ARG = *(--FRAME)
+    AM=M-1
+    D=M
+    @ARG
+    M=D
+    @R14     // LCL = *(--FRAME)
+    AM=M-1
+    D=M
+    @LCL
+    M=D
+    @R13     // JMP RETURN_ADDRESS
+    A=M
+    0;JMP    
+// function Math.divide 2
+(Math.divide)
+    @SP
+    A=M
+    M=0
+    A=A+1
+    M=0
+    @2
+    D=A
+    @SP
+    M=M+D
+// push argument 0
+    @0
+    D=A
+    @ARG
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// push constant 0
+    @0
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// lt
+    @SP
+    AM=M-1
+    D=M
+    A=A-1
+    D=M-D
+    M=-1
+    @Math.46.TLT
+    D;JLT
+    @SP
+    A=M-1
+    M=0
+(Math.46.TLT)
+// push argument 1
+    @1
+    D=A
+    @ARG
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// push constant 0
+    @0
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// gt
+    @SP
+    AM=M-1
+    D=M
+    A=A-1
+    D=M-D
+    M=-1
+    @Math.49.TGT
+    D;JGT
+    @SP
+    A=M-1
+    M=0
+(Math.49.TGT)
+// eq
+    @SP
+    AM=M-1
+    D=M
+    A=A-1
+    D=M-D
+    M=-1
+    @Math.50.TEQ
+    D;JEQ
+    @SP
+    A=M-1
+    M=0
+(Math.50.TEQ)
+// pop local 1
+    @1
+    D=A
+    @LCL
+    D=D+M
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// push argument 0
+    @0
+    D=A
+    @ARG
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// push constant 0
+    @0
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// lt
+    @SP
+    AM=M-1
+    D=M
+    A=A-1
+    D=M-D
+    M=-1
+    @Math.54.TLT
+    D;JLT
+    @SP
+    A=M-1
+    M=0
+(Math.54.TLT)
+// not
+    @SP
+    A=M-1
+    M=!M
+// if-goto Math.divide$IF_ELSE0
+    @SP
+    AM=M-1
+    D=M
+    @Math.divide$IF_ELSE0
+    D;JNE
+// push argument 0
+    @0
+    D=A
+    @ARG
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// neg
+    @SP
+    A=M-1
+    M=-M
+// pop argument 0
+    @0
+    D=A
+    @ARG
+    D=D+M
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// label Math.divide$IF_ELSE0
+(Math.divide$IF_ELSE0)
+// push argument 1
+    @1
+    D=A
+    @ARG
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// push constant 0
+    @0
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// lt
+    @SP
+    AM=M-1
+    D=M
+    A=A-1
+    D=M-D
+    M=-1
+    @Math.63.TLT
+    D;JLT
+    @SP
+    A=M-1
+    M=0
+(Math.63.TLT)
+// not
+    @SP
+    A=M-1
+    M=!M
+// if-goto Math.divide$IF_ELSE1
+    @SP
+    AM=M-1
+    D=M
+    @Math.divide$IF_ELSE1
+    D;JNE
+// push argument 1
+    @1
+    D=A
+    @ARG
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// neg
+    @SP
+    A=M-1
+    M=-M
+// pop argument 1
+    @1
+    D=A
+    @ARG
+    D=D+M
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// label Math.divide$IF_ELSE1
+(Math.divide$IF_ELSE1)
+// push constant 0
+    @0
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// pop local 0
+    @0
+    D=A
+    @LCL
+    D=D+M
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// label Math.divide$WHILE_EXP2
+(Math.divide$WHILE_EXP2)
+// push argument 0
+    @0
+    D=A
+    @ARG
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// push argument 1
+    @1
+    D=A
+    @ARG
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// lt
+    @SP
+    AM=M-1
+    D=M
+    A=A-1
+    D=M-D
+    M=-1
+    @Math.75.TLT
+    D;JLT
+    @SP
+    A=M-1
+    M=0
+(Math.75.TLT)
+// not
+    @SP
+    A=M-1
+    M=!M
+// not
+    @SP
+    A=M-1
+    M=!M
+// if-goto Math.divide$WHILE_END3
+    @SP
+    AM=M-1
+    D=M
+    @Math.divide$WHILE_END3
+    D;JNE
+// push argument 0
+    @0
+    D=A
+    @ARG
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// push argument 1
+    @1
+    D=A
+    @ARG
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// sub
+    @SP
+    AM=M-1
+    D=M
+    A=A-1
+    M=M-D
+// pop argument 0
+    @0
+    D=A
+    @ARG
+    D=D+M
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// push local 0
+    @0
+    D=A
+    @LCL
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// push constant 1
+    @1
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// add
+    @SP
+    AM=M-1
+    D=M
+    A=A-1
+    M=M+D
+// pop local 0
+    @0
+    D=A
+    @LCL
+    D=D+M
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// goto Math.divide$WHILE_EXP2
+    @Math.divide$WHILE_EXP2
+    0;JMP
+// label Math.divide$WHILE_END3
+(Math.divide$WHILE_END3)
+// push local 1
+    @1
+    D=A
+    @LCL
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// push local 0
+    @0
+    D=A
+    @LCL
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// push constant 0
+    @0
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// gt
+    @SP
+    AM=M-1
+    D=M
+    A=A-1
+    D=M-D
+    M=-1
+    @Math.92.TGT
+    D;JGT
+    @SP
+    A=M-1
+    M=0
+(Math.92.TGT)
+// and
+    @SP
+    AM=M-1
+    D=M
+    A=A-1
+    M=M&D
+// not
+    @SP
+    A=M-1
+    M=!M
+// if-goto Math.divide$IF_ELSE4
+    @SP
+    AM=M-1
+    D=M
+    @Math.divide$IF_ELSE4
+    D;JNE
+// push local 0
+    @0
+    D=A
+    @LCL
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// neg
+    @SP
+    A=M-1
+    M=-M
+// return
+    @LCL    // FRAME = LCL
+    D=M
+    @R14
+    M=D
+    @5      // RETURN_ADDRESS = *(FRAME - 5)
+    D=-A
+    @R14
+    A=M+D
+    D=M
+    @R13
+    M=D
+    @SP     // D = *(SP - 1)
+    A=M-1
+    D=M
+    @ARG    // *ARG = D
+    A=M
+    M=D
+    D=A+1   // SP = ARG + 1
+    @SP
+    M=D
+    @R14     // THAT = *(--FRAME)
+    AM=M-1
+    D=M
+    @THAT
+    M=D
+    @R14     // THIS = *(--FRAME)
+    AM=M-1
+    D=M
+    @THIS
+    M=D
+    @R14     // ARG = *(--FRAME)
+    AM=M-1
+    D=M
+    @ARG
+    M=D
+    @R14     // LCL = *(--FRAME)
+    AM=M-1
+    D=M
+    @LCL
+    M=D
+    @R13     // JMP RETURN_ADDRESS
+    A=M
+    0;JMP    
+// label Math.divide$IF_ELSE4
+(Math.divide$IF_ELSE4)
+// push local 0
+    @0
+    D=A
+    @LCL
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// return
+    @LCL    // FRAME = LCL
+    D=M
+    @R14
+    M=D
+    @5      // RETURN_ADDRESS = *(FRAME - 5)
+    D=-A
+    @R14
+    A=M+D
+    D=M
+    @R13
+    M=D
+    @SP     // D = *(SP - 1)
+    A=M-1
+    D=M
+    @ARG    // *ARG = D
+    A=M
+    M=D
+    D=A+1   // SP = ARG + 1
+    @SP
+    M=D
+    @R14     // THAT = *(--FRAME)
+    AM=M-1
+    D=M
+    @THAT
+    M=D
+    @R14     // THIS = *(--FRAME)
+    AM=M-1
+    D=M
+    @THIS
+    M=D
+    @R14     // ARG = *(--FRAME)
+    AM=M-1
+    D=M
+    @ARG
+    M=D
+    @R14     // LCL = *(--FRAME)
+    AM=M-1
+    D=M
+    @LCL
+    M=D
+    @R13     // JMP RETURN_ADDRESS
+    A=M
+    0;JMP    
+// function Memory.init 0
+(Memory.init)
+    @SP
+    A=M
+    @0
+    D=A
+    @SP
+    M=M+D
+// push constant 0
+    @0
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// pop static 0
+    @Memory.0
+    D=A
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// push constant 2048
+    @2048
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// pop static 1
+    @Memory.1
+    D=A
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// push constant 0
+    @0
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// return
+    @LCL    // FRAME = LCL
+    D=M
+    @R14
+    M=D
+    @5      // RETURN_ADDRESS = *(FRAME - 5)
+    D=-A
+    @R14
+    A=M+D
+    D=M
+    @R13
+    M=D
+    @SP     // D = *(SP - 1)
+    A=M-1
+    D=M
+    @ARG    // *ARG = D
+    A=M
+    M=D
+    D=A+1   // SP = ARG + 1
+    @SP
+    M=D
+    @R14     // THAT = *(--FRAME)
+    AM=M-1
+    D=M
+    @THAT
+    M=D
+    @R14     // THIS = *(--FRAME)
+    AM=M-1
+    D=M
+    @THIS
+    M=D
+    @R14     // ARG = *(--FRAME)
+    AM=M-1
+    D=M
+    @ARG
+    M=D
+    @R14     // LCL = *(--FRAME)
+    AM=M-1
+    D=M
+    @LCL
+    M=D
+    @R13     // JMP RETURN_ADDRESS
+    A=M
+    0;JMP    
+// function Memory.peek 0
+(Memory.peek)
+    @SP
+    A=M
+    @0
+    D=A
+    @SP
+    M=M+D
+// push static 0
+    @Memory.0
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// push argument 0
+    @0
+    D=A
+    @ARG
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// add
+    @SP
+    AM=M-1
+    D=M
+    A=A-1
+    M=M+D
+// pop pointer 1
+    @1
+    D=A
+    @3
+    D=D+A
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// push that 0
+    @0
+    D=A
+    @THAT
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// return
+    @LCL    // FRAME = LCL
+    D=M
+    @R14
+    M=D
+    @5      // RETURN_ADDRESS = *(FRAME - 5)
+    D=-A
+    @R14
+    A=M+D
+    D=M
+    @R13
+    M=D
+    @SP     // D = *(SP - 1)
+    A=M-1
+    D=M
+    @ARG    // *ARG = D
+    A=M
+    M=D
+    D=A+1   // SP = ARG + 1
+    @SP
+    M=D
+    @R14     // THAT = *(--FRAME)
+    AM=M-1
+    D=M
+    @THAT
+    M=D
+    @R14     // THIS = *(--FRAME)
+    AM=M-1
+    D=M
+    @THIS
+    M=D
+    @R14     // ARG = *(--FRAME)
+    AM=M-1
+    D=M
+    @ARG
+    M=D
+    @R14     // LCL = *(--FRAME)
+    AM=M-1
+    D=M
+    @LCL
+    M=D
+    @R13     // JMP RETURN_ADDRESS
+    A=M
+    0;JMP    
+// function Memory.poke 0
+(Memory.poke)
+    @SP
+    A=M
+    @0
+    D=A
+    @SP
+    M=M+D
+// push static 0
+    @Memory.0
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// push argument 0
+    @0
+    D=A
+    @ARG
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// add
+    @SP
+    AM=M-1
+    D=M
+    A=A-1
+    M=M+D
+// push argument 1
+    @1
+    D=A
+    @ARG
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// pop temp 0
+    @0
+    D=A
+    @5
+    D=D+A
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// pop pointer 1
+    @1
+    D=A
+    @3
+    D=D+A
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// push temp 0
+    @0
+    D=A
+    @5
+    A=A+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// pop that 0
+    @0
+    D=A
+    @THAT
+    D=D+M
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// push constant 0
+    @0
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// return
+    @LCL    // FRAME = LCL
+    D=M
+    @R14
+    M=D
+    @5      // RETURN_ADDRESS = *(FRAME - 5)
+    D=-A
+    @R14
+    A=M+D
+    D=M
+    @R13
+    M=D
+    @SP     // D = *(SP - 1)
+    A=M-1
+    D=M
+    @ARG    // *ARG = D
+    A=M
+    M=D
+    D=A+1   // SP = ARG + 1
+    @SP
+    M=D
+    @R14     // THAT = *(--FRAME)
+    AM=M-1
+    D=M
+    @THAT
+    M=D
+    @R14     // THIS = *(--FRAME)
+    AM=M-1
+    D=M
+    @THIS
+    M=D
+    @R14     // ARG = *(--FRAME)
+    AM=M-1
+    D=M
+    @ARG
+    M=D
+    @R14     // LCL = *(--FRAME)
+    AM=M-1
+    D=M
+    @LCL
+    M=D
+    @R13     // JMP RETURN_ADDRESS
+    A=M
+    0;JMP    
+// function Memory.alloc 1
+(Memory.alloc)
+    @SP
+    A=M
+    M=0
+    @1
+    D=A
+    @SP
+    M=M+D
+// push static 1
+    @Memory.1
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// pop local 0
+    @0
+    D=A
+    @LCL
+    D=D+M
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// push static 1
+    @Memory.1
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// push argument 0
+    @0
+    D=A
+    @ARG
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// add
+    @SP
+    AM=M-1
+    D=M
+    A=A-1
+    M=M+D
+// pop static 1
+    @Memory.1
+    D=A
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// push local 0
+    @0
+    D=A
+    @LCL
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// return
+    @LCL    // FRAME = LCL
+    D=M
+    @R14
+    M=D
+    @5      // RETURN_ADDRESS = *(FRAME - 5)
+    D=-A
+    @R14
+    A=M+D
+    D=M
+    @R13
+    M=D
+    @SP     // D = *(SP - 1)
+    A=M-1
+    D=M
+    @ARG    // *ARG = D
+    A=M
+    M=D
+    D=A+1   // SP = ARG + 1
+    @SP
+    M=D
+    @R14     // THAT = *(--FRAME)
+    AM=M-1
+    D=M
+    @THAT
+    M=D
+    @R14     // THIS = *(--FRAME)
+    AM=M-1
+    D=M
+    @THIS
+    M=D
+    @R14     // ARG = *(--FRAME)
+    AM=M-1
+    D=M
+    @ARG
+    M=D
+    @R14     // LCL = *(--FRAME)
+    AM=M-1
+    D=M
+    @LCL
+    M=D
+    @R13     // JMP RETURN_ADDRESS
+    A=M
+    0;JMP    
+// function Point.new 0
+(Point.new)
+    @SP
+    A=M
+    @0
+    D=A
+    @SP
+    M=M+D
+// push constant 2
+    @2
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// call Memory.alloc 1
+    @Point.3.RETURN_ADDRESS   // *(++SP) = Point.3.RETURN_ADDRESS
+    D=A
+    @SP
+    A=M
+    M=D
+    @LCL    // *(++SP) = LCL
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @ARG    // *(++SP) = ARG
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THIS   // *(++SP) = THIS
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THAT   // *(++SP) = THAT
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @SP     // SP++
+    M=M+1
+    @6     // ARG = SP - n - 5
+    D=-A
+    @SP
+    D=D+M
+    @ARG
+    M=D
+    @SP     // LCL = SP
+    D=M
+    @LCL
+    M=D
+    @Memory.alloc     // JMP TGT_FUNCTION
+    0;JMP
+(Point.3.RETURN_ADDRESS)
+// pop pointer 0
+    @0
+    D=A
+    @3
+    D=D+A
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// push argument 0
+    @0
+    D=A
+    @ARG
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// pop this 0
+    @0
+    D=A
+    @THIS
+    D=D+M
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// push argument 1
+    @1
+    D=A
+    @ARG
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// pop this 1
+    @1
+    D=A
+    @THIS
+    D=D+M
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// push static 0
+    @Point.0
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// push constant 1
+    @1
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// add
+    @SP
+    AM=M-1
+    D=M
+    A=A-1
+    M=M+D
+// pop static 0
+    @Point.0
+    D=A
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// push pointer 0
+    @0
+    D=A
+    @3
+    A=A+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// return
+    @LCL    // FRAME = LCL
+    D=M
+    @R14
+    M=D
+    @5      // RETURN_ADDRESS = *(FRAME - 5)
+    D=-A
+    @R14
+    A=M+D
+    D=M
+    @R13
+    M=D
+    @SP     // D = *(SP - 1)
+    A=M-1
+    D=M
+    @ARG    // *ARG = D
+    A=M
+    M=D
+    D=A+1   // SP = ARG + 1
+    @SP
+    M=D
+    @R14     // THAT = *(--FRAME)
+    AM=M-1
+    D=M
+    @THAT
+    M=D
+    @R14     // THIS = *(--FRAME)
+    AM=M-1
+    D=M
+    @THIS
+    M=D
+    @R14     // ARG = *(--FRAME)
+    AM=M-1
+    D=M
+    @ARG
+    M=D
+    @R14     // LCL = *(--FRAME)
+    AM=M-1
+    D=M
+    @LCL
+    M=D
+    @R13     // JMP RETURN_ADDRESS
+    A=M
+    0;JMP    
+// function Point.getX 0
+(Point.getX)
+    @SP
+    A=M
+    @0
+    D=A
+    @SP
+    M=M+D
+// push argument 0
+    @0
+    D=A
+    @ARG
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// pop pointer 0
+    @0
+    D=A
+    @3
+    D=D+A
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// push this 0
+    @0
+    D=A
+    @THIS
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// return
+    @LCL    // FRAME = LCL
+    D=M
+    @R14
+    M=D
+    @5      // RETURN_ADDRESS = *(FRAME - 5)
+    D=-A
+    @R14
+    A=M+D
+    D=M
+    @R13
+    M=D
+    @SP     // D = *(SP - 1)
+    A=M-1
+    D=M
+    @ARG    // *ARG = D
+    A=M
+    M=D
+    D=A+1   // SP = ARG + 1
+    @SP
+    M=D
+    @R14     // THAT = *(--FRAME)
+    AM=M-1
+    D=M
+    @THAT
+    M=D
+    @R14     // THIS = *(--FRAME)
+    AM=M-1
+    D=M
+    @THIS
+    M=D
+    @R14     // ARG = *(--FRAME)
+    AM=M-1
+    D=M
+    @ARG
+    M=D
+    @R14     // LCL = *(--FRAME)
+    AM=M-1
+    D=M
+    @LCL
+    M=D
+    @R13     // JMP RETURN_ADDRESS
+    A=M
+    0;JMP    
+// function Point.getY 0
+(Point.getY)
+    @SP
+    A=M
+    @0
+    D=A
+    @SP
+    M=M+D
+// push argument 0
+    @0
+    D=A
+    @ARG
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// pop pointer 0
+    @0
+    D=A
+    @3
+    D=D+A
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// push this 1
+    @1
+    D=A
+    @THIS
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// return
+    @LCL    // FRAME = LCL
+    D=M
+    @R14
+    M=D
+    @5      // RETURN_ADDRESS = *(FRAME - 5)
+    D=-A
+    @R14
+    A=M+D
+    D=M
+    @R13
+    M=D
+    @SP     // D = *(SP - 1)
+    A=M-1
+    D=M
+    @ARG    // *ARG = D
+    A=M
+    M=D
+    D=A+1   // SP = ARG + 1
+    @SP
+    M=D
+    @R14     // THAT = *(--FRAME)
+    AM=M-1
+    D=M
+    @THAT
+    M=D
+    @R14     // THIS = *(--FRAME)
+    AM=M-1
+    D=M
+    @THIS
+    M=D
+    @R14     // ARG = *(--FRAME)
+    AM=M-1
+    D=M
+    @ARG
+    M=D
+    @R14     // LCL = *(--FRAME)
+    AM=M-1
+    D=M
+    @LCL
+    M=D
+    @R13     // JMP RETURN_ADDRESS
+    A=M
+    0;JMP    
+// function Point.plus 0
+(Point.plus)
+    @SP
+    A=M
+    @0
+    D=A
+    @SP
+    M=M+D
+// push argument 0
+    @0
+    D=A
+    @ARG
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// pop pointer 0
+    @0
+    D=A
+    @3
+    D=D+A
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// push this 0
+    @0
+    D=A
+    @THIS
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// push argument 1
+    @1
+    D=A
+    @ARG
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// call Point.getX 1
+    @Point.30.RETURN_ADDRESS   // *(++SP) = Point.30.RETURN_ADDRESS
+    D=A
+    @SP
+    A=M
+    M=D
+    @LCL    // *(++SP) = LCL
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @ARG    // *(++SP) = ARG
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THIS   // *(++SP) = THIS
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THAT   // *(++SP) = THAT
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @SP     // SP++
+    M=M+1
+    @6     // ARG = SP - n - 5
+    D=-A
+    @SP
+    D=D+M
+    @ARG
+    M=D
+    @SP     // LCL = SP
+    D=M
+    @LCL
+    M=D
+    @Point.getX     // JMP TGT_FUNCTION
+    0;JMP
+(Point.30.RETURN_ADDRESS)
+// add
+    @SP
+    AM=M-1
+    D=M
+    A=A-1
+    M=M+D
+// push this 1
+    @1
+    D=A
+    @THIS
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// push argument 1
+    @1
+    D=A
+    @ARG
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// call Point.getY 1
+    @Point.34.RETURN_ADDRESS   // *(++SP) = Point.34.RETURN_ADDRESS
+    D=A
+    @SP
+    A=M
+    M=D
+    @LCL    // *(++SP) = LCL
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @ARG    // *(++SP) = ARG
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THIS   // *(++SP) = THIS
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THAT   // *(++SP) = THAT
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @SP     // SP++
+    M=M+1
+    @6     // ARG = SP - n - 5
+    D=-A
+    @SP
+    D=D+M
+    @ARG
+    M=D
+    @SP     // LCL = SP
+    D=M
+    @LCL
+    M=D
+    @Point.getY     // JMP TGT_FUNCTION
+    0;JMP
+(Point.34.RETURN_ADDRESS)
+// add
+    @SP
+    AM=M-1
+    D=M
+    A=A-1
+    M=M+D
+// call Point.new 2
+    @Point.36.RETURN_ADDRESS   // *(++SP) = Point.36.RETURN_ADDRESS
+    D=A
+    @SP
+    A=M
+    M=D
+    @LCL    // *(++SP) = LCL
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @ARG    // *(++SP) = ARG
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THIS   // *(++SP) = THIS
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THAT   // *(++SP) = THAT
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @SP     // SP++
+    M=M+1
+    @7     // ARG = SP - n - 5
+    D=-A
+    @SP
+    D=D+M
+    @ARG
+    M=D
+    @SP     // LCL = SP
+    D=M
+    @LCL
+    M=D
+    @Point.new     // JMP TGT_FUNCTION
+    0;JMP
+(Point.36.RETURN_ADDRESS)
+// return
+    @LCL    // FRAME = LCL
+    D=M
+    @R14
+    M=D
+    @5      // RETURN_ADDRESS = *(FRAME - 5)
+    D=-A
+    @R14
+    A=M+D
+    D=M
+    @R13
+    M=D
+    @SP     // D = *(SP - 1)
+    A=M-1
+    D=M
+    @ARG    // *ARG = D
+    A=M
+    M=D
+    D=A+1   // SP = ARG + 1
+    @SP
+    M=D
+    @R14     // THAT = *(--FRAME)
+    AM=M-1
+    D=M
+    @THAT
+    M=D
+    @R14     // THIS = *(--FRAME)
+    AM=M-1
+    D=M
+    @THIS
+    M=D
+    @R14     // ARG = *(--FRAME)
+    AM=M-1
+    D=M
+    @ARG
+    M=D
+    @R14     // LCL = *(--FRAME)
+    AM=M-1
+    D=M
+    @LCL
+    M=D
+    @R13     // JMP RETURN_ADDRESS
+    A=M
+    0;JMP    
+// function Point.dot 0
+(Point.dot)
+    @SP
+    A=M
+    @0
+    D=A
+    @SP
+    M=M+D
+// push argument 0
+    @0
+    D=A
+    @ARG
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// pop pointer 0
+    @0
+    D=A
+    @3
+    D=D+A
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// push this 0
+    @0
+    D=A
+    @THIS
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// push argument 1
+    @1
+    D=A
+    @ARG
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// call Point.getX 1
+    @Point.43.RETURN_ADDRESS   // *(++SP) = Point.43.RETURN_ADDRESS
+    D=A
+    @SP
+    A=M
+    M=D
+    @LCL    // *(++SP) = LCL
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @ARG    // *(++SP) = ARG
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THIS   // *(++SP) = THIS
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THAT   // *(++SP) = THAT
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @SP     // SP++
+    M=M+1
+    @6     // ARG = SP - n - 5
+    D=-A
+    @SP
+    D=D+M
+    @ARG
+    M=D
+    @SP     // LCL = SP
+    D=M
+    @LCL
+    M=D
+    @Point.getX     // JMP TGT_FUNCTION
+    0;JMP
+(Point.43.RETURN_ADDRESS)
+// call Math.multiply 2
+    @Point.44.RETURN_ADDRESS   // *(++SP) = Point.44.RETURN_ADDRESS
+    D=A
+    @SP
+    A=M
+    M=D
+    @LCL    // *(++SP) = LCL
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @ARG    // *(++SP) = ARG
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THIS   // *(++SP) = THIS
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THAT   // *(++SP) = THAT
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @SP     // SP++
+    M=M+1
+    @7     // ARG = SP - n - 5
+    D=-A
+    @SP
+    D=D+M
+    @ARG
+    M=D
+    @SP     // LCL = SP
+    D=M
+    @LCL
+    M=D
+    @Math.multiply     // JMP TGT_FUNCTION
+    0;JMP
+(Point.44.RETURN_ADDRESS)
+// push this 1
+    @1
+    D=A
+    @THIS
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// push argument 1
+    @1
+    D=A
+    @ARG
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// call Point.getY 1
+    @Point.47.RETURN_ADDRESS   // *(++SP) = Point.47.RETURN_ADDRESS
+    D=A
+    @SP
+    A=M
+    M=D
+    @LCL    // *(++SP) = LCL
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @ARG    // *(++SP) = ARG
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THIS   // *(++SP) = THIS
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THAT   // *(++SP) = THAT
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @SP     // SP++
+    M=M+1
+    @6     // ARG = SP - n - 5
+    D=-A
+    @SP
+    D=D+M
+    @ARG
+    M=D
+    @SP     // LCL = SP
+    D=M
+    @LCL
+    M=D
+    @Point.getY     // JMP TGT_FUNCTION
+    0;JMP
+(Point.47.RETURN_ADDRESS)
+// call Math.multiply 2
+    @Point.48.RETURN_ADDRESS   // *(++SP) = Point.48.RETURN_ADDRESS
+    D=A
+    @SP
+    A=M
+    M=D
+    @LCL    // *(++SP) = LCL
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @ARG    // *(++SP) = ARG
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THIS   // *(++SP) = THIS
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THAT   // *(++SP) = THAT
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @SP     // SP++
+    M=M+1
+    @7     // ARG = SP - n - 5
+    D=-A
+    @SP
+    D=D+M
+    @ARG
+    M=D
+    @SP     // LCL = SP
+    D=M
+    @LCL
+    M=D
+    @Math.multiply     // JMP TGT_FUNCTION
+    0;JMP
+(Point.48.RETURN_ADDRESS)
+// add
+    @SP
+    AM=M-1
+    D=M
+    A=A-1
+    M=M+D
+// return
+    @LCL    // FRAME = LCL
+    D=M
+    @R14
+    M=D
+    @5      // RETURN_ADDRESS = *(FRAME - 5)
+    D=-A
+    @R14
+    A=M+D
+    D=M
+    @R13
+    M=D
+    @SP     // D = *(SP - 1)
+    A=M-1
+    D=M
+    @ARG    // *ARG = D
+    A=M
+    M=D
+    D=A+1   // SP = ARG + 1
+    @SP
+    M=D
+    @R14     // THAT = *(--FRAME)
+    AM=M-1
+    D=M
+    @THAT
+    M=D
+    @R14     // THIS = *(--FRAME)
+    AM=M-1
+    D=M
+    @THIS
+    M=D
+    @R14     // ARG = *(--FRAME)
+    AM=M-1
+    D=M
+    @ARG
+    M=D
+    @R14     // LCL = *(--FRAME)
+    AM=M-1
+    D=M
+    @LCL
+    M=D
+    @R13     // JMP RETURN_ADDRESS
+    A=M
+    0;JMP    
+// function Point.count 0
+(Point.count)
+    @SP
+    A=M
+    @0
+    D=A
+    @SP
+    M=M+D
+// push static 0
+    @Point.0
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// return
+    @LCL    // FRAME = LCL
+    D=M
+    @R14
+    M=D
+    @5      // RETURN_ADDRESS = *(FRAME - 5)
+    D=-A
+    @R14
+    A=M+D
+    D=M
+    @R13
+    M=D
+    @SP     // D = *(SP - 1)
+    A=M-1
+    D=M
+    @ARG    // *ARG = D
+    A=M
+    M=D
+    D=A+1   // SP = ARG + 1
+    @SP
+    M=D
+    @R14     // THAT = *(--FRAME)
+    AM=M-1
+    D=M
+    @THAT
+    M=D
+    @R14     // THIS = *(--FRAME)
+    AM=M-1
+    D=M
+    @THIS
+    M=D
+    @R14     // ARG = *(--FRAME)
+    AM=M-1
+    D=M
+    @ARG
+    M=D
+    @R14     // LCL = *(--FRAME)
+    AM=M-1
+    D=M
+    @LCL
+    M=D
+    @R13     // JMP RETURN_ADDRESS
+    A=M
+    0;JMP    
+// function String.new 0
+(String.new)
+    @SP
+    A=M
+    @0
+    D=A
+    @SP
+    M=M+D
+// push constant 2
+    @2
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// call Memory.alloc 1
+    @String.3.RETURN_ADDRESS   // *(++SP) = String.3.RETURN_ADDRESS
+    D=A
+    @SP
+    A=M
+    M=D
+    @LCL    // *(++SP) = LCL
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @ARG    // *(++SP) = ARG
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THIS   // *(++SP) = THIS
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THAT   // *(++SP) = THAT
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @SP     // SP++
+    M=M+1
+    @6     // ARG = SP - n - 5
+    D=-A
+    @SP
+    D=D+M
+    @ARG
+    M=D
+    @SP     // LCL = SP
+    D=M
+    @LCL
+    M=D
+    @Memory.alloc     // JMP TGT_FUNCTION
+    0;JMP
+(String.3.RETURN_ADDRESS)
+// pop pointer 0
+    @0
+    D=A
+    @3
+    D=D+A
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// push argument 0
+    @0
+    D=A
+    @ARG
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// push constant 1
+    @1
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// add
+    @SP
+    AM=M-1
+    D=M
+    A=A-1
+    M=M+D
+// call Array.new 1
+    @String.8.RETURN_ADDRESS   // *(++SP) = String.8.RETURN_ADDRESS
+    D=A
+    @SP
+    A=M
+    M=D
+    @LCL    // *(++SP) = LCL
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @ARG    // *(++SP) = ARG
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THIS   // *(++SP) = THIS
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THAT   // *(++SP) = THAT
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @SP     // SP++
+    M=M+1
+    @6     // ARG = SP - n - 5
+    D=-A
+    @SP
+    D=D+M
+    @ARG
+    M=D
+    @SP     // LCL = SP
+    D=M
+    @LCL
+    M=D
+    @Array.new     // JMP TGT_FUNCTION
+    0;JMP
+(String.8.RETURN_ADDRESS)
+// pop this 0
+    @0
+    D=A
+    @THIS
+    D=D+M
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// push constant 0
+    @0
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// pop this 1
+    @1
+    D=A
+    @THIS
+    D=D+M
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// push pointer 0
+    @0
+    D=A
+    @3
+    A=A+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// return
+    @LCL    // FRAME = LCL
+    D=M
+    @R14
+    M=D
+    @5      // RETURN_ADDRESS = *(FRAME - 5)
+    D=-A
+    @R14
+    A=M+D
+    D=M
+    @R13
+    M=D
+    @SP     // D = *(SP - 1)
+    A=M-1
+    D=M
+    @ARG    // *ARG = D
+    A=M
+    M=D
+    D=A+1   // SP = ARG + 1
+    @SP
+    M=D
+    @R14     // THAT = *(--FRAME)
+    AM=M-1
+    D=M
+    @THAT
+    M=D
+    @R14     // THIS = *(--FRAME)
+    AM=M-1
+    D=M
+    @THIS
+    M=D
+    @R14     // ARG = *(--FRAME)
+    AM=M-1
+    D=M
+    @ARG
+    M=D
+    @R14     // LCL = *(--FRAME)
+    AM=M-1
+    D=M
+    @LCL
+    M=D
+    @R13     // JMP RETURN_ADDRESS
+    A=M
+    0;JMP    
+// function String.appendChar 0
+(String.appendChar)
+    @SP
+    A=M
+    @0
+    D=A
+    @SP
+    M=M+D
+// push argument 0
+    @0
+    D=A
+    @ARG
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// pop pointer 0
+    @0
+    D=A
+    @3
+    D=D+A
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// push this 0
+    @0
+    D=A
+    @THIS
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// push this 1
+    @1
+    D=A
+    @THIS
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// add
+    @SP
+    AM=M-1
+    D=M
+    A=A-1
+    M=M+D
+// push argument 1
+    @1
+    D=A
+    @ARG
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// pop temp 0
+    @0
+    D=A
+    @5
+    D=D+A
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// pop pointer 1
+    @1
+    D=A
+    @3
+    D=D+A
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// push temp 0
+    @0
+    D=A
+    @5
+    A=A+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// pop that 0
+    @0
+    D=A
+    @THAT
+    D=D+M
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// push this 1
+    @1
+    D=A
+    @THIS
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// push constant 1
+    @1
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// add
+    @SP
+    AM=M-1
+    D=M
+    A=A-1
+    M=M+D
+// pop this 1
+    @1
+    D=A
+    @THIS
+    D=D+M
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// push pointer 0
+    @0
+    D=A
+    @3
+    A=A+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// return
+    @LCL    // FRAME = LCL
+    D=M
+    @R14
+    M=D
+    @5      // RETURN_ADDRESS = *(FRAME - 5)
+    D=-A
+    @R14
+    A=M+D
+    D=M
+    @R13
+    M=D
+    @SP     // D = *(SP - 1)
+    A=M-1
+    D=M
+    @ARG    // *ARG = D
+    A=M
+    M=D
+    D=A+1   // SP = ARG + 1
+    @SP
+    M=D
+    @R14     // THAT = *(--FRAME)
+    AM=M-1
+    D=M
+    @THAT
+    M=D
+    @R14     // THIS = *(--FRAME)
+    AM=M-1
+    D=M
+    @THIS
+    M=D
+    @R14     // ARG = *(--FRAME)
+    AM=M-1
+    D=M
+    @ARG
+    M=D
+    @R14     // LCL = *(--FRAME)
+    AM=M-1
+    D=M
+    @LCL
+    M=D
+    @R13     // JMP RETURN_ADDRESS
+    A=M
+    0;JMP    
+// function String.length 0
+(String.length)
+    @SP
+    A=M
+    @0
+    D=A
+    @SP
+    M=M+D
+// push argument 0
+    @0
+    D=A
+    @ARG
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// pop pointer 0
+    @0
+    D=A
+    @3
+    D=D+A
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// push this 1
+    @1
+    D=A
+    @THIS
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// return
+    @LCL    // FRAME = LCL
+    D=M
+    @R14
+    M=D
+    @5      // RETURN_ADDRESS = *(FRAME - 5)
+    D=-A
+    @R14
+    A=M+D
+    D=M
+    @R13
+    M=D
+    @SP     // D = *(SP - 1)
+    A=M-1
+    D=M
+    @ARG    // *ARG = D
+    A=M
+    M=D
+    D=A+1   // SP = ARG + 1
+    @SP
+    M=D
+    @R14     // THAT = *(--FRAME)
+    AM=M-1
+    D=M
+    @THAT
+    M=D
+    @R14     // THIS = *(--FRAME)
+    AM=M-1
+    D=M
+    @THIS
+    M=D
+    @R14     // ARG = *(--FRAME)
+    AM=M-1
+    D=M
+    @ARG
+    M=D
+    @R14     // LCL = *(--FRAME)
+    AM=M-1
+    D=M
+    @LCL
+    M=D
+    @R13     // JMP RETURN_ADDRESS
+    A=M
+    0;JMP    
+// function String.charAt 0
+(String.charAt)
+    @SP
+    A=M
+    @0
+    D=A
+    @SP
+    M=M+D
+// push argument 0
+    @0
+    D=A
+    @ARG
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// pop pointer 0
+    @0
+    D=A
+    @3
+    D=D+A
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// push this 0
+    @0
+    D=A
+    @THIS
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// push argument 1
+    @1
+    D=A
+    @ARG
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// add
+    @SP
+    AM=M-1
+    D=M
+    A=A-1
+    M=M+D
+// pop pointer 1
+    @1
+    D=A
+    @3
+    D=D+A
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// push that 0
+    @0
+    D=A
+    @THAT
+    A=M+D
+    D=M
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// return
+    @LCL    // FRAME = LCL
+    D=M
+    @R14
+    M=D
+    @5      // RETURN_ADDRESS = *(FRAME - 5)
+    D=-A
+    @R14
+    A=M+D
+    D=M
+    @R13
+    M=D
+    @SP     // D = *(SP - 1)
+    A=M-1
+    D=M
+    @ARG    // *ARG = D
+    A=M
+    M=D
+    D=A+1   // SP = ARG + 1
+    @SP
+    M=D
+    @R14     // THAT = *(--FRAME)
+    AM=M-1
+    D=M
+    @THAT
+    M=D
+    @R14     // THIS = *(--FRAME)
+    AM=M-1
+    D=M
+    @THIS
+    M=D
+    @R14     // ARG = *(--FRAME)
+    AM=M-1
+    D=M
+    @ARG
+    M=D
+    @R14     // LCL = *(--FRAME)
+    AM=M-1
+    D=M
+    @LCL
+    M=D
+    @R13     // JMP RETURN_ADDRESS
+    A=M
+    0;JMP    
+// function Sys.init 0
+(Sys.init)
+    @SP
+    A=M
+    @0
+    D=A
+    @SP
+    M=M+D
+// call Memory.init 0
+    @Sys.2.RETURN_ADDRESS   // *(++SP) = Sys.2.RETURN_ADDRESS
+    D=A
+    @SP
+    A=M
+    M=D
+    @LCL    // *(++SP) = LCL
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @ARG    // *(++SP) = ARG
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THIS   // *(++SP) = THIS
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THAT   // *(++SP) = THAT
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @SP     // SP++
+    M=M+1
+    @5     // ARG = SP - n - 5
+    D=-A
+    @SP
+    D=D+M
+    @ARG
+    M=D
+    @SP     // LCL = SP
+    D=M
+    @LCL
+    M=D
+    @Memory.init     // JMP TGT_FUNCTION
+    0;JMP
+(Sys.2.RETURN_ADDRESS)
+// pop temp 0
+    @0
+    D=A
+    @5
+    D=D+A
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// call Main.main 0
+    @Sys.4.RETURN_ADDRESS   // *(++SP) = Sys.4.RETURN_ADDRESS
+    D=A
+    @SP
+    A=M
+    M=D
+    @LCL    // *(++SP) = LCL
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @ARG    // *(++SP) = ARG
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THIS   // *(++SP) = THIS
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THAT   // *(++SP) = THAT
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @SP     // SP++
+    M=M+1
+    @5     // ARG = SP - n - 5
+    D=-A
+    @SP
+    D=D+M
+    @ARG
+    M=D
+    @SP     // LCL = SP
+    D=M
+    @LCL
+    M=D
+    @Main.main     // JMP TGT_FUNCTION
+    0;JMP
+(Sys.4.RETURN_ADDRESS)
+// pop temp 0
+    @0
+    D=A
+    @5
+    D=D+A
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// call Sys.halt 0
+    @Sys.6.RETURN_ADDRESS   // *(++SP) = Sys.6.RETURN_ADDRESS
+    D=A
+    @SP
+    A=M
+    M=D
+    @LCL    // *(++SP) = LCL
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @ARG    // *(++SP) = ARG
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THIS   // *(++SP) = THIS
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THAT   // *(++SP) = THAT
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @SP     // SP++
+    M=M+1
+    @5     // ARG = SP - n - 5
+    D=-A
+    @SP
+    D=D+M
+    @ARG
+    M=D
+    @SP     // LCL = SP
+    D=M
+    @LCL
+    M=D
+    @Sys.halt     // JMP TGT_FUNCTION
+    0;JMP
+(Sys.6.RETURN_ADDRESS)
+// pop temp 0
+    @0
+    D=A
+    @5
+    D=D+A
+    @R15
+    M=D
+    @SP
+    AM=M-1
+    D=M
+    @R15
+    A=M
+    M=D
+// push constant 0
+    @0
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// return
+    @LCL    // FRAME = LCL
+    D=M
+    @R14
+    M=D
+    @5      // RETURN_ADDRESS = *(FRAME - 5)
+    D=-A
+    @R14
+    A=M+D
+    D=M
+    @R13
+    M=D
+    @SP     // D = *(SP - 1)
+    A=M-1
+    D=M
+    @ARG    // *ARG = D
+    A=M
+    M=D
+    D=A+1   // SP = ARG + 1
+    @SP
+    M=D
+    @R14     // THAT = *(--FRAME)
+    AM=M-1
+    D=M
+    @THAT
+    M=D
+    @R14     // THIS = *(--FRAME)
+    AM=M-1
+    D=M
+    @THIS
+    M=D
+    @R14     // ARG = *(--FRAME)
+    AM=M-1
+    D=M
+    @ARG
+    M=D
+    @R14     // LCL = *(--FRAME)
+    AM=M-1
+    D=M
+    @LCL
+    M=D
+    @R13     // JMP RETURN_ADDRESS
+    A=M
+    0;JMP    
+// function Sys.halt 0
+(Sys.halt)
+    @SP
+    A=M
+    @0
+    D=A
+    @SP
+    M=M+D
+// label Sys.halt$WHILE_EXP0
+(Sys.halt$WHILE_EXP0)
+// push constant 1
+    @1
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// neg
+    @SP
+    A=M-1
+    M=-M
+// not
+    @SP
+    A=M-1
+    M=!M
+// if-goto Sys.halt$WHILE_END1
+    @SP
+    AM=M-1
+    D=M
+    @Sys.halt$WHILE_END1
+    D;JNE
+// goto Sys.halt$WHILE_EXP0
+    @Sys.halt$WHILE_EXP0
+    0;JMP
+// label Sys.halt$WHILE_END1
+(Sys.halt$WHILE_END1)
+// push constant 0
+    @0
+    D=A
+    @SP
+    AM=M+1
+    A=A-1
+    M=D
+// return
+    @LCL    // FRAME = LCL
+    D=M
+    @R14
+    M=D
+    @5      // RETURN_ADDRESS = *(FRAME - 5)
+    D=-A
+    @R14
+    A=M+D
+    D=M
+    @R13
+    M=D
+    @SP     // D = *(SP - 1)
+    A=M-1
+    D=M
+    @ARG    // *ARG = D
+    A=M
+    M=D
+    D=A+1   // SP = ARG + 1
+    @SP
+    M=D
+    @R14     // THAT = *(--FRAME)
+    AM=M-1
+    D=M
+    @THAT
+    M=D
+    @R14     // THIS = *(--FRAME)
+    AM=M-1
+    D=M
+    @THIS
+    M=D
+    @R14     // ARG = *(--FRAME)
+    AM=M-1
+    D=M
+    @ARG
+    M=D
+    @R14     // LCL = *(--FRAME)
+    AM=M-1
+    D=M
+    @LCL
+    M=D
+    @R13     // JMP RETURN_ADDRESS
+    A=M
+    0;JMP    
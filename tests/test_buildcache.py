@@ -0,0 +1,40 @@
+import pytest
+
+from buildcache import BuildCache
+
+FLAGS = (('O', True), ('S', False), ('P', False))
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return BuildCache(str(tmp_path / 'cache'), 'version')
+
+
+def test_key_covers_every_input(cache):
+    key = cache.key('Main', 'push constant 1\n', FLAGS)
+    assert cache.key('Main', 'push constant 1\n', FLAGS) == key
+    assert cache.key('Main', 'push constant 2\n', FLAGS) != key
+    assert cache.key('Sys', 'push constant 1\n', FLAGS) != key
+    assert cache.key('Main', 'push constant 1\n', FLAGS[ :2]) != key
+    other = BuildCache(cache.directory, 'other version')
+    assert other.key('Main', 'push constant 1\n', FLAGS) != key
+
+def test_store_and_load(cache):
+    key = cache.key('Main', 'push constant 1\n', FLAGS)
+    assert cache.load('Main', FLAGS, key) is None
+    cache.store('Main', FLAGS, key, '@1\nD=A\n')
+    assert cache.load('Main', FLAGS, key) == '@1\nD=A\n'
+    stale = cache.key('Main', 'push constant 2\n', FLAGS)
+    assert cache.load('Main', FLAGS, stale) is None
+
+def test_interrupted_writer_keeps_old_entry(cache, tmp_path):
+    key = cache.key('Main', 'push constant 1\n', FLAGS)
+    cache.store('Main', FLAGS, key, '@1\n')
+    with pytest.raises(ValueError):
+        with cache.writer('Main', FLAGS, 'new key') as f:
+            f.write('@2\n')
+            raise ValueError
+    assert cache.load('Main', FLAGS, key) == '@1\n'
+    assert [path.name for path in (tmp_path / 'cache').iterdir()] == [
+        'Main.O.asm'
+    ]
@@ -0,0 +1,45 @@
+import os
+import subprocess
+import sys
+
+import corpus
+import vmtranslator
+from hackassembler import Assembler
+
+from conftest import ROOT, read
+
+
+def test_same_seed_gives_same_corpus():
+    assert corpus.generate_jack(3, 2, 1) == corpus.generate_jack(3, 2, 1)
+    assert corpus.generate_jack(3, 2, 1) != corpus.generate_jack(3, 2, 2)
+    assert corpus.generate_asm(3, 2, 1) == corpus.generate_asm(3, 2, 1)
+
+# The corpus does not depend on string hashing, which changes between runs.
+def test_corpus_is_same_across_processes():
+    script = (
+        'import sys; sys.path.insert(0, "benchmarks"); import corpus; '
+        'print(corpus.generate_vm(3, 2, 1), end="")'
+    )
+    outputs = [
+        subprocess.run(
+            [sys.executable, '-c', script], cwd=ROOT, check=True,
+            capture_output=True, text=True,
+            env={**os.environ, 'PYTHONHASHSEED': seed},
+        ).stdout
+        for seed in ('1', '2')
+    ]
+    assert outputs[0] == outputs[1] == corpus.generate_vm(3, 2, 1)
+
+def test_asm_programs_fit_in_rom():
+    programs = corpus.generate_asm(20, 3, 0)
+    assert len(programs) > 1
+    for asm_code in programs:
+        words = Assembler().assemble(asm_code.split('\n'))
+        assert 0 < len(words) <= corpus.ROM_SIZE
+
+def test_write_corpus(tmp_path):
+    paths = corpus.write_corpus(str(tmp_path), 3, 2, 1)
+    names = [os.path.basename(path) for path in paths]
+    assert names[ :2] == ['Corpus.jack', 'Corpus.vm']
+    assert read(paths[1]) == corpus.generate_vm(3, 2, 1)
+    assert sum(1 for command in vmtranslator.parse(read(paths[1]), '')) > 0
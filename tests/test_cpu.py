@@ -0,0 +1,42 @@
+from cpu import (
+    BREAKPOINT, CYCLE_LIMIT, END_OF_PROGRAM, HALTED, HackCPU,
+)
+
+from conftest import RESULT, run_result
+
+# @2; D=A; @3; D=D+A; @0; M=D; (END) @6; 0;JMP
+SUM = [2, 0xEC10, 3, 0xE090, 0, 0xE308, 6, 0xEA87]
+
+
+def test_runs_baseline_program(expected_words, halt_address):
+    assert run_result(HackCPU(expected_words), halt_address) == RESULT
+
+def test_halts_on_jump_to_itself():
+    cpu = HackCPU(SUM)
+    assert cpu.run() == HALTED
+    assert cpu.ram[0] == 5
+    assert cpu.pc == 6
+
+def test_cycle_limit_is_exact():
+    cpu = HackCPU(SUM)
+    assert cpu.run(3) == CYCLE_LIMIT
+    assert (cpu.pc, cpu.cycles, cpu.d) == (3, 3, 2)
+    assert cpu.run() == HALTED
+    assert cpu.ram[0] == 5
+
+def test_breakpoint_stops_before_instruction():
+    cpu = HackCPU(SUM)
+    assert cpu.run(breakpoints={4}) == BREAKPOINT
+    assert (cpu.pc, cpu.cycles, cpu.ram[0]) == (4, 4, 0)
+    assert cpu.run(breakpoints={4}) == HALTED
+
+def test_end_of_program():
+    cpu = HackCPU([1, 0xEC10])
+    assert cpu.run() == END_OF_PROGRAM
+    assert cpu.d == 1
+
+def test_arithmetic_wraps_to_16_bits():
+    # @32767; D=A; D=D+1; @0; M=D
+    cpu = HackCPU([32767, 0xEC10, 0xE7D0, 0, 0xE308])
+    assert cpu.run() == END_OF_PROGRAM
+    assert cpu.ram[0] == -32768
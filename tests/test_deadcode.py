@@ -0,0 +1,67 @@
+import pytest
+
+import deadcode
+import vmtranslator
+
+CODE = '''\
+call Sys.init 0
+function Sys.init 0
+call Main.main 0
+return
+function Main.main 0
+call Main.used 0
+return
+function Main.used 0
+push constant 1
+return
+function Main.unused 0
+call Main.used 0
+call Main.unreached 0
+return
+function Main.unreached 0 // only called from unused code
+return
+'''
+
+
+def graph(code):
+    return deadcode.add_calls({}, vmtranslator.parse(code, 'Main'))
+
+
+def test_add_calls():
+    assert graph(CODE) == {
+        None: {'Sys.init'},
+        'Sys.init': {'Main.main'},
+        'Main.main': {'Main.used'},
+        'Main.used': set(),
+        'Main.unused': {'Main.used', 'Main.unreached'},
+        'Main.unreached': set(),
+    }
+
+def test_live_functions():
+    assert deadcode.live_functions(graph(CODE)) == {
+        None, 'Sys.init', 'Main.main', 'Main.used',
+    }
+
+def test_live_functions_needs_sys_init():
+    with pytest.raises(ValueError, match='No Sys.init function'):
+        deadcode.live_functions(graph('function Main.main 0\nreturn\n'))
+
+# Removed lines are blanked, so the line numbers that labels are made from
+# stay the same.
+def test_remove_functions_keeps_line_numbers():
+    dead = {'Main.unused', 'Main.unreached'}
+    lines = list(deadcode.remove_functions(CODE, dead))
+    assert len(lines) == len(CODE.split('\n'))
+    assert lines[ :10] == CODE.split('\n')[ :10]
+    assert not any(lines[10: ])
+    assert vmtranslator.translate(lines, 'Main') == vmtranslator.translate(
+        '\n'.join(lines), 'Main'
+    )
+
+def test_filter_functions_passes_none_for_leading_code():
+    names = []
+    list(deadcode.filter_functions(CODE, lambda name: names.append(name)))
+    assert names == [
+        None, 'Sys.init', 'Main.main', 'Main.used', 'Main.unused',
+        'Main.unreached',
+    ]
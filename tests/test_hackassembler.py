@@ -0,0 +1,165 @@
+import io
+import os
+import sys
+
+import pytest
+
+import generateasm
+import hackassembler
+import vmtranslator
+from hackassembler import (
+    COMP_INSTRUCTIONS, DEST_INSTRUCTIONS, JUMP_INSTRUCTIONS,
+    VARIABLE_BASE_ADDRESS, Assembler, ObjectModule, assemble_stream,
+    encode_c_statement, link, load_binary, load_rom, load_text,
+    translate_c_statement,
+)
+
+from conftest import EXPECTED_DIR, read
+
+
+def test_stream_matches_baseline(tmp_path):
+    output = tmp_path / 'Prog.hack'
+    assemble_stream(os.path.join(EXPECTED_DIR, 'Prog.asm'), str(output))
+    assert output.read_text() == read(os.path.join(EXPECTED_DIR, 'Prog.hack'))
+
+# Every symbol is kept once, however often it is referenced.
+def test_fixups_keep_each_symbol_once():
+    lines = ['@x', '@END', 'D=A', '@x', '(END)', '@x', '@7', '@END']
+    words, fixup_words, fixup_ids, names = (
+        Assembler().encode_instructions(lines)
+    )
+    assert names == ['x', 'END']
+    assert list(fixup_words) == [0, 1, 3, 4, 6]
+    assert list(fixup_ids) == [0, 1, 0, 0, 1]
+    assert list(Assembler().assemble(lines)) == [
+        16, 4, 0xEC10, 16, 16, 7, 4,
+    ]
+
+def test_translate_code_matches_baseline():
+    assembler = Assembler()
+    lines = read(os.path.join(EXPECTED_DIR, 'Prog.asm')).split('\n')
+    code = assembler.preprocess_code(line.strip() for line in lines)
+    assert assembler.translate_code(code) == read(
+        os.path.join(EXPECTED_DIR, 'Prog.hack')
+    )
+
+def test_instances_have_their_own_symbols():
+    first = Assembler()
+    second = Assembler()
+    assert list(first.assemble(['@x', '@y'])) == [16, 17]
+    assert list(second.assemble(['@y'])) == [VARIABLE_BASE_ADDRESS]
+    assert first.symbols['y'] == 17
+
+def test_assemble_resets_state():
+    assembler = Assembler()
+    program = ['(LOOP)', '@x', '@LOOP', '0;JMP']
+    assert list(assembler.assemble(program)) == [16, 0, 0xEA87]
+    assert list(assembler.assemble(program)) == [16, 0, 0xEA87]
+
+def test_binary_round_trip(tmp_path, expected_words):
+    output = tmp_path / 'Prog.hackbin'
+    assemble_stream(
+        os.path.join(EXPECTED_DIR, 'Prog.asm'), str(output), binary=True
+    )
+    assert output.stat().st_size == 2 * len(expected_words)
+    assert list(load_binary(str(output))) == expected_words
+    assert list(load_rom(str(output))) == expected_words
+
+def test_load_text(expected_words):
+    path = os.path.join(EXPECTED_DIR, 'Prog.hack')
+    assert list(load_text(path)) == expected_words
+    assert list(load_rom(path)) == expected_words
+
+def test_load_empty_binary(tmp_path):
+    path = tmp_path / 'empty.hackbin'
+    path.write_bytes(b'')
+    assert len(load_binary(str(path))) == 0
+
+def test_assemble_matches_baseline(expected_words):
+    lines = read(os.path.join(EXPECTED_DIR, 'Prog.asm')).split('\n')
+    assert list(Assembler().assemble(lines)) == expected_words
+
+# Every combination of fields encodes to the concatenation of their bits.
+def test_c_instruction_tables():
+    for dest, dest_bits in DEST_INSTRUCTIONS.items():
+        for comp, comp_bits in COMP_INSTRUCTIONS.items():
+            for jump, jump_bits in JUMP_INSTRUCTIONS.items():
+                line = (f'{dest}=' if dest else '') + comp
+                line += f';{jump}' if jump else ''
+                bits = '111' + comp_bits + dest_bits + jump_bits
+                assert translate_c_statement(line) == bits
+                assert encode_c_statement(line) == int(bits, 2)
+
+# The baseline program split into the bootstrap and the translation of each
+# .vm file, as the sources of separate object modules.
+@pytest.fixture
+def asm_sources(vm_sources):
+    return [generateasm.bootstrap()] + [
+        vmtranslator.translate(code, filename)
+        for filename, code in vm_sources
+    ]
+
+def assemble_object(asm_code):
+    return Assembler().assemble_object(asm_code.split('\n'))
+
+def round_trip(module):
+    f = io.StringIO()
+    module.write(f)
+    f.seek(0)
+    return ObjectModule.read(f)
+
+def test_link_matches_baseline(asm_sources, expected_words):
+    modules = [assemble_object(asm_code) for asm_code in asm_sources]
+    assert list(link(modules)) == expected_words
+    modules = [round_trip(module) for module in modules]
+    assert list(link(modules)) == expected_words
+
+def test_object_round_trip():
+    module = assemble_object('(LOOP)\n@x\nM=0\n@y\n@LOOP\n0;JMP\n@x\n')
+    copy = round_trip(module)
+    assert list(copy.words) == list(module.words)
+    assert copy.labels == module.labels == {'LOOP': 0}
+    assert copy.relocations == module.relocations == {
+        'x': [0, 5], 'y': [2], 'LOOP': [3],
+    }
+
+# Variables are allocated in order of first reference across the modules,
+# and labels of later modules are not taken for variables.
+def test_link_allocates_variables_in_order():
+    first = assemble_object('@b\n@END\n@a\n')
+    second = assemble_object('@a\n@c\n(END)\n@b\n')
+    base = VARIABLE_BASE_ADDRESS
+    assert list(link([first, second])) == [
+        base, 5, base + 1, base + 1, base + 2, base,
+    ]
+
+def test_link_duplicate_label():
+    module = assemble_object('(END)\n@END\n')
+    with pytest.raises(ValueError, match='Duplicate label "END"'):
+        link([module, module])
+
+def test_read_rejects_other_versions():
+    with pytest.raises(ValueError, match='Invalid object file'):
+        ObjectModule.read(io.StringIO('{"version": 0}'))
+    with pytest.raises(ValueError, match='Invalid object file'):
+        ObjectModule.read(io.StringIO('not json'))
+
+# Assembling every file into an object file with -c and linking them gives
+# the same program as assembling the whole program.
+def test_main_links_objects(monkeypatch, tmp_path, asm_sources,
+                            expected_words):
+    paths = []
+    for i, asm_code in enumerate(asm_sources):
+        paths.append(tmp_path / f'part{i}.asm')
+        paths[-1].write_text(asm_code)
+    monkeypatch.setattr(
+        sys, 'argv', ['hackassembler.py', '-c', *map(str, paths)]
+    )
+    hackassembler.main()
+    objects = [str(path.with_suffix('.hackobj')) for path in paths]
+    output = tmp_path / 'Prog.hack'
+    monkeypatch.setattr(
+        sys, 'argv', ['hackassembler.py', '-o', str(output), *objects]
+    )
+    hackassembler.main()
+    assert list(load_text(str(output))) == expected_words
@@ -0,0 +1,337 @@
+import io
+import os
+import sys
+
+import pytest
+
+import jackanalyzer
+import syntaxtree
+
+from codegen import CodeGenerator
+from compengine import compile_file
+from syntaxtree import Node, NodeKind
+from tokenizer import (
+    RegexTokenList, Token, TokenList, TokenStream, find_line_starts,
+)
+
+from conftest import EXPECTED_DIR, read
+
+
+# Source snippets with a scanning error, each reported the same way by every
+# tokenizer. The code before each error parses, so that the stream, which
+# scans as it parses, finds the same error. An unterminated block comment is
+# left out, as the loop never finishes scanning one.
+BAD_CODE = [
+    'class A { function void f() { let x = 1; $ } }',
+    '$ class',
+    'class A { function void f() {\n  let x = 12a;\n} }',
+    'class A { function void f() {\n  let a#b = 1;\n} }',
+    'class A { function void f() { let s = "open',
+]
+
+# Source snippets with a syntax error found by the parser.
+BAD_SYNTAX = [
+    'class A { function void f() { let x = 1 } }',
+    'class A { function void f() {\n  do g(;\n  return;\n}\n}',
+    'class A { field int x; }\nfoo',
+    'class A {',
+]
+
+
+def parse(path, tokenizer = RegexTokenList):
+    return compile_file(tokenizer(read(path)))
+
+def parse_code(code):
+    return compile_file(RegexTokenList(code))
+
+def vm_path(jack_path):
+    return os.path.splitext(jack_path)[0] + '.vm'
+
+def expected_xml(jack_path):
+    filename = os.path.splitext(os.path.basename(jack_path))[0]
+    return read(os.path.join(EXPECTED_DIR, filename + '.xml'))
+
+
+# The stored .vm files are the ones the VM interpreter and translator tests
+# run to the expected results.
+def test_codegen_matches_stored_vm(jack_paths):
+    for path in jack_paths:
+        vm_code = CodeGenerator().generate(parse(path))
+        assert vm_code == read(vm_path(path)), path
+
+def test_codegen_rejects_duplicate_declaration():
+    tree = parse_code(
+        'class A { function void f() { var int x, x; return; } }'
+    )
+    with pytest.raises(ValueError, match='Duplicate declaration of "x"'):
+        CodeGenerator().generate(tree)
+
+# The baseline analyzer wrote as_xml(2, True) without its leading newline.
+def test_as_xml_matches_baseline(jack_paths):
+    for path in jack_paths:
+        assert parse(path).as_xml(2, True)[1: ] + '\n' == expected_xml(path)
+
+def test_node_accessors():
+    tree = parse_code('class A { static int x, y; }')
+    [class_tree] = tree.subtrees(NodeKind.CLASS)
+    [var_dec] = class_tree.subtrees(NodeKind.CLASS_VAR_DEC)
+    assert var_dec.values() == ['static', 'int', 'x', ',', 'y', ';']
+    assert not hasattr(Node(NodeKind.CLASS), '__dict__')
+
+def scan(tokenizer, code):
+    try:
+        tokens = tokenizer(code)
+    except ValueError as error:
+        return str(error)
+    return [(token.kind, token.value) for token in tokens.tokens], tokens.map
+
+def test_regex_tokens_match_loop(jack_paths):
+    for path in jack_paths:
+        code = read(path)
+        assert scan(RegexTokenList, code) == scan(TokenList, code), path
+
+@pytest.mark.parametrize('code', BAD_CODE)
+def test_regex_errors_match_loop(code):
+    error = scan(TokenList, code)
+    assert type(error) is str
+    assert scan(RegexTokenList, code) == error
+
+def test_regex_unterminated_comment():
+    assert scan(RegexTokenList, 'class A { /* open') == 'Unexpected EOF'
+
+def parse_error(tokenizer, code):
+    try:
+        compile_file(tokenizer(code))
+    except ValueError as error:
+        return str(error)
+
+def test_stream_xml_matches_baseline(jack_paths):
+    for path in jack_paths:
+        xml = parse(path, TokenStream).as_xml(2, True)[1: ] + '\n'
+        assert xml == expected_xml(path), path
+
+@pytest.mark.parametrize('code', BAD_CODE + BAD_SYNTAX)
+def test_stream_errors_match_regex(code):
+    error = parse_error(RegexTokenList, code)
+    assert error is not None
+    assert parse_error(TokenStream, code) == error
+
+def test_find_line_starts():
+    assert list(find_line_starts('a\nbc\n\nd')) == [0, 2, 5, 6]
+    assert list(find_line_starts('')) == [0]
+
+# Messages of the baseline tokenizer for the same errors, including the
+# padding of the previous line number when the line number gains a digit.
+@pytest.mark.parametrize('code, message', [
+    (
+        'class A {\n  function void f() {\n    let x = 1\n  }\n}',
+        'Error in line 4, col 3\n\n3     let x = 1\n4   }\n    ^\n\n'
+        'Syntax error: Expected ";"',
+    ),
+    (
+        'class A { function void f() {\n  let x = 1;\n  do g(;\n} }',
+        'Error in line 3, col 8\n\n2   let x = 1;\n3   do g(;\n'
+        '         ^\n\nSyntax error: Unexpected token ";"',
+    ),
+    (
+        'class A {\n function void f() {\n' + '  let x = 1;\n' * 6
+        + '  let y = 2\n}\n}',
+        'Error in line 10, col 1\n\n9    let y = 2\n10 }\n   ^\n\n'
+        'Syntax error: Expected ";"',
+    ),
+])
+def test_error_location(code, message):
+    for tokenizer in (TokenList, RegexTokenList, TokenStream):
+        assert parse_error(tokenizer, code) == message
+
+def test_error_on_last_line_without_newline():
+    assert parse_error(RegexTokenList, 'class A {}\nfoo') == (
+        'Error in line 2, col 1\n\n1 class A {}\n2 foo\n  ^\n\n'
+        'Syntax error: All top level declarations must be classes'
+    )
+
+def recover(code, tokenizer = RegexTokenList):
+    tokens = tokenizer(code)
+    tokens.diagnostics = []
+    return compile_file(tokens), tokens.diagnostics
+
+def test_recovery_keeps_valid_program(jack_paths):
+    for path in jack_paths:
+        tree, diagnostics = recover(read(path))
+        assert diagnostics == []
+        assert tree.as_xml(2, True)[1: ] + '\n' == expected_xml(path)
+
+# Source snippets with several syntax errors, the diagnostics that recovery
+# reports for them, and the subroutines that are still parsed. They cover a
+# '{' popped in error, which must not be taken for the end of the body, and a
+# member keyword popped in error, which must not be skipped.
+RECOVERY_CASES = [
+    (
+        'class A {\n'
+        '  field int x y;\n'
+        '  function void f() {\n'
+        '    let x = ;\n'
+        '    if (x { let x = 1; }\n'
+        '    do g(;\n'
+        '    return;\n'
+        '  }\n'
+        '  method int 3() { return 0; }\n'
+        '  function void g() { return; }\n'
+        '}\n',
+        [
+            'Error in line 2, col 15\n\n1 class A {\n2   field int x y;\n'
+            '                ^\n\nSyntax error: Expected "," or ";"',
+            'Error in line 4, col 13\n\n3   function void f() {\n'
+            '4     let x = ;\n              ^\n\n'
+            'Syntax error: Unexpected token ";"',
+            'Error in line 5, col 11\n\n4     let x = ;\n'
+            '5     if (x { let x = 1; }\n            ^\n\n'
+            'Syntax error: Expected ")"',
+            'Error in line 6, col 10\n\n5     if (x { let x = 1; }\n'
+            '6     do g(;\n           ^\n\n'
+            'Syntax error: Unexpected token ";"',
+            'Error in line 9, col 14\n\n8   }\n'
+            '9   method int 3() { return 0; }\n               ^\n\n'
+            'Syntax error: Invalid identifier "3"',
+        ],
+        ['f', 'g'],
+    ),
+    (
+        'class A {\n'
+        '  field int x\n'
+        '  method void f() {\n'
+        '    let y = ;\n'
+        '    return;\n'
+        '  }\n'
+        '}\n',
+        [
+            'Error in line 3, col 3\n\n2   field int x\n'
+            '3   method void f() {\n    ^\n\n'
+            'Syntax error: Expected "," or ";"',
+            'Error in line 4, col 13\n\n3   method void f() {\n'
+            '4     let y = ;\n              ^\n\n'
+            'Syntax error: Unexpected token ";"',
+        ],
+        ['f'],
+    ),
+    (
+        'class A {\n'
+        '  function void f() {\n'
+        '    while (x { do g(); }\n'
+        '    let y = ;\n'
+        '    return;\n'
+        '  }\n'
+        '  function int h() { return 1 }\n'
+        '}\n',
+        [
+            'Error in line 3, col 14\n\n2   function void f() {\n'
+            '3     while (x { do g(); }\n               ^\n\n'
+            'Syntax error: Expected ")"',
+            'Error in line 4, col 13\n\n3     while (x { do g(); }\n'
+            '4     let y = ;\n              ^\n\n'
+            'Syntax error: Unexpected token ";"',
+            'Error in line 7, col 31\n\n6   }\n'
+            '7   function int h() { return 1 }\n'
+            '                                ^\n\n'
+            'Syntax error: Expected ";"',
+        ],
+        ['f', 'h'],
+    ),
+]
+
+# Each broken statement or member is reported, and parsing carries on with
+# the next one.
+@pytest.mark.parametrize('tokenizer', [RegexTokenList, TokenStream])
+@pytest.mark.parametrize('code, expected, subroutines', RECOVERY_CASES)
+def test_recovery_reports_every_error(tokenizer, code, expected,
+                                      subroutines):
+    tree, diagnostics = recover(code, tokenizer)
+    assert diagnostics == expected
+    assert diagnostics[0] == parse_error(tokenizer, code)
+    [class_tree] = tree.subtrees(NodeKind.CLASS)
+    assert [
+        subroutine.children[2].value
+        for subroutine in class_tree.subtrees(NodeKind.SUBROUTINE_DEC)
+    ] == subroutines
+
+@pytest.mark.parametrize('code', ['class A {', 'class', 'foo', '{ { {'])
+def test_recovery_terminates(code):
+    tree, diagnostics = recover(code)
+    assert len(diagnostics) == 1
+
+def run_main(monkeypatch, path, *args):
+    monkeypatch.setattr(sys, 'argv', ['jackanalyzer.py', str(path), *args])
+    jackanalyzer.main()
+
+@pytest.mark.parametrize('args', [[], ['-j', '2'], ['--tokenizer', 'loop'],
+                                  ['--tokenizer', 'stream', '-j', '2']])
+def test_main_matches_baseline(monkeypatch, jack_dir, jack_paths, args):
+    run_main(monkeypatch, jack_dir, *args)
+    for path in jack_paths:
+        xml_path = jack_dir / (os.path.basename(path)[ :-5] + '.xml')
+        assert read(xml_path) == expected_xml(path), path
+
+def test_main_writes_empty_file(monkeypatch, jack_dir):
+    (jack_dir / 'Empty.jack').write_text('// comment only\n')
+    run_main(monkeypatch, jack_dir)
+    assert read(jack_dir / 'Empty.xml') == '\n'
+
+@pytest.mark.parametrize('args', [[], ['-j', '2']])
+def test_main_compiles_vm(monkeypatch, jack_dir, jack_paths, args):
+    run_main(monkeypatch, jack_dir, '--vm', *args)
+    for path in jack_paths:
+        vm_file = jack_dir / os.path.basename(vm_path(path))
+        assert read(vm_file) == read(vm_path(path)), path
+
+@pytest.mark.parametrize('args', [[], ['-j', '2']])
+def test_main_reports_errors(monkeypatch, capsys, jack_dir, args):
+    (jack_dir / 'Bad.jack').write_text(BAD_SYNTAX[0])
+    with pytest.raises(SystemExit, match='Found 1 error'):
+        run_main(monkeypatch, jack_dir, *args)
+    assert 'Bad.jack: Error in line 1' in capsys.readouterr().err
+    assert not (jack_dir / 'Bad.xml').exists()
+    assert (jack_dir / 'Main.xml').exists()
+
+def write_xml(tree, *args):
+    f = io.StringIO()
+    tree.write_xml(f, *args)
+    return f.getvalue()
+
+def test_write_xml_matches_baseline(monkeypatch, jack_paths):
+    monkeypatch.setattr(syntaxtree, 'XML_CHUNK_LINES', 7)
+    for path in jack_paths:
+        assert write_xml(parse(path), 2, True) == expected_xml(path), path
+
+@pytest.mark.parametrize('indent_level, to_spec', [(2, False), (4, True)])
+def test_write_xml_matches_as_xml(jack_paths, indent_level, to_spec):
+    for path in jack_paths:
+        tree = parse(path)
+        assert write_xml(tree, indent_level, to_spec) == (
+            tree.as_xml(indent_level, to_spec)[1: ] + '\n'
+        ), path
+
+# Code with no classes gives no XML, and is written as a lone newline.
+@pytest.mark.parametrize('code', ['', '// comment only\n', '/* */'])
+def test_write_xml_empty_file(code):
+    tree = parse_code(code)
+    assert write_xml(tree, 2, True) == tree.as_xml(2, True)[1: ] + '\n'
+    assert write_xml(tree, 2, True) == '\n'
+    assert write_xml(Node(NodeKind.FILE)) == '\n'
+
+def test_write_xml_pads_multiline_strings():
+    tree = parse_code('class A { function void f() { '
+                      'do g("a\nb<c"); return; } }')
+    assert write_xml(tree, 2, True) == tree.as_xml(2, True)[1: ] + '\n'
+    assert '<stringConstant> a\n' in write_xml(tree, 2, True)
+
+# Trees deeper than the recursion limit can be written.
+def test_write_xml_deep_nesting():
+    tree = node = Node(NodeKind.FILE)
+    for _ in range(sys.getrecursionlimit()):
+        child = Node(NodeKind.EXPRESSION)
+        node.add(child)
+        node = child
+    node.add(Token('1'))
+    xml = write_xml(tree, 1, False)
+    assert xml.count('<expression>') == sys.getrecursionlimit()
+    assert ' <integerConstant> 1 </integerConstant>\n' in xml
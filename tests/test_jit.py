@@ -0,0 +1,63 @@
+import random
+
+import pytest
+
+from cpu import BREAKPOINT, CYCLE_LIMIT, HALTED, HackCPU
+from jit import JitCPU
+
+from conftest import RESULT, run_result
+
+# Instructions for random programs: A-instructions into a few cells and
+# jump targets, and C-instructions over those cells with every jump.
+A_WORDS = [0, 1, 2, 3, 4, 5, 6, 7]
+C_WORDS = [
+    0xEC10, 0xFC10, 0xE308, 0xE7C8, 0xFC88, 0xE090, 0xF1D0, 0xE4D0,
+    0xFDC8, 0xEA88, 0xEA87, 0xE301, 0xE302, 0xE303, 0xE304, 0xE305,
+    0xE306, 0xFC10, 0xEC10,
+]
+
+
+def state(cpu):
+    return (cpu.a, cpu.d, cpu.pc, cpu.cycles, list(cpu.ram[ :8]))
+
+def compare(rom, max_cycles, breakpoints):
+    interpreter = HackCPU(rom)
+    jit = JitCPU(rom)
+    assert (
+        jit.run(max_cycles, breakpoints)
+        == interpreter.run(max_cycles, breakpoints)
+    )
+    assert state(jit) == state(interpreter)
+
+
+def test_runs_baseline_program(expected_words, halt_address):
+    assert run_result(JitCPU(expected_words), halt_address) == RESULT
+
+# When the budget runs out on a breakpoint address, both CPUs stop for the
+# cycle limit.
+@pytest.mark.parametrize('max_cycles, breakpoints', [
+    (1, {1}), (2, {2}), (3, {3}), (3, {1}),
+])
+def test_budget_ending_on_breakpoint(max_cycles, breakpoints):
+    rom = [0, 0xEA88, 0, 0xEA87]
+    compare(rom, max_cycles, breakpoints)
+    assert JitCPU(rom).run(1, {1}) == CYCLE_LIMIT
+
+def test_resumes_past_breakpoint():
+    # @2; D=A; @3; D=D+A; @0; M=D; (END) @6; 0;JMP
+    cpu = JitCPU([2, 0xEC10, 3, 0xE090, 0, 0xE308, 6, 0xEA87])
+    assert cpu.run(breakpoints={4}) == BREAKPOINT
+    assert (cpu.pc, cpu.cycles, cpu.ram[0]) == (4, 4, 0)
+    assert cpu.run(breakpoints={4}) == HALTED
+    assert cpu.ram[0] == 5
+
+def test_matches_interpreter_on_random_programs():
+    rng = random.Random(0)
+    for _ in range(400):
+        rom = [
+            rng.choice(A_WORDS) if rng.random() < 0.4 else rng.choice(C_WORDS)
+            for _ in range(rng.randrange(1, 12))
+        ]
+        max_cycles = rng.randrange(0, 40)
+        breakpoints = set(rng.sample(range(12), rng.randrange(3)))
+        compare(rom, max_cycles, breakpoints)
@@ -0,0 +1,96 @@
+import random
+
+import generateasm
+import optimizer
+import vmtranslator
+from cpu import HALTED
+from jit import JitCPU
+
+from conftest import RESULT, assemble, run_result
+
+# The bootstrap leaves ARG unset, so the argument segment is left out.
+SEGMENTS = ['local', 'this', 'that', 'temp', 'pointer', 'static']
+
+ARITHMETIC = ['add', 'sub', 'neg', 'eq', 'gt', 'lt', 'and', 'or', 'not']
+
+
+# Generates a random straight-line function body that never pops more than
+# it has pushed, with this and that pointing at scratch areas.
+def random_program(rng, length):
+    lines = [
+        'function Sys.init 8',
+        'push constant 3000', 'pop pointer 0',
+        'push constant 4000', 'pop pointer 1',
+    ]
+    depth = 0
+    for _ in range(length):
+        r = rng.random()
+        if depth == 0 or r < 0.45:
+            segment = rng.choice(SEGMENTS + ['constant'])
+            index = rng.randrange(2 if segment == 'pointer' else 8)
+            if segment == 'constant':
+                index = rng.choice([0, 1, 2, 7, 300, 32767])
+            lines.append(f'push {segment} {index}')
+            depth += 1
+        elif r < 0.7:
+            segment = rng.choice(SEGMENTS[ :-2] + ['static'])
+            lines.append(f'pop {segment} {rng.randrange(8)}')
+            depth -= 1
+        elif depth >= 2 or rng.random() < 0.5:
+            command = rng.choice(ARITHMETIC if depth >= 2 else ['neg', 'not'])
+            lines.append(command)
+            depth -= command not in ('neg', 'not')
+        else:
+            lines.append('not')
+    lines += ['label END', 'goto END']
+    return '\n'.join(lines) + '\n'
+
+# Runs a program translated with or without the optimizer, and returns the
+# memory its segments can reach: temp and static, the scratch areas, and the
+# stack from the locals of Sys.init on. The bootstrap jumps to Sys.init
+# without a call, so LCL is set to the bottom of the stack first. R13 to R15
+# are scratch registers, and are left out.
+def run(code, optimize):
+    asm_code = '    @256\n    D=A\n    @LCL\n    M=D\n'
+    asm_code += generateasm.bootstrap(False)
+    asm_code += vmtranslator.translate(code, 'Main', optimize)
+    words, _ = assemble(asm_code + '(Sys.halt)\n')
+    cpu = JitCPU(words)
+    assert cpu.run(1_000_000) == HALTED
+    ram = cpu.ram
+    return (
+        list(ram[5:13]) + list(ram[16:24]) + list(ram[256:ram[0]]),
+        list(ram[3000:3008]), list(ram[4000:4008]), len(words),
+    )
+
+def test_fused_pairs_match_unoptimized():
+    rng = random.Random(0)
+    for _ in range(150):
+        code = random_program(rng, rng.randrange(1, 30))
+        plain = run(code, False)
+        optimized = run(code, True)
+        assert optimized[ :3] == plain[ :3], code
+        assert optimized[3] <= plain[3]
+
+def test_every_statement_is_kept_in_order(vm_sources):
+    for filename, code in vm_sources:
+        statements = [
+            statement
+            for num, statement, command in vmtranslator.parse(code, filename)
+        ]
+        optimized = [
+            statement
+            for num, group, command, asm_code in optimizer.optimize(
+                vmtranslator.parse(code, filename)
+            )
+            for statement in group
+        ]
+        assert optimized == statements
+
+def test_optimized_program_runs(vm_sources):
+    asm_code = generateasm.bootstrap(False) + ''.join(
+        vmtranslator.translate(code, filename, True)
+        for filename, code in vm_sources
+    )
+    words, halt_address = assemble(asm_code)
+    assert run_result(JitCPU(words), halt_address) == RESULT
@@ -0,0 +1,58 @@
+import pytest
+
+from vminterpreter import END_OF_PROGRAM, HALTED, RETURNED, VMInterpreter
+
+from conftest import RESULT, RESULT_ADDRESS
+
+TRIANGLE = '''\
+function Sys.init 0
+push constant 10
+call Main.triangle 1
+pop static 0
+label HALT
+goto HALT
+function Main.triangle 1
+label LOOP
+push argument 0
+if-goto BODY
+push local 0
+return
+label BODY
+push local 0
+push argument 0
+add
+pop local 0
+push argument 0
+push constant 1
+sub
+pop argument 0
+goto LOOP
+'''
+
+
+# Sys.halt loops forever, so the program runs until it is well past the end
+# of Main.main.
+def test_runs_program(vm_sources):
+    vm = VMInterpreter(vm_sources)
+    vm.run(200_000)
+    results = vm.ram[RESULT_ADDRESS : RESULT_ADDRESS + len(RESULT)]
+    assert list(results) == RESULT
+
+def test_halts_on_goto_to_itself():
+    vm = VMInterpreter([('Main', TRIANGLE)])
+    assert vm.run() == HALTED
+    assert vm.static('Main', 0) == 55
+
+def test_returns_from_outermost_function():
+    code = 'function Main.f 0\npush constant 7\nreturn\n'
+    vm = VMInterpreter([('Main', code)])
+    assert vm.run() == RETURNED
+
+def test_end_of_program():
+    vm = VMInterpreter([('Main', 'push constant 1\npush constant 2\nadd\n')])
+    assert vm.run() == END_OF_PROGRAM
+    assert vm.stack == [3]
+
+def test_undefined_label():
+    with pytest.raises(ValueError, match='Undefined label "NOWHERE"'):
+        VMInterpreter([('Main', 'function Main.f 0\ngoto NOWHERE\n')])
@@ -0,0 +1,174 @@
+import json
+import os
+import sys
+
+import pytest
+
+import deadcode
+import generateasm
+import vmtranslator
+from buildcache import BuildCache
+from jit import JitCPU
+
+from conftest import RESULT, assemble, read, run_result
+
+
+def translate_program(vm_sources, **options):
+    return generateasm.bootstrap(options.get('shared_calls', False)) + ''.join(
+        vmtranslator.translate(code, filename, **options)
+        for filename, code in vm_sources
+    )
+
+# Runs the translator on the directory, and returns the program it wrote.
+def run_main(monkeypatch, directory, *args):
+    monkeypatch.setattr(
+        sys, 'argv', ['vmtranslator.py', str(directory), *args]
+    )
+    vmtranslator.main()
+    return read(directory / 'Prog.asm')
+
+
+def test_translate_matches_baseline(vm_sources, expected_asm):
+    assert translate_program(vm_sources) == expected_asm
+
+def test_shared_calls_program_runs(vm_sources):
+    words, halt_address = assemble(
+        translate_program(vm_sources, shared_calls=True)
+    )
+    assert run_result(JitCPU(words), halt_address) == RESULT
+
+# The program shrinks by what shared_call_savings reports for its files, less
+# the routines added to the bootstrap.
+def test_shared_calls_savings(vm_sources):
+    inline, _ = assemble(translate_program(vm_sources))
+    shared, _ = assemble(translate_program(vm_sources, shared_calls=True))
+    saved = -vmtranslator.count_rom_words(
+        generateasm.call_trampoline() + generateasm.return_trampoline()
+    )
+    for filename, code in vm_sources:
+        saved += vmtranslator.shared_call_savings(code, filename)[2]
+    assert 0 < saved == len(inline) - len(shared)
+
+@pytest.mark.parametrize('args', [[], ['-j', '2']])
+def test_main_matches_baseline(monkeypatch, vm_dir, expected_asm, args):
+    assert run_main(monkeypatch, vm_dir, *args) == expected_asm
+
+def test_jobs_match_serial(monkeypatch, vm_dir):
+    serial = run_main(monkeypatch, vm_dir, '-O', '--shared-calls')
+    parallel = run_main(monkeypatch, vm_dir, '-O', '--shared-calls', '-j', '2')
+    assert parallel == serial
+
+def test_cache_reuses_unchanged_files(monkeypatch, capsys, vm_dir,
+                                      expected_asm):
+    assert run_main(monkeypatch, vm_dir, '--cache') == expected_asm
+    assert run_main(monkeypatch, vm_dir, '--cache') == expected_asm
+    assert 'Translated 0 of 7 files' in capsys.readouterr().out
+
+def test_cache_retranslates_edited_file(monkeypatch, capsys, vm_dir):
+    run_main(monkeypatch, vm_dir, '--cache', '-O')
+    path = vm_dir / 'Main.vm'
+    path.write_text(path.read_text() + 'function Main.added 0\n'
+                    'push constant 0\nreturn\n')
+    cached = run_main(monkeypatch, vm_dir, '--cache', '-O')
+    assert 'Translated 1 of 7 files' in capsys.readouterr().out
+    assert cached == run_main(monkeypatch, vm_dir, '-O')
+
+# A file edited after it has been hashed is translated as it was hashed, so
+# the entry stored under the key matches it.
+def test_cache_translates_hashed_contents(monkeypatch, vm_dir, expected_asm):
+    key = BuildCache.key
+
+    def key_then_edit(self, filename, code, flags):
+        (vm_dir / f'{filename}.vm').write_text(code + 'return\n')
+        return key(self, filename, code, flags)
+
+    monkeypatch.setattr(BuildCache, 'key', key_then_edit)
+    assert run_main(monkeypatch, vm_dir, '--cache') == expected_asm
+
+# A syntax error in a later file leaves the previous output in place, and no
+# partly written program behind.
+@pytest.mark.parametrize('args', [[], ['-j', '2']])
+def test_error_keeps_previous_output(monkeypatch, vm_dir, expected_asm, args):
+    run_main(monkeypatch, vm_dir)
+    (vm_dir / 'Sys.vm').write_text('push constant\n')
+    with pytest.raises(ValueError, match='line 1'):
+        run_main(monkeypatch, vm_dir, *args)
+    assert read(vm_dir / 'Prog.asm') == expected_asm
+    assert sorted(path.suffix for path in vm_dir.iterdir()) == [
+        '.asm', *['.vm'] * 7
+    ]
+
+# Fragments are shared between files, except for the static segment, which
+# is named after its file.
+def test_fragment_cache_matches_uncached(monkeypatch, vm_sources):
+    vmtranslator.render_fragment.cache_clear()
+    cached = translate_program(vm_sources, optimize=True)
+    assert vmtranslator.render_fragment.cache_info().hits > 0
+    monkeypatch.setattr(vmtranslator, 'render_fragment',
+                        vmtranslator.render_fragment.__wrapped__)
+    assert translate_program(vm_sources, optimize=True) == cached
+
+def test_fragment_cache_keeps_statics_per_file():
+    code = 'push static 3\n'
+    assert '@A.3' in vmtranslator.translate(code, 'A')
+    assert '@B.3' in vmtranslator.translate(code, 'B')
+
+def test_dead_functions(vm_paths, vm_sources):
+    filenames = [filename for filename, code in vm_sources]
+    dead = vmtranslator.dead_functions(vm_paths, filenames)
+    assert dict(zip(filenames, dead))['Memory'] == {'Memory.peek'}
+    assert sum(map(len, dead)) == 1
+
+def test_pruned_program_runs(monkeypatch, vm_dir, expected_asm):
+    asm_code = run_main(monkeypatch, vm_dir, '--prune')
+    assert 'Memory.peek' not in asm_code
+    words, halt_address = assemble(asm_code)
+    assert len(words) < len(assemble(expected_asm)[0])
+    assert run_result(JitCPU(words), halt_address) == RESULT
+
+# The shared call report only counts the calls and returns left after
+# pruning, so the inline size it reports is that of the pruned program.
+def test_shared_calls_report_after_pruning(monkeypatch, capsys, vm_dir):
+    pruned = run_main(monkeypatch, vm_dir, '--prune')
+    capsys.readouterr()
+    run_main(monkeypatch, vm_dir, '--prune', '--shared-calls')
+    inline = vmtranslator.count_rom_words(pruned)
+    assert f'calls ({inline})' in capsys.readouterr().out
+
+# Profiling goes through the same streaming pipeline, and gives the same
+# program. Every file gets its translate and write stages and its counts.
+@pytest.mark.parametrize('args', [[], ['-j', '2'], ['--cache', '--prune']])
+def test_profile(monkeypatch, tmp_path, vm_dir, vm_paths, vm_sources, args):
+    plain = run_main(monkeypatch, vm_dir, *args)
+    report_path = tmp_path / 'profile.json'
+    for _ in range(2 if '--cache' in args else 1):
+        profiled = run_main(monkeypatch, vm_dir, '--profile',
+                            str(report_path), *args)
+    assert profiled == plain
+    report = json.loads(read(report_path))
+    assert report['tool'] == 'vmtranslator'
+    files = report['files']
+    assert [profile['path'] for profile in files] == [
+        str(vm_dir / os.path.basename(path)) for path in vm_paths
+    ]
+    if '--cache' in args:
+        assert all(profile['stages'].keys() == {'cache copy'}
+                   for profile in files)
+        assert set(report['stages']) == {'prune', 'cache lookup'}
+        return
+    for profile, (filename, code) in zip(files, vm_sources):
+        assert profile['stages'].keys() == {'translate', 'write'}
+        assert profile['counts']['lines'] == code.count('\n')
+    assert sum(profile['counts']['instructions'] for profile in files) == (
+        vmtranslator.count_rom_words(plain)
+        - vmtranslator.count_rom_words(generateasm.bootstrap())
+    )
+
+# Changing any module that shapes the translations invalidates the cache,
+# including the pruning, which decides what is left of each file.
+def test_cache_version_covers_pruning(monkeypatch, tmp_path):
+    version = vmtranslator.cache_version()
+    changed = tmp_path / 'deadcode.py'
+    changed.write_text(read(deadcode.__file__) + '\n# changed\n')
+    monkeypatch.setattr(deadcode, '__file__', str(changed))
+    assert vmtranslator.cache_version() != version
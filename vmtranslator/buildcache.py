@@ -0,0 +1,85 @@
+import hashlib
+import os
+from contextlib import contextmanager
+
+# On-disk cache of translated .vm files. Each file and set of translation
+# flags gets one entry, whose first line records the key it was built for:
+# a hash of the translator version, the flags, the file name and the file
+# contents. An entry is only reused when all of those match, and is simply
+# overwritten otherwise, so the cache never holds more than one entry per
+# file and flag combination.
+
+CACHE_DIRNAME = '.vmcache'
+
+HEADER_PREFIX = '// vmcache '
+
+# Returns a version string for the translator, as a hash of the source of the
+# given modules, so that any change to the code generation invalidates the
+# cache without anyone having to remember to bump a version number.
+def source_version(*modules):
+    digest = hashlib.sha256()
+    for module in modules:
+        with open(module.__file__, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+class BuildCache:
+    def __init__(self, directory, version):
+        self.directory = directory
+        self.version = version
+        os.makedirs(directory, exist_ok=True)
+
+    # Hashes the given contents of a source file. The caller translates the
+    # same contents, so an edit made after the file was read can never end up
+    # stored under the key of its old contents.
+    def key(self, filename, code, flags):
+        digest = hashlib.sha256()
+        for part in (self.version, repr(flags), filename):
+            digest.update(part.encode())
+            digest.update(b'\0')
+        digest.update(code.encode())
+        return digest.hexdigest()
+
+    def path(self, filename, flags):
+        tag = ''.join(name for name, value in flags if value) or 'default'
+        return os.path.join(self.directory, f'{filename}.{tag}.asm')
+
+    # Returns the entry for the given key as a file positioned after its
+    # header, ready to be copied into the output, or None on a miss.
+    def open_entry(self, filename, flags, key):
+        try:
+            f = open(self.path(filename, flags), 'r')
+        except FileNotFoundError:
+            return None
+        if f.readline() == HEADER_PREFIX + key + '\n':
+            return f
+        f.close()
+        return None
+
+    # Returns the cached output for the given key, or None on a miss.
+    def load(self, filename, flags, key):
+        if (f := self.open_entry(filename, flags, key)) is None:
+            return None
+        with f:
+            return f.read()
+
+    # Context manager yielding a file to write a new entry into. The entry is
+    # written to a temporary file and only moved into place once complete, so
+    # that an interrupted build never leaves a truncated entry behind.
+    @contextmanager
+    def writer(self, filename, flags, key):
+        path = self.path(filename, flags)
+        temp_path = f'{path}.{os.getpid()}.tmp'
+        try:
+            with open(temp_path, 'w') as f:
+                f.write(HEADER_PREFIX + key + '\n')
+                yield f
+            os.replace(temp_path, path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def store(self, filename, flags, key, output):
+        with self.writer(filename, flags, key) as f:
+            f.write(output)
@@ -0,0 +1,60 @@
+import re
+
+# Whole-program dead function elimination. Functions can only be entered
+# through call commands, so any function that no chain of calls starting at
+# Sys.init reaches can be dropped from the program before it is translated.
+# Code before the first function of a file is not part of any function, and
+# is always kept along with the functions it calls.
+
+ENTRY_POINT = 'Sys.init'
+
+COMMENT_PATTERN = re.compile(r'\s*//.*')
+
+###############################################################################
+
+# Takes the (num, statement, command) triples produced by vmtranslator.parse
+# for one file, and adds the functions defined in it to the call graph, a
+# dict mapping each function name to the set of functions it calls. Calls
+# made before the first function are added under None.
+def add_calls(graph, commands):
+    callees = graph.setdefault(None, set())
+    for num, statement, command in commands:
+        if command.type == 'C_FUNCTION':
+            callees = graph.setdefault(command.arg1, set())
+        elif command.type == 'C_CALL':
+            callees.add(command.arg1)
+    return graph
+
+# Returns the set of functions reachable in the call graph from Sys.init and
+# from the code outside of functions.
+def live_functions(graph):
+    if ENTRY_POINT not in graph:
+        raise ValueError(f'No {ENTRY_POINT} function to start pruning from')
+    live = set()
+    pending = [ENTRY_POINT, None]
+    while pending:
+        function = pending.pop()
+        if function not in live and function in graph:
+            live.add(function)
+            pending.extend(graph[function])
+    return live
+
+# Yields the lines of VM code, given as a string or an iterable of lines,
+# with the lines of every function for which keep(name) is false blanked
+# out. Line numbers are unchanged, so the translation of the kept code is the
+# same as if nothing had been removed. Lines before the first function are
+# passed to keep as None.
+def filter_functions(code, keep):
+    if isinstance(code, str):
+        code = code.split('\n')
+    kept = keep(None)
+    for line in code:
+        if 'function' in line:
+            terms = COMMENT_PATTERN.sub('', line).split()
+            if len(terms) > 1 and terms[0] == 'function':
+                kept = keep(terms[1])
+        yield line if kept else ''
+
+# Yields the lines of VM code without the functions in dead.
+def remove_functions(code, dead):
+    return filter_functions(code, lambda name: name not in dead)
@@ -1,4 +1,4 @@
-def bootstrap():
+def bootstrap(shared_calls = False):
     return f'''\
     @256
     D=A
@@ -6,7 +6,7 @@ def bootstrap():
     M=D
     @Sys.init
     0;JMP
-'''
+''' + (call_trampoline() + return_trampoline() if shared_calls else '')
 
 ###############################################################################
 
@@ -282,3 +282,81 @@ def c_call(command):
     0;JMP
 (#.RETURN_ADDRESS)
 '''
+
+###############################################################################
+
+# Shared call/return routines, emitted once in the bootstrap so that call
+# sites and returns only need a few instructions each. $$CALL expects the
+# target function address in R13, the number of arguments in R14 and the
+# return address in D.
+
+def call_trampoline():
+    return f'''\
+($$CALL)
+    @SP     // *(++SP) = RETURN_ADDRESS
+    A=M
+    M=D
+    @LCL    // *(++SP) = LCL
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @ARG    // *(++SP) = ARG
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THIS   // *(++SP) = THIS
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @THAT   // *(++SP) = THAT
+    D=M
+    @SP
+    AM=M+1
+    M=D
+    @SP     // SP++
+    M=M+1
+    @R14    // ARG = SP - n - 5
+    D=M
+    @5
+    D=D+A
+    @SP
+    D=M-D
+    @ARG
+    M=D
+    @SP     // LCL = SP
+    D=M
+    @LCL
+    M=D
+    @R13    // JMP TGT_FUNCTION
+    A=M
+    0;JMP
+'''
+
+def return_trampoline():
+    return '($$RETURN)\n' + c_return(None)
+
+def c_call_shared(command):
+    return f'''\
+    @{command.arg1}     // R13 = TGT_FUNCTION
+    D=A
+    @R13
+    M=D
+    @{int(command.arg2)}     // R14 = n
+    D=A
+    @R14
+    M=D
+    @#.RETURN_ADDRESS   // JMP $$CALL with D = #.RETURN_ADDRESS
+    D=A
+    @$$CALL
+    0;JMP
+(#.RETURN_ADDRESS)
+'''
+
+def c_return_shared(command):
+    return f'''\
+    @$$RETURN
+    0;JMP
+'''
@@ -0,0 +1,143 @@
+import generateasm
+
+# Peephole optimizer for translated VM code. It looks at each VM command
+# together with the one after it, and replaces common pairs with a single
+# fused Hack sequence that keeps the intermediate value in D instead of
+# round-tripping it through the stack. Fragments are built as lists of
+# instruction lines and only rendered to text at the end.
+
+BINARY_OPS = {'add': '+', 'sub': '-', 'and': '&', 'or': '|'}
+
+COMPARISONS = {'eq', 'gt', 'lt'}
+
+# Base addresses of the segments that map to fixed RAM locations.
+DIRECT_BASE = {'pointer': 3, 'temp': 5}
+
+# Pops into local/argument/this/that walk the address up with A=A+1 instead
+# of computing it through R15, for indices up to this value.
+MAX_WALK_INDEX = 7
+
+PUSH_D = ['@SP', 'AM=M+1', 'A=A-1', 'M=D']
+
+POP_D = ['@SP', 'AM=M-1', 'D=M']
+
+SEGMENTS = {'constant', 'static', *DIRECT_BASE, *generateasm.SEG_CODE}
+
+###############################################################################
+
+# Returns the index of a push/pop command, or None if the command is invalid
+# and should be left for generateasm to report.
+def segment_index(command):
+    if command.arg1 not in SEGMENTS:
+        return None
+    try:
+        return int(command.arg2)
+    except ValueError:
+        return None
+
+# Instructions that load the value a push command would push into D.
+def load_d(command):
+    if (index := segment_index(command)) is None:
+        return None
+    segment = command.arg1
+    if segment == 'constant':
+        return [f'D={index}'] if index in (0, 1) else [f'@{index}', 'D=A']
+    if segment == 'static':
+        return [f'@{command.filename}.{index}', 'D=M']
+    if segment in DIRECT_BASE:
+        return [f'@{DIRECT_BASE[segment] + index}', 'D=M']
+    pointer = generateasm.SEG_CODE[segment]
+    if index == 0:
+        return [f'@{pointer}', 'A=M', 'D=M']
+    if index == 1:
+        return [f'@{pointer}', 'A=M+1', 'D=M']
+    return [f'@{index}', 'D=A', f'@{pointer}', 'A=M+D', 'D=M']
+
+# Instructions that store D into the location a pop command would pop into.
+# May clobber R13 and R15.
+def store_d(command):
+    if (index := segment_index(command)) is None:
+        return None
+    segment = command.arg1
+    if segment == 'constant':
+        return None
+    if segment == 'static':
+        return [f'@{command.filename}.{index}', 'M=D']
+    if segment in DIRECT_BASE:
+        return [f'@{DIRECT_BASE[segment] + index}', 'M=D']
+    pointer = generateasm.SEG_CODE[segment]
+    if index <= MAX_WALK_INDEX:
+        return [f'@{pointer}', 'A=M'] + ['A=A+1'] * index + ['M=D']
+    return [
+        '@R13', 'M=D',
+        f'@{index}', 'D=A', f'@{pointer}', 'D=D+M', '@R15', 'M=D',
+        '@R13', 'D=M', '@R15', 'A=M', 'M=D',
+    ]
+
+###############################################################################
+
+# Returns the fused instructions for a pair of commands, or None if the pair
+# has no shorter form.
+def fuse(first, second):
+    if first.type != 'C_PUSH' or (load := load_d(first)) is None:
+        return None
+
+    if second.type == 'C_POP':
+        if (store := store_d(second)) is not None:
+            return load + store
+
+    elif second.type == 'C_ARITHMETIC' and second.arg1 in BINARY_OPS:
+        op = BINARY_OPS[second.arg1]
+        if first.arg1 == 'constant' and first.arg2 == '1' and op in '+-':
+            return ['@SP', 'A=M-1', f'M=M{op}1']
+        return load + ['@SP', 'A=M-1', f'M=M{op}D']
+
+    elif second.type == 'C_ARITHMETIC' and second.arg1 in COMPARISONS:
+        op = second.arg1.upper()
+        return load + [
+            '@SP', 'A=M-1', 'D=M-D', 'M=-1', f'@#.T{op}', f'D;J{op}',
+            '@SP', 'A=M-1', 'M=0', f'(#.T{op})',
+        ]
+
+    elif second.type == 'C_IF':
+        return load + [f'@{second.arg1}', 'D;JNE']
+
+    return None
+
+# Returns shorter instructions for a single command, or None to use the
+# standard generateasm translation.
+def rewrite(command):
+    if command.type == 'C_PUSH':
+        if (load := load_d(command)) is not None:
+            return load + PUSH_D
+    elif command.type == 'C_POP':
+        if (store := store_d(command)) is not None:
+            return POP_D + store
+    return None
+
+def render(lines):
+    return ''.join(
+        line + '\n' if line[0] == '(' else '    ' + line + '\n'
+        for line in lines
+    )
+
+def single(num, statement, command):
+    lines = rewrite(command)
+    return num, [statement], command, None if lines is None else render(lines)
+
+# Takes the (num, statement, command) triples produced by vmtranslator.parse
+# and yields (num, statements, command, asm_code) fragments. asm_code is None
+# where the command should be translated as usual. Fused fragments carry the
+# line number and command of their second command, and both statements.
+def optimize(commands):
+    pending = None
+    for num, statement, command in commands:
+        if pending is not None:
+            if (lines := fuse(pending[2], command)) is not None:
+                yield num, [pending[1], statement], command, render(lines)
+                pending = None
+                continue
+            yield single(*pending)
+        pending = (num, statement, command)
+    if pending is not None:
+        yield single(*pending)
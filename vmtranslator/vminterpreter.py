@@ -0,0 +1,410 @@
+import argparse
+import os
+import time
+from array import array
+
+from vmtranslator import parse
+
+RAM_SIZE = 32768
+ADDRESS_MASK = 0x7FFF
+TEMP_SIZE = 8
+
+# Reasons for run() to return control to the caller.
+HALTED = 'halted'
+RETURNED = 'returned'
+STEP_LIMIT = 'step limit'
+END_OF_PROGRAM = 'end of program'
+
+###############################################################################
+
+def wrap(value):
+    return ((value + 32768) & 0xFFFF) - 32768
+
+# Each instruction of a loaded program is a tuple of a handler from the
+# tables below and its two pre-resolved operands. Handlers take the
+# interpreter, the operands and the current program counter, and return the
+# next program counter.
+
+def op_add(vm, a, b, pc):
+    stack = vm.stack
+    y = stack.pop()
+    stack[-1] = wrap(stack[-1] + y)
+    return pc + 1
+
+def op_sub(vm, a, b, pc):
+    stack = vm.stack
+    y = stack.pop()
+    stack[-1] = wrap(stack[-1] - y)
+    return pc + 1
+
+def op_neg(vm, a, b, pc):
+    vm.stack[-1] = wrap(-vm.stack[-1])
+    return pc + 1
+
+def op_eq(vm, a, b, pc):
+    stack = vm.stack
+    y = stack.pop()
+    stack[-1] = -1 if stack[-1] == y else 0
+    return pc + 1
+
+# Comparisons are done on the wrapped difference, as the translated assembly
+# does with D=M-D, so results agree with the Hack platform on overflow.
+def op_gt(vm, a, b, pc):
+    stack = vm.stack
+    y = stack.pop()
+    stack[-1] = -1 if wrap(stack[-1] - y) > 0 else 0
+    return pc + 1
+
+def op_lt(vm, a, b, pc):
+    stack = vm.stack
+    y = stack.pop()
+    stack[-1] = -1 if wrap(stack[-1] - y) < 0 else 0
+    return pc + 1
+
+def op_and(vm, a, b, pc):
+    stack = vm.stack
+    y = stack.pop()
+    stack[-1] &= y
+    return pc + 1
+
+def op_or(vm, a, b, pc):
+    stack = vm.stack
+    y = stack.pop()
+    stack[-1] |= y
+    return pc + 1
+
+def op_not(vm, a, b, pc):
+    vm.stack[-1] = ~vm.stack[-1]
+    return pc + 1
+
+ARITHMETIC_OPS = {
+    'add': op_add,
+    'sub': op_sub,
+    'neg': op_neg,
+    'eq' : op_eq,
+    'gt' : op_gt,
+    'lt' : op_lt,
+    'and': op_and,
+    'or' : op_or,
+    'not': op_not,
+}
+
+def push_constant(vm, a, b, pc):
+    vm.stack.append(a)
+    return pc + 1
+
+def push_local(vm, a, b, pc):
+    vm.stack.append(vm.locals[a])
+    return pc + 1
+
+def push_argument(vm, a, b, pc):
+    vm.stack.append(vm.args[a])
+    return pc + 1
+
+def push_this(vm, a, b, pc):
+    vm.stack.append(vm.ram[(vm.this + a) & ADDRESS_MASK])
+    return pc + 1
+
+def push_that(vm, a, b, pc):
+    vm.stack.append(vm.ram[(vm.that + a) & ADDRESS_MASK])
+    return pc + 1
+
+def push_pointer(vm, a, b, pc):
+    vm.stack.append(vm.that if a else vm.this)
+    return pc + 1
+
+def push_temp(vm, a, b, pc):
+    vm.stack.append(vm.temp[a])
+    return pc + 1
+
+def push_static(vm, a, b, pc):
+    vm.stack.append(vm.statics[a])
+    return pc + 1
+
+PUSH_OPS = {
+    'constant': push_constant,
+    'local'   : push_local,
+    'argument': push_argument,
+    'this'    : push_this,
+    'that'    : push_that,
+    'pointer' : push_pointer,
+    'temp'    : push_temp,
+    'static'  : push_static,
+}
+
+def pop_local(vm, a, b, pc):
+    vm.locals[a] = vm.stack.pop()
+    return pc + 1
+
+def pop_argument(vm, a, b, pc):
+    vm.args[a] = vm.stack.pop()
+    return pc + 1
+
+def pop_this(vm, a, b, pc):
+    vm.ram[(vm.this + a) & ADDRESS_MASK] = vm.stack.pop()
+    return pc + 1
+
+def pop_that(vm, a, b, pc):
+    vm.ram[(vm.that + a) & ADDRESS_MASK] = vm.stack.pop()
+    return pc + 1
+
+def pop_pointer(vm, a, b, pc):
+    if a:
+        vm.that = vm.stack.pop()
+    else:
+        vm.this = vm.stack.pop()
+    return pc + 1
+
+def pop_temp(vm, a, b, pc):
+    vm.temp[a] = vm.stack.pop()
+    return pc + 1
+
+def pop_static(vm, a, b, pc):
+    vm.statics[a] = vm.stack.pop()
+    return pc + 1
+
+POP_OPS = {
+    'local'   : pop_local,
+    'argument': pop_argument,
+    'this'    : pop_this,
+    'that'    : pop_that,
+    'pointer' : pop_pointer,
+    'temp'    : pop_temp,
+    'static'  : pop_static,
+}
+
+# Number of entries in the fixed-size segments.
+SEGMENT_LIMITS = {'pointer': 2, 'temp': TEMP_SIZE}
+
+def op_goto(vm, a, b, pc):
+    return a
+
+def op_if_goto(vm, a, b, pc):
+    return a if vm.stack.pop() else pc + 1
+
+# Reached by falling through into a function, or entered by op_call, which
+# skips past it after setting up the locals itself.
+def op_function(vm, a, b, pc):
+    vm.locals = [0] * b
+    return pc + 1
+
+def op_call(vm, a, b, pc):
+    stack = vm.stack
+    base = len(stack) - b
+    vm.frames.append((pc + 1, vm.locals, vm.args, vm.this, vm.that, base))
+    vm.args = stack[base: ]
+    del stack[base: ]
+    target, num_locals = a
+    vm.locals = [0] * num_locals
+    return target + 1
+
+def op_return(vm, a, b, pc):
+    stack = vm.stack
+    value = stack.pop()
+    if not vm.frames:
+        vm.stack.append(value)
+        return -1
+    pc, vm.locals, vm.args, vm.this, vm.that, base = vm.frames.pop()
+    del stack[base: ]
+    stack.append(value)
+    return pc
+
+###############################################################################
+
+# Executes VM code directly as a stack machine, without translating it to
+# Hack assembly. The working stack is a Python list and every call gets its
+# own frame of argument and local lists, while this/that accesses go to a
+# Hack-sized RAM so that OS code manipulating the heap and screen still works.
+class VMInterpreter:
+    def __init__(self, sources):
+        self.program = []
+        self.functions = {}
+        self.static_slots = {}
+        self.load(sources)
+        self.reset()
+
+    # Loads (filename, code) pairs, resolving labels, functions and static
+    # variables to indices up front. Labels are scoped to their enclosing
+    # function as in the VM specification.
+    def load(self, sources):
+        commands = []
+        for filename, code in sources:
+            function = None
+            for num, statement, command in parse(code, filename):
+                if command.type == 'C_FUNCTION':
+                    function = command.arg1
+                commands.append((filename, num, function, command))
+
+        labels = {}
+        for filename, num, function, command in commands:
+            if command.type == 'C_LABEL':
+                key = (function, command.arg1)
+                if key in labels:
+                    raise ValueError(f'{filename}: Duplicate label in line '
+                                     f'{num} "{command.arg1}"')
+                labels[key] = len(self.program)
+            else:
+                if command.type == 'C_FUNCTION':
+                    try:
+                        num_locals = int(command.arg2)
+                    except ValueError:
+                        raise ValueError(
+                            f'{filename}: Error in line {num}: Invalid number '
+                            f'of local variables "{command.arg2}"'
+                        )
+                    self.functions[command.arg1] = (
+                        len(self.program), num_locals
+                    )
+                self.program.append((filename, num, function, command))
+
+        for pc, (filename, num, function, command) in enumerate(self.program):
+            try:
+                self.program[pc] = self.resolve(command, function, labels)
+            except ValueError as error:
+                raise ValueError(f'{filename}: Error in line {num}: {error}')
+
+        self.statics = [0] * len(self.static_slots)
+
+    def resolve(self, command, function, labels):
+        if command.type == 'C_ARITHMETIC':
+            return (ARITHMETIC_OPS[command.arg1], None, None)
+
+        if command.type in ('C_PUSH', 'C_POP'):
+            ops = PUSH_OPS if command.type == 'C_PUSH' else POP_OPS
+            if command.arg1 not in ops:
+                raise ValueError(f'Invalid memory segment "{command.arg1}"')
+            try:
+                index = int(command.arg2)
+            except ValueError:
+                raise ValueError(
+                    f'Invalid memory segment address "{command.arg2}"'
+                )
+            if not 0 <= index < SEGMENT_LIMITS.get(command.arg1, RAM_SIZE):
+                raise ValueError(f'Index out of range "{command.arg2}"')
+            if command.arg1 == 'static':
+                key = (command.filename, index)
+                index = self.static_slots.setdefault(
+                    key, len(self.static_slots)
+                )
+            return (ops[command.arg1], index, None)
+
+        if command.type in ('C_LABEL', 'C_GOTO', 'C_IF'):
+            try:
+                target = labels[(function, command.arg1)]
+            except KeyError:
+                raise ValueError(f'Undefined label "{command.arg1}"')
+            op = op_goto if command.type == 'C_GOTO' else op_if_goto
+            return (op, target, None)
+
+        if command.type == 'C_FUNCTION':
+            return (op_function, None, self.functions[command.arg1][1])
+
+        if command.type == 'C_CALL':
+            if command.arg1 not in self.functions:
+                raise ValueError(f'Undefined function "{command.arg1}"')
+            try:
+                num_args = int(command.arg2)
+            except ValueError:
+                raise ValueError(f'Invalid argument count "{command.arg2}"')
+            return (op_call, self.functions[command.arg1], num_args)
+
+        return (op_return, None, None)
+
+    # Resets the machine. Programs that define Sys.init start by calling it,
+    # like the bootstrap code of the translator, others start at their first
+    # command.
+    def reset(self):
+        self.ram = array('h', bytes(2 * RAM_SIZE))
+        self.temp = [0] * TEMP_SIZE
+        self.statics = [0] * len(self.static_slots)
+        self.stack = []
+        self.frames = []
+        self.locals = []
+        self.args = []
+        self.this = 0
+        self.that = 0
+        self.steps = 0
+        self.pc = 0
+        if 'Sys.init' in self.functions:
+            target, num_locals = self.functions['Sys.init']
+            self.locals = [0] * num_locals
+            self.pc = target + 1
+
+    # Returns the value of a static variable of the given file.
+    def static(self, filename, index):
+        return self.statics[self.static_slots[(filename, index)]]
+
+    # Runs until the program halts (a goto to itself), returns from the
+    # outermost function, executes max_steps commands or runs off the end.
+    # Returns the reason for stopping.
+    def run(self, max_steps = None):
+        program = self.program
+        end = len(program)
+        pc = self.pc
+        budget = -1 if max_steps is None else max_steps
+        steps = 0
+        reason = STEP_LIMIT
+
+        try:
+            while steps != budget:
+                if pc >= end:
+                    reason = END_OF_PROGRAM
+                    break
+                op, a, b = program[pc]
+                steps += 1
+                if op is op_goto and a == pc:
+                    reason = HALTED
+                    break
+                pc = op(self, a, b, pc)
+                if pc < 0:
+                    reason = RETURNED
+                    break
+        except IndexError:
+            raise ValueError(f'Stack or segment underflow at command {pc}')
+        finally:
+            self.pc = pc
+            self.steps += steps
+        return reason
+
+###############################################################################
+
+def main():
+    parser = argparse.ArgumentParser(description='VM code interpreter')
+    parser.add_argument('input_path', help='.vm file or directory of them')
+    parser.add_argument(
+        '--steps', type=int, default=None,
+        help='maximum number of VM commands to execute',
+    )
+    args = parser.parse_args()
+
+    if os.path.isdir(args.input_path):
+        target_paths = sorted(
+            os.path.join(args.input_path, f)
+            for f in os.listdir(args.input_path)
+            if os.path.splitext(f)[1] == '.vm'
+        )
+    else:
+        target_paths = [args.input_path]
+    if not target_paths:
+        raise ValueError('No .vm files in specified directory')
+
+    sources = []
+    for target_path in target_paths:
+        with open(target_path, 'r') as f:
+            filename = os.path.splitext(os.path.basename(target_path))[0]
+            sources.append((filename, f.read()))
+
+    vm = VMInterpreter(sources)
+    start = time.perf_counter()
+    reason = vm.run(args.steps)
+    elapsed = time.perf_counter() - start
+
+    speed = vm.steps / elapsed / 1e6 if elapsed else 0
+    print(f'Stopped ({reason}) after {vm.steps} commands')
+    print(f'Ran for {elapsed:.3f}s ({speed:.2f}M commands/s)')
+    print(f'Stack: {vm.stack[-8: ]}')
+    for (filename, index), slot in sorted(vm.static_slots.items()):
+        print(f'{filename}.{index} = {vm.statics[slot]}')
+
+if __name__ == '__main__':
+    main()
@@ -1,8 +1,25 @@
+import argparse
+import io
 import os
 import re
+import shutil
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager, nullcontext
+from functools import lru_cache, partial
 
+# The profiler is shared by all the tools, from a sibling directory.
+sys.path.insert(0, os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', 'profiling'
+))
+
+import deadcode
 import generateasm
+import optimizer
+import profiler
+from buildcache import CACHE_DIRNAME, BuildCache, source_version
+from profiler import NULL_PROFILE
 
 DEBUG = True
 
@@ -38,6 +55,17 @@ ASM_GENERATOR_MAP = {
     'C_CALL'      : generateasm.c_call,
 }
 
+# Call and return sites jump to shared routines in the bootstrap instead of
+# inlining the whole calling convention.
+SHARED_CALL_GENERATOR_MAP = {
+    **ASM_GENERATOR_MAP,
+    'C_CALL'  : generateasm.c_call_shared,
+    'C_RETURN': generateasm.c_return_shared,
+}
+
+# Maximum number of distinct rendered fragments kept by render_fragment.
+FRAGMENT_CACHE_SIZE = 4096
+
 class Command:
     def __init__(self, command, filename):
         self.filename = filename
@@ -58,31 +86,227 @@ class Command:
         except IndexError:
             raise ValueError(f'Missing argument for "{terms[0]}"')
 
-def translate(code, filename):
-    output = ''
-    for num, line in enumerate(code.split('\n'), 1):
-        if statement := re.sub(r'\s*//.*', '', line):
+    # Builds a Command from already parsed fields.
+    @classmethod
+    def from_args(cls, command_type, arg1, arg2, filename):
+        command = cls.__new__(cls)
+        command.type = command_type
+        command.arg1 = arg1
+        command.arg2 = arg2
+        command.filename = filename
+        return command
+
+# Renders the assembly template of a command, keeping the '#' placeholders of
+# its labels so that the same text can be reused at every site of the same
+# command and only the label names are instantiated per site. The filename
+# only affects the static segment, so it is passed as None everywhere else to
+# let files share fragments.
+@lru_cache(maxsize=FRAGMENT_CACHE_SIZE)
+def render_fragment(generator, command_type, arg1, arg2, filename):
+    return generator(Command.from_args(command_type, arg1, arg2, filename))
+
+COMMENT_PATTERN = re.compile(r'\s*//.*')
+
+# Yields the line number, source text and parsed Command of every statement
+# in the given VM code, which may be a string or an iterable of lines such as
+# an open file.
+def parse(code, filename):
+    if isinstance(code, str):
+        lines = code.split('\n')
+    else:
+        lines = (line.rstrip('\n') for line in code)
+    for num, line in enumerate(lines, 1):
+        if '//' in line:
+            line = COMMENT_PATTERN.sub('', line)
+        if statement := line:
             try:
-                command = Command(statement, filename)
-                asm_code = ASM_GENERATOR_MAP[command.type](command)
-                asm_code = asm_code.replace('#', f'{filename}.{num}')
-                comment = ('// ' + statement + '\n' if DEBUG else '')
-                output += comment + asm_code
+                yield num, statement, Command(statement, filename)
             except ValueError as error:
                 raise ValueError(f'Syntax error in line {num}: {error}')
-    return output
+
+# Translates VM code, given as a string or an iterable of lines, and writes
+# the assembly fragment of every command to the sink as soon as it has been
+# generated, so memory use does not grow with the size of the input.
+def translate_to(code, filename, sink, optimize = False, shared_calls = False):
+    generator_map = (
+        SHARED_CALL_GENERATOR_MAP if shared_calls else ASM_GENERATOR_MAP
+    )
+    commands = parse(code, filename)
+    if optimize:
+        fragments = optimizer.optimize(commands)
+    else:
+        fragments = (
+            (num, [statement], command, None)
+            for num, statement, command in commands
+        )
+
+    for num, statements, command, asm_code in fragments:
+        if asm_code is None:
+            try:
+                asm_code = render_fragment(
+                    generator_map[command.type], command.type,
+                    command.arg1, command.arg2,
+                    command.filename if command.arg1 == 'static' else None,
+                )
+            except ValueError as error:
+                raise ValueError(f'Syntax error in line {num}: {error}')
+        if DEBUG:
+            for statement in statements:
+                sink.write('// ' + statement + '\n')
+        if '#' in asm_code:
+            asm_code = asm_code.replace('#', f'{filename}.{num}')
+        sink.write(asm_code)
+
+def translate(code, filename, optimize = False, shared_calls = False):
+    sink = io.StringIO()
+    translate_to(code, filename, sink, optimize, shared_calls)
+    return sink.getvalue()
+
+# Reads and translates a single .vm file, leaving out the functions in dead,
+# and returns the translation and the profile. If the contents of the file
+# have already been read, they are passed as code and the file is not read
+# again. The file is streamed through the same pipeline as in main, so the
+# translate stage times reading and translating together. Used as the unit of
+# work for the process pool, so it only takes and returns picklable values.
+def translate_file(target_path, dead = frozenset(), optimize = False,
+                   shared_calls = False, profile = NULL_PROFILE, code = None):
+    filename = os.path.splitext(os.path.basename(target_path))[0]
+    sink = io.StringIO()
+    with profile:
+        with profile.stage('translate'), (
+            open(target_path, 'r') if code is None else io.StringIO(code)
+        ) as f:
+            lines = count_lines(f, profile) if profile else f
+            code = deadcode.remove_functions(lines, dead)
+            translate_to(code, filename, sink, optimize, shared_calls)
+        output = sink.getvalue()
+        if profile:
+            profile.count('instructions', count_rom_words(output))
+    return output, profile
+
+# Yields the lines of a file, and adds their number to the profile once they
+# have all been read.
+def count_lines(f, profile):
+    num = 0
+    for num, line in enumerate(f, 1):
+        yield line
+    profile.count('lines', num)
+
+# Counts the instructions (ROM words) in assembly code, given as a string or
+# an iterable of lines.
+def count_rom_words(asm_code):
+    if isinstance(asm_code, str):
+        asm_code = asm_code.split('\n')
+    return sum(
+        1 for line in asm_code
+        if (statement := COMMENT_PATTERN.sub('', line).strip())
+        and statement[0] != '('
+    )
+
+# Returns the number of call and return commands in the given VM code, and
+# the ROM words translating it with shared_calls saves over inline sequences.
+def shared_call_savings(code, filename):
+    command = Command('call Sys.init 0', '')
+    call_saving = (
+        count_rom_words(generateasm.c_call(command))
+        - count_rom_words(generateasm.c_call_shared(command))
+    )
+    return_saving = (
+        count_rom_words(generateasm.c_return(command))
+        - count_rom_words(generateasm.c_return_shared(command))
+    )
+    calls = returns = 0
+    for num, statement, command in parse(code, filename):
+        calls += command.type == 'C_CALL'
+        returns += command.type == 'C_RETURN'
+    return calls, returns, calls * call_saving + returns * return_saving
+
+# Returns the functions defined in each of the given .vm files that cannot be
+# reached by calls from Sys.init, as a list of frozensets.
+def dead_functions(target_paths, filenames):
+    graph = {}
+    defined = []
+    for target_path, filename in zip(target_paths, filenames):
+        file_graph = {}
+        with open(target_path, 'r') as f:
+            deadcode.add_calls(file_graph, parse(f, filename))
+        for function, callees in file_graph.items():
+            graph.setdefault(function, set()).update(callees)
+        defined.append(file_graph.keys() - {None})
+    live = deadcode.live_functions(graph)
+    return [frozenset(functions - live) for functions in defined]
+
+# Context manager yielding a file to write the program into. It is written to
+# a temporary file next to the output and only moved into place once complete,
+# so that an error in any of the input files leaves the previous output as it
+# was instead of a truncated program.
+@contextmanager
+def output_file(output_path):
+    temp_path = f'{output_path}.{os.getpid()}.tmp'
+    try:
+        with open(temp_path, 'w') as f:
+            yield f
+        os.replace(temp_path, output_path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+# Returns the number of VM commands in the given functions of the VM code, and
+# the ROM words they translate to.
+def dead_code_size(code, filename, dead, optimize = False,
+                   shared_calls = False):
+    lines = list(deadcode.filter_functions(code, dead.__contains__))
+    commands = sum(1 for command in parse(lines, filename))
+    asm_code = translate(lines, filename, optimize, shared_calls)
+    return commands, count_rom_words(asm_code)
+
+# Returns the version of the translator that cache entries are built for,
+# from the source of every module that shapes a translation.
+def cache_version():
+    return source_version(
+        deadcode, generateasm, optimizer, sys.modules[__name__]
+    )
 
 def main():
-    # Get the target directory from the command line args.
-    input_directory = sys.argv[1]
+    # Get the target directory and options from the command line args.
+    parser = argparse.ArgumentParser(description='VM to Hack translator')
+    parser.add_argument('input_directory')
+    parser.add_argument(
+        '-O', dest='optimize', action='store_true',
+        help='fuse common pairs of VM commands into shorter Hack sequences',
+    )
+    parser.add_argument(
+        '--shared-calls', action='store_true',
+        help='emit call/return once in the bootstrap and jump to it',
+    )
+    parser.add_argument(
+        '--prune', action='store_true',
+        help='leave out the functions that are never called from Sys.init',
+    )
+    parser.add_argument(
+        '--cache', action='store_true',
+        help='reuse the cached translations of unchanged files',
+    )
+    parser.add_argument(
+        '--cache-dir', metavar='DIR',
+        help=f'cache location (default: {CACHE_DIRNAME} in the input dir)',
+    )
+    parser.add_argument(
+        '-j', '--jobs', type=int, default=1,
+        help='number of worker processes to translate files in parallel',
+    )
+    profiler.add_arguments(parser)
+    args = parser.parse_args()
+    input_directory = args.input_directory
 
     # Get a list of all VM code files in the supplied directory.
     print(f'Looking for .vm files in {input_directory}')
-    target_paths = [
+    # The list is sorted so that the output is the same on every run.
+    target_paths = sorted(
         os.path.join(input_directory, f)
         for f in os.listdir(input_directory)
         if os.path.splitext(f)[1] == '.vm'
-    ]
+    )
 
     # If there are no .vm files, raise an error
     if not target_paths:
@@ -90,26 +314,150 @@ def main():
     else:
         print(f'Compiling {len(target_paths)} files in {input_directory}')
 
-    # Iterate through each target file and compile it separately.
-    compiled_code = []
-    for target_path in target_paths:
-        print(f'Translating {target_path}')
-        with open(target_path, 'r') as f:
-            target_contents = f.read()
-        
-        # Perform the translation, extracting the filename before calling
-        filename = os.path.splitext(os.path.basename(target_path))[0]
-        output = translate(target_contents, filename)
-
-        compiled_code.append(output)
-
-    # Write the translated instructions to a .asm file
+    filenames = [
+        os.path.splitext(os.path.basename(target_path))[0]
+        for target_path in target_paths
+    ]
+    flags = (
+        ('O', args.optimize), ('S', args.shared_calls), ('P', args.prune),
+    )
     output_filename = os.path.basename(input_directory) + '.asm'
     output_path = os.path.join(input_directory, output_filename)
-    with open(output_path, 'w') as f:
-        f.write(generateasm.bootstrap() + ''.join(compiled_code))
+    run_profiler = profiler.Profiler.from_args('vmtranslator', args)
+    profiles = [run_profiler.file(target_path) for target_path in target_paths]
+    start = time.perf_counter()
+
+    # Pruning works on the whole program, so the call graph of all the files
+    # is built before any of them is translated.
+    if args.prune:
+        with run_profiler.stage('prune'):
+            dead = dead_functions(target_paths, filenames)
+    else:
+        dead = [frozenset()] * len(target_paths)
+
+    # With a build cache, find every file whose contents and translation flags
+    # are unchanged since its entry was stored. Only the rest are translated.
+    # When pruning, what is left of a file also depends on the other files,
+    # so the key covers the functions removed from it. Each file is read once,
+    # and the stale ones are translated from the same contents their keys were
+    # computed from.
+    cached = [False] * len(target_paths)
+    sources = [None] * len(target_paths)
+    if args.cache:
+        cache = BuildCache(
+            args.cache_dir or os.path.join(input_directory, CACHE_DIRNAME),
+            cache_version(),
+        )
+        with run_profiler.stage('cache lookup'):
+            keys = []
+            for i, target_path in enumerate(target_paths):
+                with open(target_path, 'r') as f:
+                    sources[i] = f.read()
+                keys.append(cache.key(
+                    filenames[i], sources[i],
+                    flags + (('P', sorted(dead[i])),),
+                ))
+                if (entry := cache.open_entry(filenames[i], flags, keys[i])):
+                    entry.close()
+                    cached[i] = True
+                    sources[i] = None
+    stale = [i for i, hit in enumerate(cached) if not hit]
+
+    # Write the translated instructions to a .asm file, file by file in the
+    # order of target_paths. Without a pool, each file is translated straight
+    # into the output (or into its cache entry, which is then copied over).
+    # With a pool, the stale files are translated in worker processes and
+    # their results written out in order as they arrive. When profiling, the
+    # files are translated into strings as with a pool, so that translating
+    # and writing are timed separately.
+    options = {'optimize': args.optimize, 'shared_calls': args.shared_calls}
+    translate_one = partial(translate_file, **options)
+    pool = ProcessPoolExecutor(args.jobs) if args.jobs > 1 else nullcontext()
+    with pool as executor, output_file(output_path) as sink:
+        sink.write(generateasm.bootstrap(args.shared_calls))
+        if executor:
+            futures = [
+                executor.submit(
+                    translate_one, target_paths[i], dead[i],
+                    profile=profiles[i], code=sources[i],
+                )
+                for i in stale
+            ]
+            results = (future.result() for future in futures)
 
+        for i, target_path in enumerate(target_paths):
+            if not cached[i]:
+                if executor or run_profiler.enabled:
+                    if executor:
+                        output, profiles[i] = next(results)
+                    else:
+                        output, profiles[i] = translate_one(
+                            target_path, dead[i], profile=profiles[i],
+                            code=sources[i],
+                        )
+                    with profiles[i].stage('write'):
+                        if args.cache:
+                            cache.store(filenames[i], flags, keys[i], output)
+                        else:
+                            sink.write(output)
+                elif args.cache:
+                    with cache.writer(filenames[i], flags, keys[i]) as entry:
+                        code = deadcode.remove_functions(sources[i], dead[i])
+                        translate_to(code, filenames[i], entry, **options)
+                else:
+                    with open(target_path, 'r') as f:
+                        code = deadcode.remove_functions(f, dead[i])
+                        translate_to(code, filenames[i], sink, **options)
+                print(f'Translated {target_path}')
+            if args.cache:
+                with profiles[i].stage('cache copy'), cache.open_entry(
+                    filenames[i], flags, keys[i]
+                ) as entry:
+                    shutil.copyfileobj(entry, sink)
+            run_profiler.add(profiles[i])
+
+    elapsed = time.perf_counter() - start
+    print(f'Translated {len(stale)} of {len(target_paths)} files in '
+          f'{elapsed:.3f}s using {args.jobs} job(s)')
     print(f'Wrote translated program to {output_path}')
 
+    # Report how much code pruning removed from each file.
+    if args.prune:
+        total = 0
+        for filename, target_path, removed in zip(
+            filenames, target_paths, dead
+        ):
+            with open(target_path, 'r') as f:
+                commands, words = dead_code_size(
+                    f, filename, removed, **options
+                )
+            total += words
+            print(f'{target_path}: removed {len(removed)} functions, '
+                  f'{commands} VM commands, {words} ROM words')
+        print(f'Pruning removed {total} ROM words in total')
+
+    # Report how much ROM the shared call/return routines saved.
+    if args.shared_calls:
+        saved = -count_rom_words(
+            generateasm.call_trampoline() + generateasm.return_trampoline()
+        )
+        for filename, target_path, removed in zip(
+            filenames, target_paths, dead
+        ):
+            with open(target_path, 'r') as f:
+                code = deadcode.remove_functions(f, removed)
+                calls, returns, file_saved = shared_call_savings(
+                    code, filename
+                )
+            saved += file_saved
+            print(f'{target_path}: {calls} calls, {returns} returns, '
+                  f'{file_saved} ROM words saved')
+        with open(output_path, 'r') as f:
+            words = count_rom_words(f)
+        print(f'Program is {words} ROM words, {saved} fewer than with inline '
+              f'calls ({words + saved})')
+
+    run_profiler.report()
+
 if __name__ == '__main__':
     main()